@@ -149,8 +149,7 @@ def find_latest_prefoundation(outdir: Path, domain: str, source_id: Optional[str
         pattern = f"ancillary_prefoundation_{source_id}_{domain_safe}_*.json"
     else:
         pattern = f"ancillary_prefoundation_*_{domain_safe}_*.json"
-    matches = sorted(outdir.glob(pattern), reverse=True)
-    return matches[0] if matches else None
+    return max(outdir.glob(pattern), default=None)
 
 
 def run_ancillary_prefoundation(
@@ -191,13 +190,11 @@ def run_ancillary_prefoundation(
 
         # Find rationalized file for this specific source_id
         pattern = f"rationalized_{source_id}_{domain_safe}*.json"
-        matches = sorted(rationalized_dir.glob(pattern), reverse=True)
+        ancillary_file = max(rationalized_dir.glob(pattern), default=None)
 
-        if not matches:
+        if ancillary_file is None:
             print(f"      No rationalized file found for {source_id}. Skipping.")
             continue
-
-        ancillary_file = matches[0]
         print(f"      Source: {ancillary_file.name}")
 
         with open(ancillary_file, "r", encoding="utf-8") as f:
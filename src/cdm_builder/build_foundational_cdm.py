@@ -340,8 +340,7 @@ Return ONLY the JSON. No explanation, no markdown code blocks."""
 def find_latest_rationalized(outdir: Path, prefix: str) -> Optional[Path]:
     """Find the latest rationalized file matching prefix."""
     pattern = f"{prefix}*.json"
-    matches = sorted(outdir.glob(pattern), reverse=True)
-    return matches[0] if matches else None
+    return max(outdir.glob(pattern), default=None)
 
 
 def load_rationalized_file(file_path: Optional[Path]) -> Optional[Dict]:
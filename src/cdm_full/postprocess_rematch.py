@@ -179,8 +179,7 @@ def _find_gaps_file(outdir: Path, domain: str) -> Optional[Path]:
     full_cdm_dir = outdir / "full_cdm"
     if not full_cdm_dir.exists():
         return None
-    matches = sorted(full_cdm_dir.glob(f"gaps_{domain_safe}_*.json"), reverse=True)
-    return matches[0] if matches else None
+    return max(full_cdm_dir.glob(f"gaps_{domain_safe}_*.json"), default=None)
 
 
 def _find_full_cdm(outdir: Path, domain: str) -> Optional[Path]:
@@ -189,8 +188,7 @@ def _find_full_cdm(outdir: Path, domain: str) -> Optional[Path]:
     full_cdm_dir = outdir / "full_cdm"
     if not full_cdm_dir.exists():
         return None
-    matches = sorted(full_cdm_dir.glob(f"cdm_{domain_safe}_full_*.json"), reverse=True)
-    return matches[0] if matches else None
+    return max(full_cdm_dir.glob(f"cdm_{domain_safe}_full_*.json"), default=None)
 
 
 # ---------------------------------------------------------------------------
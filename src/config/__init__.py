@@ -38,6 +38,7 @@ from .config_utils import (
 from .config_parser import load_config, AppConfig, CDMConfig
 
 # Re-export generators for direct use
+from .config_gen_core import set_assume_defaults
 from .config_generator import ConfigGenerator
 from .config_gen_fhir import FHIRConfigGenerator
 from .config_gen_ncpdp import NCPDPConfigGenerator
@@ -58,6 +59,7 @@ __all__ = [
     'AppConfig',
     'CDMConfig',
     # Generators
+    'set_assume_defaults',
     'ConfigGenerator',
     'FHIRConfigGenerator',
     'NCPDPConfigGenerator',
@@ -32,7 +32,7 @@ from pathlib import Path
 from typing import Dict, List, Optional
 
 from . import config_utils
-from .config_gen_core import ConfigGeneratorBase, prompt_user_choice
+from .config_gen_core import ConfigGeneratorBase, prompt_input, prompt_user_choice
 
 
 # Supported file type choices
@@ -76,15 +76,11 @@ def _prompt_choice(label: str, choices: List[tuple], default_idx: int = 0) -> st
         print(f"        {i + 1}. {desc}{marker}")
 
     while True:
-        response = input(f"      Select [1-{len(choices)}] (default {default_idx + 1}): ").strip()
+        response = prompt_input(f"      Select [1-{len(choices)}] (default {default_idx + 1}): ").strip()
         if not response:
             return choices[default_idx][0]
-        try:
-            idx = int(response) - 1
-            if 0 <= idx < len(choices):
-                return choices[idx][0]
-        except ValueError:
-            pass
+        if response.isdecimal() and 1 <= int(response) <= len(choices):
+            return choices[int(response) - 1][0]
         print(f"      Invalid selection. Enter 1-{len(choices)}.")
 
 
@@ -200,7 +196,7 @@ class AncillaryConfigGenerator(ConfigGeneratorBase):
 
             # Generate and confirm source_id
             default_id = _generate_source_id(filename)
-            source_id_input = input(f"      Source ID [{default_id}]: ").strip()
+            source_id_input = prompt_input(f"      Source ID [{default_id}]: ").strip()
             source_id = source_id_input if source_id_input else default_id
             # Enforce no underscores
             source_id = source_id.replace("_", "-")
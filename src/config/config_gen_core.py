@@ -5,17 +5,48 @@ Provides:
 - ConfigGeneratorBase: Base class with shared functionality
 - Configuration validation and loading
 """
+import copy
 import json
-from datetime import datetime
+import os
+import threading
+import time
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 from . import config_utils
 
 
+class _StreamProgress:
+    """Print a dot every few KB of streamed LLM output."""
+    
+    __slots__ = ('received', 'dots')
+    
+    STEP = 2048
+    
+    def __init__(self):
+        self.received = 0
+        self.dots = 0
+    
+    def __call__(self, chunk: str) -> None:
+        self.received += len(chunk)
+        due = self.received // self.STEP
+        if due > self.dots:
+            print('.' * (due - self.dots), end='', flush=True)
+            self.dots = due
+    
+    def close(self) -> None:
+        if self.dots:
+            print()
+
+
 class ConfigGeneratorBase:
     """Base class for config generation modules."""
     
+    # Subclasses that declare their own __slots__ stay __dict__-free;
+    # the rest still get a per-instance __dict__ as before.
+    __slots__ = ('cdm_name', 'llm_client', 'project_root', 'input_dir',
+                 'cdm_dir', 'config_dir', '_safe_name')
+    
     def __init__(self, cdm_name: str, llm_client=None):
         """Initialize config generator.
         
@@ -24,15 +55,25 @@ class ConfigGeneratorBase:
             llm_client: Optional LLM client for AI analysis
         """
         self.cdm_name = cdm_name
-        self.safe_name = config_utils.safe_cdm_name(cdm_name)
         self.llm_client = llm_client
         
         # Standard paths
         self.project_root = config_utils.get_project_root()
         self.input_dir = config_utils.get_input_dir()
         self.cdm_dir = config_utils.get_cdm_dir(cdm_name)
-        self.config_dir = config_utils.get_config_dir(cdm_name)
-        
+        self.config_dir = self.cdm_dir / "config"  # == get_config_dir(cdm_name)
+        self._safe_name = None
+    
+    @property
+    def safe_name(self) -> str:
+        """Safe directory/file form of cdm_name (computed once)."""
+        if self._safe_name is None:
+            self._safe_name = config_utils.safe_cdm_name(self.cdm_name)
+        return self._safe_name
+    
+    # Both loaders share the (path, mtime)-keyed parse cache with
+    # ConfigGenerator._load_source_config; callers get a private copy.
+    
     def load_base_config(self) -> Optional[Dict]:
         """Load base config template.
         
@@ -41,7 +82,7 @@ class ConfigGeneratorBase:
         """
         base_config = config_utils.find_base_config(self.cdm_name)
         if base_config:
-            return config_utils.load_json_file(base_config)
+            return copy.deepcopy(config_utils.load_json_file_cached(base_config))
         return None
     
     def load_latest_config(self) -> Optional[Dict]:
@@ -52,7 +93,7 @@ class ConfigGeneratorBase:
         """
         latest = config_utils.find_latest_config(self.cdm_name)
         if latest:
-            return config_utils.load_json_file(latest)
+            return copy.deepcopy(config_utils.load_json_file_cached(latest))
         return None
     
     def validate_base_config(self, config: Dict) -> List[str]:
@@ -73,19 +114,21 @@ class ConfigGeneratorBase:
                 errors.append(f"Missing required section: {section}")
         
         if 'cdm' in config:
+            cdm = config['cdm']
+            
             # Required CDM fields
             cdm_required = ['domain', 'type', 'description']
             for field in cdm_required:
-                if not config['cdm'].get(field):
+                if not cdm.get(field):
                     errors.append(f"Missing CDM field: {field}")
             
             # Validate type
-            cdm_type = config['cdm'].get('type', '').lower()
+            cdm_type = cdm.get('type', '').lower()
             if cdm_type and cdm_type not in ['core', 'functional']:
                 errors.append(f"Invalid CDM type: {cdm_type} (must be 'core' or 'functional')")
             
             # Functional CDMs need core_dependency
-            if cdm_type == 'functional' and not config['cdm'].get('core_dependency'):
+            if cdm_type == 'functional' and not cdm.get('core_dependency'):
                 errors.append("Functional CDMs must specify core_dependency")
         
         return errors
@@ -99,7 +142,7 @@ class ConfigGeneratorBase:
         Returns:
             Filename like config_plan_20251211_143022.json
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         return f"{prefix}_{self.safe_name}_{timestamp}.json"
     
     def save_config(self, config: Dict, filename: Optional[str] = None) -> Path:
@@ -123,7 +166,8 @@ class ConfigGeneratorBase:
     def parse_ai_json_response(self, response_text: str) -> Dict:
         """Parse AI response text as JSON.
         
-        Handles common issues like markdown code blocks.
+        Bare JSON is parsed directly; markdown code blocks are stripped
+        only when that fails.
         
         Args:
             response_text: Raw AI response text
@@ -134,6 +178,13 @@ class ConfigGeneratorBase:
         Raises:
             json.JSONDecodeError: If parsing fails
         """
+        # Usually bare JSON (LLMClient requests JSON mode where supported)
+        try:
+            return config_utils.loads_json(response_text)
+        except json.JSONDecodeError:
+            pass
+        
+        # Fallback for endpoints that ignore JSON mode
         text = response_text.strip()
         
         # Remove markdown code blocks if present
@@ -146,13 +197,20 @@ class ConfigGeneratorBase:
                     text = text[4:]
                 text = text.strip()
         
-        return json.loads(text)
+        return config_utils.loads_json(text)
     
-    def call_llm(self, prompt: str) -> str:
+    def call_llm(self, prompt: str, system_prompt: Optional[str] = None) -> str:
         """Call LLM with prompt and return response text.
         
+        JSON mode is left to LLMClient, which only requests it from
+        endpoints known to support it. Streaming progress dots are only
+        printed on the main thread, so concurrent calls from a worker pool
+        don't interleave them with other console output.
+        
         Args:
             prompt: Prompt text
+            system_prompt: Optional static instructions sent as the system
+                message (identical across runs, so providers can cache it)
             
         Returns:
             Response text
@@ -164,7 +222,24 @@ class ConfigGeneratorBase:
             raise ValueError("No LLM client configured")
         
         messages = [{"role": "user", "content": prompt}]
-        response_text, _ = self.llm_client.chat(messages)
+        if system_prompt:
+            messages.insert(0, {"role": "system", "content": system_prompt})
+        
+        # Stream when the client supports it so long generations show progress
+        chat_stream = getattr(self.llm_client, "chat_stream", None)
+        if chat_stream is None:
+            response_text, _ = self.llm_client.chat(messages)
+            return response_text
+        
+        if threading.current_thread() is not threading.main_thread():
+            response_text, _ = chat_stream(messages)
+            return response_text
+        
+        progress = _StreamProgress()
+        try:
+            response_text, _ = chat_stream(messages, on_chunk=progress)
+        finally:
+            progress.close()
         return response_text
 
 
@@ -194,6 +269,37 @@ def merge_config_sections(base: Dict, updates: Dict, sections: List[str]) -> Dic
     return result
 
 
+# Non-interactive mode: every prompt takes its default answer. Enabled by
+# the CLI (--yes) or CDM_NON_INTERACTIVE=1 for unattended batch runs.
+_assume_defaults = os.getenv("CDM_NON_INTERACTIVE", "0") == "1"
+
+
+def set_assume_defaults(enabled: bool) -> None:
+    """Turn non-interactive (accept every default) mode on or off."""
+    global _assume_defaults
+    _assume_defaults = enabled
+
+
+def is_interactive() -> bool:
+    """True unless non-interactive mode is enabled."""
+    return not _assume_defaults
+
+
+def prompt_input(message: str) -> str:
+    """input() that returns '' (take the default) in non-interactive mode.
+    
+    Args:
+        message: Prompt message
+        
+    Returns:
+        User response, or '' when running non-interactively
+    """
+    if _assume_defaults:
+        print(f"{message}(default)")
+        return ""
+    return input(message)
+
+
 def prompt_user_choice(message: str, default: str = "Y") -> bool:
     """Prompt user for Y/N choice.
     
@@ -207,7 +313,7 @@ def prompt_user_choice(message: str, default: str = "Y") -> bool:
     default_upper = default.upper()
     hint = "[Y/n]" if default_upper == "Y" else "[y/N]"
     
-    response = input(f"{message} {hint}: ").strip().upper()
+    response = prompt_input(f"{message} {hint}: ").strip().upper()
     
     if not response:
         return default_upper == "Y"
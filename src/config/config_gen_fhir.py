@@ -8,17 +8,266 @@ Handles:
 
 Work Item 4: Added canonical_url capture for VS/CS entries (used in post-process terminology enrichment)
 """
+import difflib
+import functools
 import json
+import os
+import re
+from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    from rapidfuzz import fuzz as _rf_fuzz, process as _rf_process
+except ImportError:  # optional: difflib fallback below
+    _rf_fuzz = _rf_process = None
 
 from . import config_utils
 from .config_gen_core import ConfigGeneratorBase
 
 
+# Minimum similarity (0-100) for a local fuzzy filename correction, scored
+# on the resource stem only (type and IG prefix stripped, see
+# _split_resource_name); difflib takes the same cutoff as a ratio
+_FUZZY_CUTOFF = 92
+_FUZZY_CUTOFF_RATIO = _FUZZY_CUTOFF / 100
+
+# Correction prompt: a type bucket larger than this is narrowed to files
+# from the same IG plus the closest names per missing file
+_MAX_BUCKET_IN_PROMPT = 300
+_CLOSEST_PER_MISSING = 25
+
+# Exclusion statements in a CDM description: the cue phrase through the
+# end of its clause. One compiled alternation scans the text in a single pass.
+_EXCLUSION_RE = re.compile(
+    r"\b(?:(?:explicitly\s+)?exclud(?:es|ing)|does\s+not\s+include|out\s+of\s+scope)\b[^.;\n]*",
+    re.IGNORECASE,
+)
+
+
+def _normalize_filename(filename: str) -> str:
+    """Case/hyphen-insensitive key for filename comparison."""
+    return filename.lower().replace('-', '').replace('_', '')
+
+
+def _rule_based_filename_candidates(filename: str) -> List[str]:
+    """Deterministic rewrites for common Pass 1 filename mismatches.
+    
+    Covers lowercase type prefixes, hyphens dropped from the stem, a
+    missing "ex-" example prefix, and combinations of those.
+    
+    Args:
+        filename: Missing filename (e.g. "StructureDefinition-usdf-Plan.json")
+        
+    Returns:
+        Candidate filenames, most literal first
+    """
+    prefix, sep, rest = filename.partition('-')
+    if not sep:
+        return [filename, filename.lower()]
+    stems = [rest, rest.replace('-', '')]
+    if not rest.lower().startswith('ex-'):
+        stems += [f"ex-{stem}" for stem in stems]
+    candidates = []
+    for stem in stems:
+        for candidate in (f"{prefix}-{stem}", f"{prefix.lower()}-{stem}", f"{prefix}-{stem}".lower()):
+            if candidate not in candidates:
+                candidates.append(candidate)
+    return candidates
+
+
+def _split_resource_name(filename: str) -> Optional[Tuple[str, str]]:
+    """Split "Type-ig-Stem.json" into ("type-ig", normalized stem).
+    
+    Returns None when the name has no IG segment, so it is never fuzzy
+    matched. Scoring the stem alone keeps the shared type/IG prefix from
+    inflating the similarity of unrelated resources.
+    """
+    base = filename[:-5] if filename.lower().endswith('.json') else filename
+    parts = base.split('-', 2)
+    if len(parts) < 3 or not parts[2]:
+        return None
+    return f"{parts[0]}-{parts[1]}".lower(), _normalize_filename(parts[2])
+
+
+@functools.lru_cache(maxsize=4)
+def _read_file_list(path_str: str, mtime_ns: int) -> Tuple[str, ...]:
+    """Read fhir_file_list.txt once per (path, mtime) for the process."""
+    with open(path_str, 'r', encoding='utf-8') as f:
+        return tuple(name for name in (line.strip() for line in f) if name)
+
+
+def _best_fuzzy_match(key: str, choices: List[str]) -> Optional[str]:
+    """Closest choice to key scoring at least _FUZZY_CUTOFF, or None.
+    
+    Plain ratio is used with rapidfuzz (not WRatio) so a stem that merely
+    contains the key, or vice versa, is not accepted as a match.
+    """
+    if not choices:
+        return None
+    if _rf_process is not None:
+        hit = _rf_process.extractOne(key, choices, scorer=_rf_fuzz.ratio,
+                                     score_cutoff=_FUZZY_CUTOFF)
+        return hit[0] if hit else None
+    hits = difflib.get_close_matches(key, choices, n=1, cutoff=_FUZZY_CUTOFF_RATIO)
+    return hits[0] if hits else None
+
+
+def _closest_names(name: str, choices: List[str], limit: int) -> List[str]:
+    """Up to limit choices most similar to name (case-insensitive), best first."""
+    lowered = {c.lower(): c for c in choices}
+    if _rf_process is not None:
+        hits = [h[0] for h in _rf_process.extract(name.lower(), list(lowered),
+                                                   scorer=_rf_fuzz.WRatio, limit=limit)]
+    else:
+        hits = difflib.get_close_matches(name.lower(), list(lowered), n=limit, cutoff=0.0)
+    return [lowered[h] for h in hits]
+
+
+def _extract_exclusions(description: str) -> List[str]:
+    """Exclusion statements found in a CDM description, in order of appearance."""
+    return [m.group(0).strip().rstrip(',') for m in _EXCLUSION_RE.finditer(description or "")]
+
+
+# Static Pass 1 selection instructions, sent as the system message
+_FHIR_SYSTEM_PROMPT = """You are a FHIR IG expert selecting the FHIR resource files that support building out a CDM for a given domain.
+
+# Task
+Based on your knowledge of FHIR as well as industry understanding of Pharmacy Benefit Management, Specialty Drug, and Care Management, select the FHIR resources that will support the creation of Entities and Attributes for the CDM. Return the EXACT resource filenames of highest value for building this CDM.
+
+# Rules
+
+1. **Resources INCLUDED in the CDM Only**
+   a. The selected files are used downstream to define the CDM entities and attributes.
+   b. Return ONLY resources that represent entities and attributes IN this CDM; do NOT include StructureDefinitions whose primary entity is modeled in a DIFFERENT CDM.
+   c. Include the ValueSets and CodeSystems needed for selected StructureDefinitions.
+
+2. **IG Priority**: when multiple IGs define the same resource, choose based on CDM domain context and assign priority (1=primary, 2=alternate).
+
+3. **File Types**: StructureDefinition-*.json (entity/attribute model, REQUIRED), CodeSystem-*.json, ValueSet-*.json, CapabilityStatement-*.json (IG context, optional).
+
+4. **Supporting Terminology**: for selected StructureDefinitions, include ValueSets and CodeSystems for key coded elements (type, category, status, level, class, funding model).
+
+5. **Exact Filenames**
+   a. Return filenames EXACTLY as they appear in the AVAILABLE FHIR FILES list; do NOT invent or guess filenames.
+   b. If an identified resource has NO match in the list, include it with filename prefix "NOMATCH:" (e.g., "NOMATCH:StructureDefinition-expected-name.json") and list up to 3 closest AVAILABLE filenames for the same concept in "candidate_filenames" (most likely first; [] if none) - these will be resolved in a correction step.
+
+6. **Respect CDM Exclusions**
+   a. Parse "Excludes" or "Explicitly excludes" statements in the CDM description carefully; statements detected in advance are listed under "Exclusions Identified".
+   b. Do NOT include resources whose primary purpose matches an excluded domain, e.g.:
+      - excludes "member eligibility" → no Coverage, Patient, or enrollment resources
+      - excludes "formulary definitions" → no Formulary, FormularyItem, FormularyDrug
+      - excludes "prior authorization/UM rules" → no PA, StepTherapy, QuantityLimit extensions
+      - excludes "plan hierarchy/identity" → no plan-level InsurancePlan profiles
+   c. When uncertain whether a resource belongs to an excluded domain, EXCLUDE it.
+
+7. **Canonical URL (REQUIRED for ValueSet and CodeSystem entries)**
+   a. The FHIR canonical URL (e.g., "http://hl7.org/fhir/us/davinci-drug-formulary/ValueSet/DrugTierVS"), used downstream to link terminology to attribute bindings.
+   b. If you don't know the exact URL, use the pattern: http://hl7.org/fhir/<ig-path>/<ResourceType>/<resource-name>
+
+# Output Format
+
+Respond with ONLY valid JSON (no markdown or code blocks):
+
+{
+  "fhir_igs": [
+    {
+      "filename": "StructureDefinition-usdf-FormularyItem.json",
+      "resource_name": "usdf-FormularyItem",
+      "file_type": "StructureDefinition",
+      "ig_source": "US Drug Formulary",
+      "priority": 1,
+      "reasoning": "Primary formulary item resource."
+    },
+    {
+      "filename": "ValueSet-usdf-DrugTierVS.json",
+      "resource_name": "DrugTierVS",
+      "file_type": "ValueSet",
+      "ig_source": "US Drug Formulary",
+      "priority": 1,
+      "canonical_url": "http://hl7.org/fhir/us/davinci-drug-formulary/ValueSet/DrugTierVS",
+      "reasoning": "Drug tier value set for formulary tiering."
+    },
+    {
+      "filename": "NOMATCH:StructureDefinition-usdf-CoveragePlan.json",
+      "resource_name": "usdf-CoveragePlan",
+      "file_type": "StructureDefinition",
+      "ig_source": "US Drug Formulary",
+      "priority": 1,
+      "candidate_filenames": ["StructureDefinition-usdf-PayerInsurancePlan.json"],
+      "reasoning": "Coverage plan structure - not found in list, needs correction."
+    }
+  ],
+  "domain_assessment": {
+    "primary_igs": ["[IG 1]", "[IG 2]"],
+    "expected_entity_count": 5,
+    "confidence": "high | medium | low",
+    "notes": "Brief assessment of IG fit for this domain."
+  }
+}"""
+
+
+# Pass 1 prompt (user message), filled with str.format_map
+_FHIR_PROMPT_TEMPLATE = """# CDM Metadata
+- **Domain**: {domain}
+- **Type**: {type}
+{core_dependency}
+- **Description**: {description}
+{exclusions}
+# AVAILABLE FHIR FILES
+(Alphabetically sorted - scan to CodeSystem-*, StructureDefinition-*, or ValueSet-* section)
+
+{available_files}
+
+Respond with JSON only:"""
+
+
+# Static filename-correction instructions, sent as the system message
+_CORRECTION_SYSTEM_PROMPT = """You are a FHIR expert. Match the missing filenames to the correct actual filenames.
+
+# MATCHING INSTRUCTIONS
+
+1. **SEMANTIC MATCHING** - The missing filename represents a FHIR concept. Find the file that represents the SAME concept, even if named differently.
+   
+   Examples:
+   - "usdf-CoveragePlan" might match "usdf-PayerInsurancePlan" or "insurance-plan-coverage"
+   - "usdf-FormularyItemExtension" might match "usdf-AdditionalCoverageInformation-extension"
+
+2. **IG PREFIX MATCHING** - Try matching within the same IG first:
+   - usdf- (US Drug Formulary)
+   - carin-bb- or C4BB- (CARIN Blue Button)
+   - davinci- or hrex- (Da Vinci)
+   - us-core- (US Core)
+   - qicore- (QI Core)
+   
+   If no match in same IG, try base FHIR or other IGs.
+
+3. **CASE AND HYPHEN VARIATIONS**:
+   - CoveragePlan → coverage-plan or coverageplan
+   - FormularyItem → formulary-item or formularyitem
+   - Prefix case: StructureDefinition- vs structuredefinition-
+
+4. **PASS 1 HINTS** - Some missing files list "hints": files an earlier pass thought were closest. Treat them as suggestions only; use one ONLY if it represents the SAME concept.
+
+5. **NO MATCH** - If the concept truly doesn't exist in available files, return "NO_MATCH"
+
+# OUTPUT FORMAT
+
+Return a JSON object mapping each missing filename to its corrected filename OR "NO_MATCH":
+
+{
+  "StructureDefinition-usdf-CoveragePlan.json": "StructureDefinition-usdf-PayerInsurancePlan.json",
+  "ValueSet-usdf-SomethingNotReal.json": "NO_MATCH"
+}
+
+**CRITICAL**: Every corrected filename MUST be from the AVAILABLE FILES list in the user message."""
+
+
 class FHIRConfigGenerator(ConfigGeneratorBase):
     """FHIR resource analysis and selection for CDM configuration."""
     
+    SYSTEM_PROMPT = _FHIR_SYSTEM_PROMPT
+    
     def __init__(self, cdm_name: str, llm_client=None):
         """Initialize FHIR config generator.
         
@@ -29,6 +278,11 @@ class FHIRConfigGenerator(ConfigGeneratorBase):
         super().__init__(cdm_name, llm_client)
         self.fhir_dir = config_utils.get_standards_fhir_dir()
         self._file_list_cache = None
+        self._file_list_text = ""
+        self._file_set = frozenset()
+        self._file_key_map = {}
+        self._stem_index = {}
+        self._fs_index = None
     
     def run_analysis(self, config: Dict, dry_run: bool = False) -> Dict:
         """Run FHIR analysis (Pass 1 only, correction happens in validate step).
@@ -59,23 +313,18 @@ class FHIRConfigGenerator(ConfigGeneratorBase):
         """
         print("\n   === Pass 1: Primary Resource Selection ===")
         
-        prompt = self._build_pass1_prompt(config)
+        prompt = self.build_prompt(config)
         
         if dry_run:
             return {
                 'fhir_igs': [],
                 'domain_assessment': {},
-                '_prompt': prompt
+                '_prompt': f"{self.SYSTEM_PROMPT}\n\n{prompt}"
             }
         
         try:
-            response_text = self.call_llm(prompt)
-            result = self.parse_ai_json_response(response_text)
-            
-            count = len(result.get('fhir_igs', []))
-            print(f"   ✓ Pass 1 selected {count} resources")
-            
-            return result
+            response_text = self.call_llm(prompt, system_prompt=self.SYSTEM_PROMPT)
+            return self.parse_result(self.parse_ai_json_response(response_text))
             
         except json.JSONDecodeError as e:
             print(f"   ❌ Error parsing Pass 1 response: {e}")
@@ -84,18 +333,72 @@ class FHIRConfigGenerator(ConfigGeneratorBase):
             print(f"   ❌ Error in Pass 1: {e}")
             raise
     
-    def validate_and_correct_files(self, fhir_resources: Dict) -> Tuple[Dict, List[str]]:
+    def get_file_index(self) -> Tuple[Dict[str, Path], set]:
+        """Index the FHIR/IG directory tree by filename (walked once).
+        
+        Returns:
+            Tuple of (filename -> path, filenames found more than once)
+        """
+        if self._fs_index is None:
+            duplicates = set()
+            self._fs_index = (config_utils.build_file_index(self.fhir_dir, duplicates), duplicates)
+        return self._fs_index
+    
+    def build_prompt(self, config: Dict) -> str:
+        """Build the Pass 1 prompt (user message; see SYSTEM_PROMPT).
+        
+        Args:
+            config: Config with CDM metadata
+            
+        Returns:
+            Prompt text
+        """
+        return self._build_pass1_prompt(config)
+    
+    def parse_result(self, result: Dict) -> Dict:
+        """Report a parsed Pass 1 response.
+        
+        Args:
+            result: Parsed JSON from the Pass 1 prompt
+            
+        Returns:
+            Dict with fhir_igs and domain_assessment
+        """
+        count = len(result.get('fhir_igs', []))
+        print(f"   ✓ Pass 1 selected {count} resources")
+        return result
+    
+    def validate_and_correct_files(self, fhir_resources: Dict,
+                                   missing: Optional[Iterable[str]] = None) -> Tuple[Dict, List[str]]:
         """Validate FHIR files exist and attempt to correct missing filenames.
         
         Args:
             fhir_resources: Dict with fhir_igs list
+            missing: Filenames already known to be unresolved. When given,
+                every other entry is taken as found; otherwise names are
+                checked against the fhir_file_list.txt set.
             
         Returns:
             Tuple of (corrected resources, list of corrections made)
         """
-        # Validate all files and categorize
+        missing_names = set(missing) if missing is not None else None
+        known = frozenset()
+        if missing_names is None:
+            # Without a resolved list, check the fhir_file_list.txt inventory
+            # (no filesystem access); walk the tree only if it is unavailable
+            known = self._file_set if self._load_file_list() else self.get_file_index()[0]
+        
+        def _exists(filename: str) -> bool:
+            if missing_names is not None:
+                return filename not in missing_names
+            return filename in known
+        
+        # Validate all files and categorize. A filename shared by several
+        # resources is queued for correction once; the correction map is
+        # applied to every resource that uses it.
         found_files = []
         missing_files = []
+        queued = set()
         
         for resource in fhir_resources.get('fhir_igs', []):
             filename = resource['filename']
@@ -105,33 +408,40 @@ class FHIRConfigGenerator(ConfigGeneratorBase):
                 # Strip prefix for correction attempt
                 actual_filename = filename[8:]  # len('NOMATCH:') = 8
                 resource['filename'] = actual_filename
+                if missing_names is not None:
+                    missing_names.add(actual_filename)
+                if actual_filename in queued:
+                    continue
+                queued.add(actual_filename)
                 missing_files.append({
                     'filename': actual_filename,
                     'resource_name': resource['resource_name'],
-                    'file_type': resource['file_type']
+                    'file_type': resource['file_type'],
+                    'candidates': resource.get('candidate_filenames') or []
                 })
-            elif config_utils.find_file_recursive(self.fhir_dir, filename):
+            elif _exists(filename):
                 found_files.append(resource)
-            else:
+            elif filename not in queued:
+                queued.add(filename)
                 missing_files.append({
                     'filename': filename,
                     'resource_name': resource['resource_name'],
                     'file_type': resource['file_type']
                 })
         
-        # Print summary to terminal
-        print(f"\n   📁 File Validation:")
-        print(f"      ✓ Found: {len(found_files)} files")
+        # Print summary to terminal (one write)
+        log_lines = [f"\n   📁 File Validation:", f"      ✓ Found: {len(found_files)} files"]
         if missing_files:
-            print(f"      ✗ Missing/NOMATCH: {len(missing_files)} files")
-            for mf in missing_files[:10]:  # Show first 10
-                print(f"         - {mf['filename']}")
+            log_lines.append(f"      ✗ Missing/NOMATCH: {len(missing_files)} files")
+            log_lines.extend(f"         - {mf['filename']}" for mf in missing_files[:10])  # Show first 10
             if len(missing_files) > 10:
-                print(f"         ... and {len(missing_files) - 10} more")
+                log_lines.append(f"         ... and {len(missing_files) - 10} more")
         
         if not missing_files:
-            print(f"      ✓ All files found - skipping correction step")
+            log_lines.append(f"      ✓ All files found - skipping correction step")
+            print("\n".join(log_lines))
             return fhir_resources, []
+        print("\n".join(log_lines))
         
         # Load file list with verbose output for correction context
         print(f"\n   🔍 Attempting to correct {len(missing_files)} missing filename(s)...")
@@ -155,24 +465,27 @@ class FHIRConfigGenerator(ConfigGeneratorBase):
                 corrected = corrections_map[original]
                 corrections.append(f"{original} → {corrected}")
                 resource['filename'] = corrected
-                print(f"      ✓ {original} → {corrected}")
-            elif not config_utils.find_file_recursive(self.fhir_dir, original):
+            elif not _exists(original):
                 still_missing.append(original)
+        log_lines = [f"      ✓ {c}" for c in corrections]
         
         # Report still missing
         if still_missing:
-            print(f"\n   ⚠️  Still missing (will be skipped): {len(still_missing)} files")
-            for f in still_missing[:5]:
-                print(f"         - {f}")
+            log_lines.append(f"\n   ⚠️  Still missing (will be skipped): {len(still_missing)} files")
+            log_lines.extend(f"         - {f}" for f in still_missing[:5])
             if len(still_missing) > 5:
-                print(f"         ... and {len(still_missing) - 5} more")
+                log_lines.append(f"         ... and {len(still_missing) - 5} more")
             
             # Remove still-missing files from the result
+            dropped = set(still_missing)
             fhir_resources['fhir_igs'] = [
                 r for r in fhir_resources.get('fhir_igs', [])
-                if r['filename'] not in still_missing
+                if r['filename'] not in dropped
             ]
-            print(f"   ✓ Removed {len(still_missing)} unavailable files from config")
+            log_lines.append(f"   ✓ Removed {len(still_missing)} unavailable files from config")
+        
+        if log_lines:
+            print("\n".join(log_lines))
         
         return fhir_resources, corrections
     
@@ -197,9 +510,20 @@ class FHIRConfigGenerator(ConfigGeneratorBase):
             return []
         
         try:
-            with open(file_list_path, 'r', encoding='utf-8') as f:
-                filenames = [line.strip() for line in f.readlines() if line.strip()]
+            filenames = list(_read_file_list(str(file_list_path), file_list_path.stat().st_mtime_ns))
             self._file_list_cache = filenames
+            self._file_list_text = "\n".join(filenames)
+            self._file_set = frozenset(filenames)
+            key_map = {}
+            for name in filenames:
+                key_map.setdefault(_normalize_filename(name), name)
+            self._file_key_map = key_map
+            stem_index = defaultdict(dict)
+            for name in filenames:
+                split = _split_resource_name(name)
+                if split is not None:
+                    stem_index[split[0]].setdefault(split[1], name)
+            self._stem_index = dict(stem_index)
             
             if verbose:
                 # Count by type
@@ -215,8 +539,49 @@ class FHIRConfigGenerator(ConfigGeneratorBase):
             self._file_list_cache = []
             return []
     
+    def _match_missing_locally(self, missing_files: List[Dict]) -> Dict[str, str]:
+        """Correct missing filenames without the LLM.
+        
+        Tries the rule-based rewrites from _rule_based_filename_candidates
+        (exact, then case/hyphen-insensitive), then a strict fuzzy match
+        on the resource stem against files of the same type and IG.
+        Pass 1 candidate_filenames are not accepted here; they are passed
+        to the correction prompt as hints.
+        
+        Args:
+            missing_files: List of dicts with filename, resource_name, file_type
+            
+        Returns:
+            Dict mapping original filename -> corrected filename
+        """
+        available = self._file_set
+        by_key = self._file_key_map
+        by_stem = self._stem_index
+        
+        matches = {}
+        for f in missing_files:
+            original = f['filename']
+            candidates = _rule_based_filename_candidates(original)
+            corrected = next((c for c in candidates if c in available), None)
+            if corrected is None:
+                corrected = next(
+                    (by_key[k] for k in map(_normalize_filename, candidates) if k in by_key), None
+                )
+            split = _split_resource_name(original) if corrected is None else None
+            if split is not None:
+                stems = by_stem.get(split[0], {})
+                fuzzy = _best_fuzzy_match(split[1], list(stems))
+                corrected = stems[fuzzy] if fuzzy else None
+            if corrected is not None:
+                matches[original] = corrected
+        return matches
+    
     def _correct_missing_files_batch(self, missing_files: List[Dict]) -> Dict[str, str]:
-        """Batch correct missing FHIR filenames using AI (Pass 2).
+        """Batch correct missing FHIR filenames (Pass 2).
+        
+        Deterministic local matching runs first; only names it cannot
+        resolve are sent to the AI. Set FHIR_LLM_FILENAME_CORRECTION=0 to
+        skip the AI fallback entirely.
         
         Args:
             missing_files: List of dicts with filename, resource_name, file_type
@@ -224,37 +589,59 @@ class FHIRConfigGenerator(ConfigGeneratorBase):
         Returns:
             Dict mapping original filename -> corrected filename
         """
-        if not missing_files or self.llm_client is None:
+        if not missing_files:
             return {}
         
         available_files = self._load_file_list()
         if not available_files:
             return {}
         
-        # Filter available files by type to reduce context
-        missing_by_type = {}
+        local = self._match_missing_locally(missing_files)
+        if local:
+            print(f"      ✓ Matched locally: {len(local)}")
+        missing_files = [f for f in missing_files if f['filename'] not in local]
+        if (not missing_files or self.llm_client is None
+                or os.getenv("FHIR_LLM_FILENAME_CORRECTION", "1") == "0"):
+            return local
+        
+        # Filter available files by type to reduce context; very large type
+        # buckets are narrowed per missing file to the same IG's files plus
+        # the closest names. One pass over the list fills every needed bucket.
+        wanted = {f['file_type'].lower() + '-' for f in missing_files}
+        buckets = defaultdict(list)
+        for a in available_files:
+            prefix = a[:a.find('-') + 1].lower()
+            if prefix in wanted:
+                buckets[prefix].append(a)
+        filtered_available = set()
+        for f in missing_files:
+            prefix = f['file_type'].lower() + '-'
+            bucket = buckets[prefix]
+            if len(bucket) <= _MAX_BUCKET_IN_PROMPT:
+                filtered_available.update(bucket)
+                continue
+            ig = f['filename'][len(prefix):].split('-', 1)[0].lower()
+            ig_prefix = f"{prefix}{ig}-"
+            filtered_available.update(a for a in bucket if a.lower().startswith(ig_prefix))
+            filtered_available.update(_closest_names(f['filename'], bucket, _CLOSEST_PER_MISSING))
+        
+        # Pass 1 candidate_filenames go to the prompt as hints (never
+        # auto-accepted), and are kept in the list even if filtered out above
+        hints = {}
         for f in missing_files:
-            ftype = f['file_type']
-            if ftype not in missing_by_type:
-                missing_by_type[ftype] = []
-            missing_by_type[ftype].append(f)
-        
-        # Build filtered available files list
-        filtered_available = []
-        for ftype in missing_by_type.keys():
-            prefix = ftype.lower() + '-'
-            type_files = [f for f in available_files if f.lower().startswith(prefix)]
-            filtered_available.extend(type_files)
+            valid = [c for c in f.get('candidates', ()) if c in self._file_set]
+            if valid:
+                hints[f['filename']] = valid
+                filtered_available.update(valid)
         
         # Format missing files for prompt
         missing_list = "\n".join([
             f"  - {f['filename']} (resource: {f['resource_name']}, type: {f['file_type']})"
+            + (f" hints: {', '.join(hints[f['filename']])}" if f['filename'] in hints else "")
             for f in missing_files
         ])
         
-        prompt = f"""You are a FHIR expert. Match these missing filenames to the correct actual filenames.
-
-# MISSING FILES (from Pass 1):
+        prompt = f"""# MISSING FILES (from Pass 1):
 {missing_list}
 
 # AVAILABLE FILES TO MATCH AGAINST:
@@ -262,49 +649,14 @@ class FHIRConfigGenerator(ConfigGeneratorBase):
 
 {chr(10).join(sorted(filtered_available))}
 
-# MATCHING INSTRUCTIONS
-
-1. **SEMANTIC MATCHING** - The missing filename represents a FHIR concept. Find the file that represents the SAME concept, even if named differently.
-   
-   Examples:
-   - "usdf-CoveragePlan" might match "usdf-PayerInsurancePlan" or "insurance-plan-coverage"
-   - "usdf-FormularyItemExtension" might match "usdf-AdditionalCoverageInformation-extension"
-
-2. **IG PREFIX MATCHING** - Try matching within the same IG first:
-   - usdf- (US Drug Formulary)
-   - carin-bb- or C4BB- (CARIN Blue Button)
-   - davinci- or hrex- (Da Vinci)
-   - us-core- (US Core)
-   - qicore- (QI Core)
-   
-   If no match in same IG, try base FHIR or other IGs.
-
-3. **CASE AND HYPHEN VARIATIONS**:
-   - CoveragePlan → coverage-plan or coverageplan
-   - FormularyItem → formulary-item or formularyitem
-   - Prefix case: StructureDefinition- vs structuredefinition-
-
-4. **NO MATCH** - If the concept truly doesn't exist in available files, return "NO_MATCH"
-
-# OUTPUT FORMAT
-
-Return a JSON object mapping each missing filename to its corrected filename OR "NO_MATCH":
-
-{{
-  "StructureDefinition-usdf-CoveragePlan.json": "StructureDefinition-usdf-PayerInsurancePlan.json",
-  "ValueSet-usdf-SomethingNotReal.json": "NO_MATCH"
-}}
-
-**CRITICAL**: Every corrected filename MUST be from the AVAILABLE FILES list above.
-
 Return ONLY valid JSON:"""
 
         try:
-            response_text = self.call_llm(prompt)
+            response_text = self.call_llm(prompt, system_prompt=_CORRECTION_SYSTEM_PROMPT)
             corrections = self.parse_ai_json_response(response_text)
             
             # Validate corrections exist in available files
-            available_set = set(available_files)
+            available_set = self._file_set
             validated = {}
             matched = 0
             no_match = 0
@@ -321,142 +673,38 @@ Return ONLY valid JSON:"""
             
             print(f"      ✓ Matched: {matched}, No match: {no_match}")
             
+            validated.update(local)
             return validated
             
         except Exception as e:
             print(f"   ⚠️  Filename correction error: {e}")
-            return {}
+            return local
     
     def _build_pass1_prompt(self, config: Dict) -> str:
-        """Build Pass 1 prompt for primary resource selection.
+        """Build Pass 1 prompt (user message) for primary resource selection.
         
-        Work Item 4: Added canonical_url to output format for VS/CS entries.
+        Static selection rules live in _FHIR_SYSTEM_PROMPT.
         """
         cdm = config['cdm']
-        
-        # Load available file list
-        available_files = self._load_file_list()
-        
-        return f"""You are a FHIR IG expert analyzing the appropriate FHIR IGs to support building out a CDM for the select domain.
-
-# Task
-Based on your knowledge of FHIR as well as industry understanding of Pharmacy Benefit Management, Specialty Drug, and Care Management, select the FHIR resource that will support the creation of Entity and Attributes for the CDM. Your task includes determining the EXACT FHIR resource files that are of highest value to build this CDM. You will be returning specific resource filenames.
-
-# CDM Metadata
-- **Domain**: {cdm['domain']}
-- **Type**: {cdm['type']}
-{f"- **Core Dependency**: {cdm.get('core_dependency', 'N/A')}" if cdm['type'].lower() == 'functional' else ""}
-- **Description**: {cdm['description']}
-
-# CRITICAL Instructions
-
-1. **CDM Context for FHIR Resource Selection**
-   a. The CDM domain is: {cdm['domain']}
-   b. The CDM description is: {cdm['description']}
-
-2. **Resources INCLUDED in the CDM Only**
-   a. The selected FHIR resource files are used in a downstream step to define the CDM entities and attributes.
-   b. Return ONLY resources that represent entities and attributes IN this CDM.
-   c. Do NOT include StructureDefinition resources whose primary entity is modeled in a DIFFERENT CDM.
-   d. Include ValueSets and CodeSystems needed for selected StructureDefinitions.
-
-3. **IG Priority for Resource Selection**
-   a. When multiple IGs define the same resource, choose based on CDM domain context.
-   b. Assign priority (1=primary, 2=alternate) for duplicates.
-
-4. **FHIR resource file types to Include**
-   a. **StructureDefinition-*.json** - Entity/attribute model (REQUIRED)
-   b. **CodeSystem-*.json** - Coded value definitions
-   c. **ValueSet-*.json** - Allowed value constraints
-   d. **CapabilityStatement-*.json** - IG context (optional)
-
-5. **Include Supporting Terminology**
-   a. For selected StructureDefinitions, include ValueSets and CodeSystems for key coded elements.
-   b. Focus on type, category, status, level, class, funding model elements.
-
-6. **Exact Filenames**
-   a. Return EXACT filenames as they appear in the AVAILABLE FHIR FILES list below.
-   b. ONLY select filenames from the list - do NOT invent or guess filenames.
-   c. If an identified resource has NO match in the list, include it with filename prefix "NOMATCH:" (e.g., "NOMATCH:StructureDefinition-expected-name.json") - these will be resolved in a correction step.
-
-7. **Respect CDM Exclusions**
-   a. Parse "Excludes" or "Explicitly excludes" statements in the CDM description carefully.
-   b. Do NOT include resources whose primary purpose matches an excluded domain.
-   c. Examples of exclusion enforcement:
-      - If CDM excludes "member eligibility" → do NOT include Coverage, Patient, or enrollment resources
-      - If CDM excludes "formulary definitions" → do NOT include Formulary, FormularyItem, FormularyDrug
-      - If CDM excludes "prior authorization/UM rules" → do NOT include PA, StepTherapy, QuantityLimit extensions
-      - If CDM excludes "plan hierarchy/identity" → do NOT include plan-level InsurancePlan profiles
-   d. When uncertain whether a resource belongs to an excluded domain, EXCLUDE it.
-
-8. **Canonical URL for ValueSets and CodeSystems**
-   a. For ValueSet and CodeSystem files, include the canonical_url field.
-   b. This is the FHIR canonical URL (e.g., "http://hl7.org/fhir/us/davinci-drug-formulary/ValueSet/DrugTierVS")
-   c. The canonical_url is used downstream to link terminology to attribute bindings.
-   d. If you don't know the exact canonical URL, use the pattern: http://hl7.org/fhir/<ig-path>/<ResourceType>/<resource-name>
-
-# AVAILABLE FHIR FILES
-(Alphabetically sorted - scan to CodeSystem-*, StructureDefinition-*, or ValueSet-* section)
-
-{chr(10).join(available_files)}
-
-# Output Format
-
-Respond with ONLY valid JSON:
-
-{{
-  "fhir_igs": [
-    {{
-      "filename": "StructureDefinition-usdf-FormularyItem.json",
-      "resource_name": "usdf-FormularyItem",
-      "file_type": "StructureDefinition",
-      "ig_source": "US Drug Formulary",
-      "priority": 1,
-      "reasoning": "Primary formulary item resource."
-    }},
-    {{
-      "filename": "ValueSet-usdf-DrugTierVS.json",
-      "resource_name": "DrugTierVS",
-      "file_type": "ValueSet",
-      "ig_source": "US Drug Formulary",
-      "priority": 1,
-      "canonical_url": "http://hl7.org/fhir/us/davinci-drug-formulary/ValueSet/DrugTierVS",
-      "reasoning": "Drug tier value set for formulary tiering."
-    }},
-    {{
-      "filename": "CodeSystem-usdf-DrugTierCS.json",
-      "resource_name": "DrugTierCS",
-      "file_type": "CodeSystem",
-      "ig_source": "US Drug Formulary",
-      "priority": 1,
-      "canonical_url": "http://hl7.org/fhir/us/davinci-drug-formulary/CodeSystem/usdf-DrugTierCS",
-      "reasoning": "Drug tier code system defining tier codes."
-    }},
-    {{
-      "filename": "NOMATCH:StructureDefinition-usdf-CoveragePlan.json",
-      "resource_name": "usdf-CoveragePlan",
-      "file_type": "StructureDefinition",
-      "ig_source": "US Drug Formulary",
-      "priority": 1,
-      "reasoning": "Coverage plan structure - not found in list, needs correction."
-    }}
-  ],
-  "domain_assessment": {{
-    "primary_igs": ["[IG 1]", "[IG 2]"],
-    "expected_entity_count": 5,
-    "confidence": "high | medium | low",
-    "notes": "Brief assessment of IG fit for this domain."
-  }}
-}}
-
-# Critical Requirements
-- Return ONLY valid JSON, no markdown or code blocks.
-- PREFER filenames from the AVAILABLE FHIR FILES list above.
-- Use "NOMATCH:" prefix for identified resources not found in list.
-- STRICTLY EXCLUDE resources matching excluded domains in CDM description.
-- Assign priority (1=primary, 2=alternate) for duplicate resources.
-- Focus on resources for CDM entities and attributes.
-- Include supporting ValueSets and CodeSystems WITH canonical_url field.
-- canonical_url is REQUIRED for ValueSet and CodeSystem entries.
-
-Respond with JSON only:"""
\ No newline at end of file
+        cdm_type, description = cdm['type'], cdm['description']
+        
+        # Load available file list (joined text is cached alongside it)
+        self._load_file_list()
+        
+        core_dependency = ""
+        if cdm_type.lower() == 'functional':
+            core_dependency = f"- **Core Dependency**: {cdm.get('core_dependency', 'N/A')}"
+        
+        exclusions = ""
+        excluded = _extract_exclusions(description)
+        if excluded:
+            exclusions = "\n# Exclusions Identified\n" + "".join(f"- {e}\n" for e in excluded)
+        
+        return _FHIR_PROMPT_TEMPLATE.format_map({
+            'domain': cdm['domain'],
+            'type': cdm_type,
+            'core_dependency': core_dependency,
+            'description': description,
+            'exclusions': exclusions,
+            'available_files': self._file_list_text,
+        })
@@ -4,7 +4,7 @@ Glue configuration generator for CDM.
 Handles:
 - Glue file discovery from CDM source directory
 - Glue file consolidation (multiple source files -> single consolidated file)
-- Glue schema validation
+- Glue schema validation and table summary (single pass)
 - File path management
 
 Directory structure:
@@ -12,12 +12,52 @@ Directory structure:
 - Consolidated: input/business/cdm_{name}/glue/GLUE_{name}_cdm.json
 """
 import json
+import os
+import shutil
+import sys
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from . import config_utils
 from .config_gen_core import ConfigGeneratorBase, prompt_user_choice
 
+# Shared stdlib decoder for per-file parses
+_JSON_DECODE = json.JSONDecoder().decode
+
+# Optional schema-validating decoder; dict-based checks are used when unavailable
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+if msgspec is not None:
+    class _GlueTable(msgspec.Struct):
+        """Minimal Glue table shape: an object with a Name key (other keys ignored)."""
+        Name: Any
+
+    _GLUE_DECODER = msgspec.json.Decoder(Union[List[_GlueTable], _GlueTable])
+
+
+def _decode_table_names(raw: bytes) -> Optional[List[Any]]:
+    """Decode and validate Glue JSON in one C-level pass via msgspec.
+    
+    Args:
+        raw: Raw file bytes
+        
+    Returns:
+        Table names if every entry is an object with Name, else None
+        (also None when msgspec is not installed)
+    """
+    if msgspec is None:
+        return None
+    try:
+        decoded = _GLUE_DECODER.decode(raw)
+    except msgspec.DecodeError:
+        return None
+    if isinstance(decoded, list):
+        return [t.Name for t in decoded]
+    return [decoded.Name]
+
 
 class GlueConfigGenerator(ConfigGeneratorBase):
     """Glue table schema management for CDM configuration."""
@@ -33,6 +73,24 @@ class GlueConfigGenerator(ConfigGeneratorBase):
         self.glue_dir = self.cdm_dir / "glue"
         self.source_dir = self.glue_dir / "source"
         self.consolidated_filename = f"GLUE_{self.safe_name}_cdm.json"
+        self._root_prefix = str(self.project_root) + os.sep
+    
+    def _rel(self, path: Path) -> str:
+        """Convert path to project-relative string.
+        
+        Strips the cached project root prefix directly; anything outside
+        the root falls back to config_utils.normalize_path.
+        
+        Args:
+            path: Path to normalize
+            
+        Returns:
+            Relative path string if within project, as-is otherwise
+        """
+        s = str(path)
+        if s.startswith(self._root_prefix):
+            return s[len(self._root_prefix):]
+        return config_utils.normalize_path(path, self.project_root)
     
     def get_source_files(self) -> List[Path]:
         """Get Glue source files from source directory.
@@ -42,10 +100,14 @@ class GlueConfigGenerator(ConfigGeneratorBase):
         Returns:
             List of source file paths
         """
-        if not self.source_dir.exists():
+        try:
+            with os.scandir(self.source_dir) as it:
+                entries = [e for e in it if e.is_file() and e.name.endswith('.json')]
+        except FileNotFoundError:
             return []
         
-        return sorted(self.source_dir.glob("*.json"))
+        entries.sort(key=lambda e: e.name)
+        return [Path(e.path) for e in entries]
     
     def get_consolidated_file(self) -> Optional[Path]:
         """Get consolidated Glue file if it exists.
@@ -84,7 +146,7 @@ class GlueConfigGenerator(ConfigGeneratorBase):
             print(f"   ℹ️  No source files in {self.source_dir}")
             # If consolidated exists, keep it in config
             if consolidated:
-                rel_path = config_utils.normalize_path(consolidated, self.project_root)
+                rel_path = self._rel(consolidated)
                 print(f"   ✓ Using existing: {consolidated.name}")
                 return {'glue': [rel_path]}
             return None
@@ -109,14 +171,14 @@ class GlueConfigGenerator(ConfigGeneratorBase):
         
         if dry_run:
             print(f"   [DRY RUN] Would prompt to rebuild")
-            rel_path = config_utils.normalize_path(consolidated, self.project_root)
+            rel_path = self._rel(consolidated)
             return {'glue': [rel_path], '_dry_run': True}
         
         if prompt_user_choice("   Rebuild consolidated file?", default="N"):
             return self._run_consolidation(source_files)
         
         # Keep existing
-        rel_path = config_utils.normalize_path(consolidated, self.project_root)
+        rel_path = self._rel(consolidated)
         print(f"   ✓ Keeping existing: {consolidated.name}")
         return {'glue': [rel_path]}
     
@@ -135,7 +197,7 @@ class GlueConfigGenerator(ConfigGeneratorBase):
         consolidated_path, summary = self.consolidate_files(source_paths)
         
         if consolidated_path:
-            rel_path = config_utils.normalize_path(consolidated_path, self.project_root)
+            rel_path = self._rel(consolidated_path)
             return {
                 'glue': [rel_path],
                 '_consolidation_summary': summary
@@ -167,42 +229,60 @@ class GlueConfigGenerator(ConfigGeneratorBase):
             output_filename = self.consolidated_filename
         
         tables = []
+        fragments = []  # serialized table entries, spliced into the output array
+        array_sources = []  # sources that were already a JSON array
         errors = []
+        log_lines = []  # per-file status, printed once after the loop
         
+        # Resolve relative paths from project root, then check existence
+        # with one directory read per source folder
+        resolved = []
         for filepath_str in source_files:
             filepath = Path(filepath_str)
-            
-            # Resolve relative paths from project root
             if not filepath.is_absolute():
                 filepath = self.project_root / filepath
-            
-            if not filepath.exists():
+            resolved.append((filepath_str, filepath))
+        present = config_utils.existing_paths(filepath for _, filepath in resolved)
+        
+        for filepath_str, filepath in resolved:
+            if filepath not in present:
                 errors.append(f"File not found: {filepath_str}")
-                print(f"      ⚠️  Not found: {filepath.name}")
+                log_lines.append(f"      ⚠️  Not found: {filepath.name}")
                 continue
             
             try:
-                data = config_utils.load_json_file(filepath)
+                raw = filepath.read_bytes().strip()
+                data = _JSON_DECODE(raw.decode('utf-8'))
                 
                 # Handle both formats:
                 # 1. Single table object: {"Name": "...", "DatabaseName": "...", ...}
                 # 2. Already an array: [{"Name": "...", ...}, ...]
                 if isinstance(data, list):
+                    # Reuse the source bytes between the outer brackets
+                    # rather than re-serializing the parsed tables
                     tables.extend(data)
-                    print(f"      ✓ {filepath.name}: {len(data)} table(s)")
+                    inner = raw[1:-1].strip()
+                    if inner:
+                        fragments.append(inner)
+                    array_sources.append(filepath)
+                    log_lines.append(f"      ✓ {filepath.name}: {len(data)} table(s)")
                 elif isinstance(data, dict) and 'Name' in data:
                     tables.append(data)
-                    print(f"      ✓ {filepath.name}: {data.get('Name', 'unknown')}")
+                    fragments.append(config_utils.dumps_json_bytes(data))
+                    log_lines.append(f"      ✓ {filepath.name}: {data.get('Name', 'unknown')}")
                 else:
                     errors.append(f"Unknown format: {filepath_str}")
-                    print(f"      ⚠️  Unknown format: {filepath.name}")
+                    log_lines.append(f"      ⚠️  Unknown format: {filepath.name}")
                     
             except json.JSONDecodeError as e:
                 errors.append(f"JSON error in {filepath_str}: {e}")
-                print(f"      ⚠️  JSON error: {filepath.name}")
+                log_lines.append(f"      ⚠️  JSON error: {filepath.name}")
             except Exception as e:
                 errors.append(f"Error reading {filepath_str}: {e}")
-                print(f"      ⚠️  Error: {filepath.name}")
+                log_lines.append(f"      ⚠️  Error: {filepath.name}")
+        
+        if log_lines:
+            print("\n".join(log_lines))
         
         if not tables:
             print("   ❌ No valid tables found")
@@ -213,17 +293,27 @@ class GlueConfigGenerator(ConfigGeneratorBase):
         
         # Save consolidated file
         output_path = self.glue_dir / output_filename
-        config_utils.save_json_file(output_path, tables)
+        if len(source_files) == 1 and array_sources:
+            # Single array-shaped source is already the consolidated form
+            try:
+                shutil.copyfile(array_sources[0], output_path)
+            except shutil.SameFileError:
+                pass  # the source is the output file; nothing to copy
+        else:
+            config_utils.write_bytes_file(output_path, b"[\n" + b",\n".join(fragments) + b"\n]")
         
         # Generate relative path for config
-        rel_path = config_utils.normalize_path(output_path, self.project_root)
+        rel_path = self._rel(output_path)
+        
+        # Interned: summaries are long-lived and Glue table names repeat heavily
+        table_names = [t.get('Name', 'unknown') if isinstance(t, dict) else 'unknown' for t in tables]
         
         summary = {
             'output_file': str(output_path),
             'output_relative': rel_path,
             'tables_count': len(tables),
             'source_files_count': len(source_files),
-            'tables': [t.get('Name', 'unknown') for t in tables],
+            'tables': [sys.intern(n) if isinstance(n, str) else n for n in table_names],
             'errors': errors
         }
         
@@ -231,48 +321,100 @@ class GlueConfigGenerator(ConfigGeneratorBase):
         
         return output_path, summary
     
-    def validate_files(self, glue_files: List[str]) -> Tuple[List[str], List[str]]:
-        """Validate Glue files exist and have valid structure.
+    def inspect_files(self, glue_files: List[str]) -> Tuple[List[str], List[str], Dict]:
+        """Validate Glue files and summarize their tables in a single pass.
+        
+        Each file is resolved and parsed once; both the validation result and
+        the table summary are derived from the same parsed data.
         
         Args:
             glue_files: List of Glue file paths
             
         Returns:
-            Tuple of (valid files, warnings)
+            Tuple of (valid files, warnings, summary dict)
         """
         valid = []
         warnings = []
+        summary = {
+            'total_tables': 0,
+            'files': {}
+        }
+        files = summary['files']
+        root = self.project_root
         
         for filepath_str in glue_files:
             filepath = Path(filepath_str)
             
             # Resolve relative paths
             if not filepath.is_absolute():
-                filepath = self.project_root / filepath
+                filepath = root / filepath
             
-            if not filepath.exists():
+            try:
+                raw = filepath.read_bytes()
+            except FileNotFoundError:
                 warnings.append(f"Glue file not found: {filepath_str}")
+                files[filepath_str] = {'error': 'not found'}
+                continue
+            except Exception as e:
+                warnings.append(f"Error reading {filepath_str}: {e}")
+                files[filepath_str] = {'error': str(e)}
+                continue
+            
+            # Fast path: schema-validated decode; the decode is the validation
+            names = _decode_table_names(raw)
+            if names is not None:
+                valid.append(filepath_str)
+                files[filepath_str] = {
+                    'count': len(names),
+                    'tables': names
+                }
+                summary['total_tables'] += len(names)
                 continue
             
             try:
-                data = config_utils.load_json_file(filepath)
-                
-                # Validate structure
-                if isinstance(data, list):
-                    # Array format - check each table has Name
-                    if all(isinstance(t, dict) and 'Name' in t for t in data):
-                        valid.append(filepath_str)
-                    else:
-                        warnings.append(f"Invalid table structure in: {filepath_str}")
-                elif isinstance(data, dict) and 'Name' in data:
-                    # Single table format
-                    valid.append(filepath_str)
-                else:
-                    warnings.append(f"Unknown Glue format: {filepath_str}")
-                    
+                data = _JSON_DECODE(raw.decode('utf-8'))
             except Exception as e:
                 warnings.append(f"Error reading {filepath_str}: {e}")
+                files[filepath_str] = {'error': str(e)}
+                continue
+            
+            if isinstance(data, list):
+                # Array format - check each table is an object with Name
+                # (type set is built in C; 'Name' probe only runs on dicts)
+                if set(map(type, data)) <= {dict} and all('Name' in t for t in data):
+                    valid.append(filepath_str)
+                else:
+                    warnings.append(f"Invalid table structure in: {filepath_str}")
+                tables = [t.get('Name', 'unknown') for t in data if isinstance(t, dict)]
+                files[filepath_str] = {
+                    'count': len(tables),
+                    'tables': tables
+                }
+                summary['total_tables'] += len(tables)
+            elif isinstance(data, dict) and 'Name' in data:
+                # Single table format
+                valid.append(filepath_str)
+                files[filepath_str] = {
+                    'count': 1,
+                    'tables': [data.get('Name', 'unknown')]
+                }
+                summary['total_tables'] += 1
+            else:
+                warnings.append(f"Unknown Glue format: {filepath_str}")
+                files[filepath_str] = {'error': 'unknown format'}
+        
+        return valid, warnings, summary
+    
+    def validate_files(self, glue_files: List[str]) -> Tuple[List[str], List[str]]:
+        """Validate Glue files exist and have valid structure.
         
+        Args:
+            glue_files: List of Glue file paths
+            
+        Returns:
+            Tuple of (valid files, warnings)
+        """
+        valid, warnings, _ = self.inspect_files(glue_files)
         return valid, warnings
     
     def get_table_summary(self, glue_files: List[str]) -> Dict:
@@ -284,44 +426,7 @@ class GlueConfigGenerator(ConfigGeneratorBase):
         Returns:
             Summary dict with table counts and names
         """
-        summary = {
-            'total_tables': 0,
-            'files': {}
-        }
-        
-        for filepath_str in glue_files:
-            filepath = Path(filepath_str)
-            
-            if not filepath.is_absolute():
-                filepath = self.project_root / filepath
-            
-            if not filepath.exists():
-                summary['files'][filepath_str] = {'error': 'not found'}
-                continue
-            
-            try:
-                data = config_utils.load_json_file(filepath)
-                
-                if isinstance(data, list):
-                    tables = [t.get('Name', 'unknown') for t in data if isinstance(t, dict)]
-                    summary['files'][filepath_str] = {
-                        'count': len(tables),
-                        'tables': tables
-                    }
-                    summary['total_tables'] += len(tables)
-                elif isinstance(data, dict) and 'Name' in data:
-                    summary['files'][filepath_str] = {
-                        'count': 1,
-                        'tables': [data.get('Name', 'unknown')]
-                    }
-                    summary['total_tables'] += 1
-                else:
-                    summary['files'][filepath_str] = {'error': 'unknown format'}
-                    
-            except Exception as e:
-                summary['files'][filepath_str] = {'error': str(e)}
-        
-        return summary
+        return self.inspect_files(glue_files)[2]
     
     def update_config_with_consolidated(self, config: Dict, consolidated_path: Path) -> Dict:
         """Update config to use consolidated Glue file.
@@ -333,7 +438,7 @@ class GlueConfigGenerator(ConfigGeneratorBase):
         Returns:
             Updated config dict
         """
-        rel_path = config_utils.normalize_path(consolidated_path, self.project_root)
+        rel_path = self._rel(consolidated_path)
         
         # Replace multiple files with single consolidated file
         if 'input_files' not in config:
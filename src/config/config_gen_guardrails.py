@@ -36,6 +36,7 @@ User overrides:
 from __future__ import annotations
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -55,6 +56,9 @@ SAMPLE_ROWS_PER_TAB = 4
 # "1-4 stub rows" from ">= 5 real rows" without reading entire sheets.
 EMPTY_DETECT_NROWS = 10
 
+# Triage LLM calls in flight at once (one per guardrails file)
+TRIAGE_WORKERS = 4
+
 SYSTEM_PROMPT = (
     "You are a senior business analyst classifying spreadsheet tabs for "
     "a Common Data Model rationalization pipeline. Return ONLY valid JSON "
@@ -179,11 +183,7 @@ class GuardrailsConfigGenerator(ConfigGeneratorBase):
     def _call_triage_llm(self, prompt: str) -> Optional[Dict[str, Any]]:
         if self.llm_client is None:
             raise ValueError("Guardrails triage requires an LLM client")
-        messages = [
-            {"role": "system", "content": SYSTEM_PROMPT},
-            {"role": "user", "content": prompt},
-        ]
-        response, _ = self.llm_client.chat(messages)
+        response = self.call_llm(prompt, system_prompt=SYSTEM_PROMPT)
         try:
             return self.parse_ai_json_response(response)
         except json.JSONDecodeError as e:
@@ -195,6 +195,10 @@ class GuardrailsConfigGenerator(ConfigGeneratorBase):
         Triage every guardrails entry. Returns an updates dict shaped as
         ``{"guardrails": [...new entries...]}``. The caller merges this
         into ``config['input_files']``.
+
+        Triage LLM calls run concurrently (up to TRIAGE_WORKERS); each is
+        started as soon as its file is summarized and verdicts are applied
+        in entry order.
         """
         guardrails_entries = (source_config.get("input_files") or {}).get("guardrails") or []
         if not guardrails_entries:
@@ -204,95 +208,120 @@ class GuardrailsConfigGenerator(ConfigGeneratorBase):
         domain = (source_config.get("cdm") or {}).get("domain", "")
         description = (source_config.get("cdm") or {}).get("description", "")
 
+        # One directory read covers the existence check for every entry
+        filenames = [e if isinstance(e, str) else e.get("file")
+                     for e in guardrails_entries if isinstance(e, (str, dict))]
+        present = config_utils.existing_paths(
+            config_utils.resolve_guardrail_file(self.cdm_name, f) for f in filenames if f
+        )
+
         updated_entries: List[Any] = []
-        for entry in guardrails_entries:
-            # Normalise: accept plain string or dict form
-            if isinstance(entry, str):
-                filename = entry
-                preserved: Dict[str, Any] = {"file": filename}
-            elif isinstance(entry, dict):
-                filename = entry.get("file") or ""
-                preserved = dict(entry)
-            else:
-                print(f"      ⚠️  Skipping unexpected entry: {entry!r}")
-                updated_entries.append(entry)
-                continue
+        # (slot in updated_entries, filename, preserved, empty tabs, non-empty tabs, future)
+        pending = []
+        with ThreadPoolExecutor(max_workers=TRIAGE_WORKERS) as executor:
+            for entry in guardrails_entries:
+                # Normalise: accept plain string or dict form
+                if isinstance(entry, str):
+                    filename = entry
+                    preserved: Dict[str, Any] = {"file": filename}
+                elif isinstance(entry, dict):
+                    filename = entry.get("file") or ""
+                    preserved = dict(entry)
+                else:
+                    print(f"      ⚠️  Skipping unexpected entry: {entry!r}")
+                    updated_entries.append(entry)
+                    continue
 
-            if not filename:
-                updated_entries.append(entry)
-                continue
+                if not filename:
+                    updated_entries.append(entry)
+                    continue
 
-            file_path = config_utils.resolve_guardrail_file(self.cdm_name, filename)
-            if not file_path.exists():
-                print(f"      ⚠️  File not found, skipping: {file_path}")
-                updated_entries.append(entry)
-                continue
-
-            print(f"\n   Triaging: {filename}")
-            tab_data = self._summarize_tabs(file_path)
-            print(f"      Tabs found: {len(tab_data)}")
-            for t in tab_data:
-                empty_marker = "  (EMPTY)" if t.get("is_empty") else ""
-                print(f"        - {t['sheet']}{empty_marker}")
-
-            # Pre-triage: empty tabs always exclude — no LLM call needed.
-            # Empty by definition means no rationalizable content.
-            empty_tabs = [t["sheet"] for t in tab_data if t.get("is_empty")]
-            non_empty_tabs = [t for t in tab_data if not t.get("is_empty")]
-
-            if dry_run:
-                # Save the prompt; return entry unchanged
-                prompt = self._build_prompt(filename, non_empty_tabs, domain, description)
-                if self.config_dir:
-                    prompts_dir = self.config_dir / "prompts"
-                    prompts_dir.mkdir(parents=True, exist_ok=True)
-                    safe = filename.replace(" ", "_").replace("/", "_")
-                    (prompts_dir / f"guardrails_triage_{safe}.txt").write_text(prompt, encoding="utf-8")
-                    print(f"      [dry run] prompt saved (empty tabs auto-excluded: {len(empty_tabs)})")
+                file_path = config_utils.resolve_guardrail_file(self.cdm_name, filename)
+                if file_path not in present:
+                    print(f"      ⚠️  File not found, skipping: {file_path}")
+                    updated_entries.append(entry)
+                    continue
+
+                print(f"\n   Triaging: {filename}")
+                tab_data = self._summarize_tabs(file_path)
+                print(f"      Tabs found: {len(tab_data)}")
+                for t in tab_data:
+                    empty_marker = "  (EMPTY)" if t.get("is_empty") else ""
+                    print(f"        - {t['sheet']}{empty_marker}")
+
+                # Pre-triage: empty tabs always exclude — no LLM call needed.
+                # Empty by definition means no rationalizable content.
+                empty_tabs = [t["sheet"] for t in tab_data if t.get("is_empty")]
+                non_empty_tabs = [t for t in tab_data if not t.get("is_empty")]
+
+                if dry_run:
+                    # Save the prompt; return entry unchanged
+                    prompt = self._build_prompt(filename, non_empty_tabs, domain, description)
+                    if self.config_dir:
+                        prompts_dir = self.config_dir / "prompts"
+                        prompts_dir.mkdir(parents=True, exist_ok=True)
+                        safe = filename.replace(" ", "_").replace("/", "_")
+                        (prompts_dir / f"guardrails_triage_{safe}.txt").write_text(prompt, encoding="utf-8")
+                        print(f"      [dry run] prompt saved (empty tabs auto-excluded: {len(empty_tabs)})")
+                    updated_entries.append(entry)
+                    continue
+
+                future = None
+                if non_empty_tabs:
+                    prompt = self._build_prompt(filename, non_empty_tabs, domain, description)
+                    future = executor.submit(self._call_triage_llm, prompt)
+                pending.append((len(updated_entries), filename, preserved, empty_tabs, non_empty_tabs, future))
                 updated_entries.append(entry)
-                continue
-
-            include: List[str] = []
-            exclude: List[str] = list(empty_tabs)  # auto-exclude all empty tabs
-            reasons: Dict[str, str] = {s: "Empty tab — no data rows" for s in empty_tabs}
-
-            if non_empty_tabs:
-                prompt = self._build_prompt(filename, non_empty_tabs, domain, description)
-                decisions = self._call_triage_llm(prompt) or {}
-                decision_list = decisions.get("decisions") or []
-
-                seen_sheets = set(empty_tabs)
-                for d in decision_list:
-                    sheet = (d.get("sheet") or "").strip()
-                    if not sheet:
-                        continue
-                    seen_sheets.add(sheet)
-                    verdict = (d.get("decision") or "").strip().lower()
-                    reasons[sheet] = (d.get("reason") or "").strip()
-                    if verdict == "include":
-                        include.append(sheet)
-                    elif verdict == "exclude":
-                        exclude.append(sheet)
-
-                # Any non-empty tab we sampled but the LLM didn't rule on —
-                # default to INCLUDE to fail safe (over-inclusion is recoverable;
-                # silent drops aren't).
-                for t in non_empty_tabs:
-                    if t["sheet"] not in seen_sheets:
-                        include.append(t["sheet"])
-                        reasons[t["sheet"]] = "(no triage decision — defaulted to include)"
-
-            print(f"      AI verdict: include={len(include)}, exclude={len(exclude)}")
-            for s in include:
-                print(f"         + {s}")
-            for s in exclude:
-                print(f"         - {s}  ({reasons.get(s, '')[:80]})")
-
-            new_entry = dict(preserved)
-            new_entry["file"] = filename
-            new_entry["include_sheets"] = include
-            new_entry["exclude_sheets"] = exclude
-            new_entry["triage_reasons"] = reasons
-            updated_entries.append(new_entry)
+
+            for slot, filename, preserved, empty_tabs, non_empty_tabs, future in pending:
+                decisions = (future.result() if future is not None else None) or {}
+                print(f"\n   Verdict: {filename}")
+                updated_entries[slot] = self._apply_decisions(
+                    filename, preserved, empty_tabs, non_empty_tabs, decisions)
 
         return {"guardrails": updated_entries}
+
+    def _apply_decisions(self, filename: str, preserved: Dict[str, Any], empty_tabs: List[str],
+                         non_empty_tabs: List[Dict[str, Any]],
+                         decisions: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the triaged entry for one file from its LLM decisions."""
+        include: List[str] = []
+        exclude: List[str] = list(empty_tabs)  # auto-exclude all empty tabs
+        reasons: Dict[str, str] = {s: "Empty tab — no data rows" for s in empty_tabs}
+
+        if non_empty_tabs:
+            decision_list = decisions.get("decisions") or []
+
+            seen_sheets = set(empty_tabs)
+            for d in decision_list:
+                sheet = (d.get("sheet") or "").strip()
+                if not sheet:
+                    continue
+                seen_sheets.add(sheet)
+                verdict = (d.get("decision") or "").strip().lower()
+                reasons[sheet] = (d.get("reason") or "").strip()
+                if verdict == "include":
+                    include.append(sheet)
+                elif verdict == "exclude":
+                    exclude.append(sheet)
+
+            # Any non-empty tab we sampled but the LLM didn't rule on —
+            # default to INCLUDE to fail safe (over-inclusion is recoverable;
+            # silent drops aren't).
+            for t in non_empty_tabs:
+                if t["sheet"] not in seen_sheets:
+                    include.append(t["sheet"])
+                    reasons[t["sheet"]] = "(no triage decision — defaulted to include)"
+
+        print(f"      AI verdict: include={len(include)}, exclude={len(exclude)}")
+        for s in include:
+            print(f"         + {s}")
+        for s in exclude:
+            print(f"         - {s}  ({reasons.get(s, '')[:80]})")
+
+        new_entry = dict(preserved)
+        new_entry["file"] = filename
+        new_entry["include_sheets"] = include
+        new_entry["exclude_sheets"] = exclude
+        new_entry["triage_reasons"] = reasons
+        return new_entry
@@ -28,7 +28,7 @@ from __future__ import annotations
 
 from typing import Any, Dict, List
 
-from .config_gen_core import prompt_user_choice
+from .config_gen_core import is_interactive, prompt_input, prompt_user_choice
 
 
 def _is_ddl_ancillary(entry: Dict[str, Any]) -> bool:
@@ -96,10 +96,12 @@ def run_mapping_config(source_config: Dict[str, Any]) -> Dict[str, Any]:
             f"\n   Source Application name [{default_app}]: "
             if default_app else "\n   Source Application name: "
         )
-        raw = input(prompt).strip()
+        raw = prompt_input(prompt).strip()
         app = raw or default_app
         if app:
             break
+        if not is_interactive():
+            raise ValueError("source_application is required (no default available in non-interactive mode)")
         print(f"      ⚠️  source_application is required — please enter a value")
 
     # --- source_schema (fallback only; auto-extraction handles per-row) ---
@@ -6,17 +6,103 @@ Handles:
 - AI-based analysis for CDM relevance
 - Standard code validation
 """
+import functools
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from . import config_utils
 from .config_gen_core import ConfigGeneratorBase
 
+# SCRIPT standards typically start with S or Q
+_SCRIPT_PREFIXES = frozenset('SQ')
+
+# Row format for the standards lists embedded in the analysis prompt
+_format_standard_row = '   - "{0[0]}": "{0[1]}"'.format
+
+
+@functools.lru_cache(maxsize=32)
+def _format_standards_block(items: Tuple[Tuple[str, str], ...], empty: str) -> str:
+    """Prompt block listing standards in file order (memoized per process)."""
+    return "\n".join(map(_format_standard_row, items)) or empty
+
+
+@functools.lru_cache(maxsize=8)
+def _read_code_index(path_str: str, mtime_ns: int) -> Tuple[frozenset, Dict[str, str]]:
+    """Valid codes and the _standards map of an NCPDP file, per (path, mtime).
+    
+    Only the top-level code keys and the _standards mapping are kept; the
+    per-code field arrays are dropped once parsed.
+    """
+    data = config_utils.load_json_file(Path(path_str))
+    # Codes are keys holding a list (excluding _standards metadata)
+    codes = frozenset(k for k, v in data.items() if k != '_standards' and isinstance(v, list))
+    return codes, data.get('_standards', {})
+
+
+def _load_code_index(ncpdp_file: Path) -> Tuple[frozenset, Dict[str, str]]:
+    """Code index for an NCPDP file, re-read only when the file changes."""
+    return _read_code_index(str(ncpdp_file), ncpdp_file.stat().st_mtime_ns)
+
+# Static analysis instructions, sent as the system message
+_NCPDP_SYSTEM_PROMPT = """You are an NCPDP standards expert selecting the NCPDP Standard Format Keys that support building out a Canonical Data Model (CDM) for a specific domain.
+
+# Task
+Based on your knowledge of NCPDP Standards as well as industry understanding of Pharmacy Benefit Management, Specialty Drug, and Care Management, select the Standard Formats (A-Z) whose data elements are of HIGHEST VALUE for the creation of Entities and Attributes in the specified CDM.
+
+# Selection Rules
+
+1. **HIGHEST VALUE ONLY**: select zero to several formats; empty arrays are valid. Include only standards that pass ALL rules below.
+
+2. **PRIMARY PURPOSE TEST**: SELECT only if the format's data elements primarily DEFINE data structures for this CDM domain. REJECT if they merely USE or REFERENCE fields from this domain in transactions.
+
+3. **ENTITY-DEFINING vs FIELD-USING**: prefer standards that DEFINE entities, attributes, and data structures; use EXTREME CAUTION with transaction/message standards that happen to INCLUDE fields from this domain.
+
+4. **NAME vs CONTENT**: do not select/reject based on the name matching CDM keywords; evaluate the data elements the format actually defines.
+
+5. **VALID CODES ONLY**: use ONLY codes from the lists provided.
+
+# Output Format
+
+Respond with ONLY valid JSON (no markdown or code blocks):
+
+{
+  "ncpdp_general_standards": [
+    {"code": "X", "name": "Standard Name", "reasoning": "Primary purpose: [what it defines]. Relevant to this CDM because: [specific reason]."}
+  ],
+  "ncpdp_script_standards": [
+    {"code": "SX", "name": "SCRIPT Standard Name", "reasoning": "Primary purpose: [what it defines]. Relevant to this CDM because: [specific reason]."}
+  ],
+  "domain_assessment": {
+    "ncpdp_relevance": "high | medium | low | none",
+    "confidence": "high | medium | low",
+    "notes": "Assessment of NCPDP fit for this domain."
+  }
+}"""
+
+# Per-CDM analysis prompt (user message), filled with str.format_map
+_NCPDP_PROMPT_TEMPLATE = """# CDM Metadata
+- **Domain**: {domain}
+- **Type**: {type}
+- **Description**: {description}
+
+# VALID NCPDP STANDARDS - SELECT ONLY FROM THESE LISTS
+
+## General Standards (ncpdp_general_standards):
+{general_list}
+
+## SCRIPT Standards (ncpdp_script_standards):
+{script_list}
+
+Respond with JSON only:"""
+
 
 class NCPDPConfigGenerator(ConfigGeneratorBase):
     """NCPDP standards analysis and selection for CDM configuration."""
     
+    SYSTEM_PROMPT = _NCPDP_SYSTEM_PROMPT
+    
     def __init__(self, cdm_name: str, llm_client=None):
         """Initialize NCPDP config generator.
         
@@ -39,11 +125,9 @@ class NCPDPConfigGenerator(ConfigGeneratorBase):
         """
         print("\n🤖 NCPDP Analysis")
         
-        # Load available standards
-        general_standards = self._load_standards_list("ncpdp_general_standards.json")
-        script_standards = self._load_standards_list("ncpdp_script_standards.json")
+        prompt = self.build_prompt(config)
         
-        if not general_standards and not script_standards:
+        if prompt is None:
             print("   ⚠️  No NCPDP standards files found")
             return {
                 'ncpdp_general_standards': [],
@@ -51,29 +135,17 @@ class NCPDPConfigGenerator(ConfigGeneratorBase):
                 'domain_assessment': {'ncpdp_relevance': 'unknown'}
             }
         
-        prompt = self._build_analysis_prompt(config, general_standards, script_standards)
-        
         if dry_run:
             return {
                 'ncpdp_general_standards': [],
                 'ncpdp_script_standards': [],
                 'domain_assessment': {},
-                '_prompt': prompt
+                '_prompt': f"{self.SYSTEM_PROMPT}\n\n{prompt}"
             }
         
         try:
-            response_text = self.call_llm(prompt)
-            result = self.parse_ai_json_response(response_text)
-            
-            # Handle flat response format (auto-split by code prefix)
-            result = self._normalize_response(result)
-            
-            # Display results
-            gen_count = len(result.get('ncpdp_general_standards', []))
-            script_count = len(result.get('ncpdp_script_standards', []))
-            print(f"   ✓ Selected {gen_count} general + {script_count} SCRIPT standards")
-            
-            return result
+            response_text = self.call_llm(prompt, system_prompt=self.SYSTEM_PROMPT)
+            return self.parse_result(self.parse_ai_json_response(response_text))
             
         except json.JSONDecodeError as e:
             print(f"   ❌ Error parsing NCPDP response: {e}")
@@ -82,6 +154,39 @@ class NCPDPConfigGenerator(ConfigGeneratorBase):
             print(f"   ❌ Error in NCPDP analysis: {e}")
             raise
     
+    def build_prompt(self, config: Dict) -> Optional[str]:
+        """Build the analysis prompt (user message; see SYSTEM_PROMPT).
+        
+        Args:
+            config: Partial config dict with CDM metadata
+            
+        Returns:
+            Prompt text, or None if no standards files are available
+        """
+        general_standards, script_standards = self._get_standards_lists()
+        if not general_standards and not script_standards:
+            return None
+        return self._build_analysis_prompt(config, general_standards, script_standards)
+    
+    def parse_result(self, result: Dict) -> Dict:
+        """Normalize a parsed AI response and report the selection.
+        
+        Args:
+            result: Parsed JSON from the analysis prompt
+            
+        Returns:
+            Dict with ncpdp_general_standards, ncpdp_script_standards, domain_assessment
+        """
+        # Handle flat response format (auto-split by code prefix)
+        result = self._normalize_response(result)
+        
+        # Display results
+        gen_count = len(result.get('ncpdp_general_standards', []))
+        script_count = len(result.get('ncpdp_script_standards', []))
+        print(f"   ✓ Selected {gen_count} general + {script_count} SCRIPT standards")
+        
+        return result
+    
     def validate_codes(self, ncpdp_resources: Dict) -> Dict:
         """Validate NCPDP standard codes exist in standards files.
         
@@ -98,27 +203,32 @@ class NCPDPConfigGenerator(ConfigGeneratorBase):
             'domain_assessment': ncpdp_resources.get('domain_assessment', {})
         }
         
-        # Validate general standards
-        general_file = self.ncpdp_dir / "ncpdp_general_standards.json"
-        if general_file.exists():
-            validated['ncpdp_general_standards'], gen_warnings = self._validate_codes_against_file(
-                general_file,
-                ncpdp_resources.get('ncpdp_general_standards', [])
-            )
-            warnings.extend(gen_warnings)
-        
-        # Validate SCRIPT standards
-        script_file = self.ncpdp_dir / "ncpdp_script_standards.json"
-        if script_file.exists():
-            validated['ncpdp_script_standards'], script_warnings = self._validate_codes_against_file(
-                script_file,
-                ncpdp_resources.get('ncpdp_script_standards', [])
-            )
-            warnings.extend(script_warnings)
+        # Validate general and SCRIPT standards (a missing file is skipped)
+        for key in ('ncpdp_general_standards', 'ncpdp_script_standards'):
+            ncpdp_file = self.ncpdp_dir / f"{key}.json"
+            result = self._validate_codes_against_file(ncpdp_file, ncpdp_resources.get(key, []))
+            if result is not None:
+                validated[key], file_warnings = result
+                warnings.extend(file_warnings)
         
         validated['_warnings'] = warnings
         return validated
     
+    def _get_standards_lists(self) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """Get (general, SCRIPT) standards mappings.
+        
+        Both come from the per-(path, mtime) code index, so an unchanged
+        file is parsed once per process and an edited one is re-read.
+        
+        Returns:
+            Tuple of (general code -> name, SCRIPT code -> name)
+        """
+        # Independent file reads; overlap them for slow/network mounts
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            general = ex.submit(self._load_standards_list, "ncpdp_general_standards.json")
+            script = ex.submit(self._load_standards_list, "ncpdp_script_standards.json")
+            return general.result(), script.result()
+    
     def _load_standards_list(self, filename: str) -> Dict[str, str]:
         """Load _standards mapping from NCPDP file.
         
@@ -129,50 +239,55 @@ class NCPDPConfigGenerator(ConfigGeneratorBase):
             Dict mapping code -> name
         """
         ncpdp_file = self.ncpdp_dir / filename
-        if ncpdp_file.exists():
-            try:
-                data = config_utils.load_json_file(ncpdp_file)
-                return data.get('_standards', {})
-            except Exception:
-                pass
-        return {}
+        try:
+            return _load_code_index(ncpdp_file)[1]
+        except Exception:
+            return {}
     
-    def _validate_codes_against_file(self, ncpdp_file: Path, ai_standards: List[Dict]) -> tuple:
+    def _validate_codes_against_file(self, ncpdp_file: Path, ai_standards: List[Dict]) -> Optional[tuple]:
         """Validate standard codes exist in file.
         
+        The file's code index is parsed once per (path, mtime) and shared
+        with the prompt's standards lists.
+        
         Args:
             ncpdp_file: Path to NCPDP standards file
             ai_standards: List of standards from AI
             
         Returns:
-            Tuple of (validated standards list, warnings list)
+            Tuple of (validated standards list, warnings list), or None if
+            the file doesn't exist
         """
         validated = []
         warnings = []
+        log_lines = []
         
         try:
-            data = config_utils.load_json_file(ncpdp_file)
-            standards_map = data.get('_standards', {})
+            valid_codes, standards_map = _load_code_index(ncpdp_file)
             
             for standard in ai_standards:
                 code = standard['code']
                 
-                # Check if code exists as a key (excluding _standards metadata)
-                if code in data and isinstance(data[code], list):
-                    standard_name = standards_map.get(code, standard.get('name', code))
+                if code in valid_codes:
+                    name = standard['name'] if 'name' in standard else standards_map.get(code, code)
                     validated.append({
                         "code": code,
-                        "name": standard.get('name', standard_name),
+                        "name": name,
                         "reasoning": standard['reasoning']
                     })
-                    print(f"      ✅ {code}: {standard.get('name', standard_name)}")
+                    log_lines.append(f"      ✅ {code}: {name}")
                 else:
                     warnings.append(f"NCPDP code '{code}' not found in {ncpdp_file.name}")
-                    print(f"      ⚠️  {code}: NOT FOUND")
+                    log_lines.append(f"      ⚠️  {code}: NOT FOUND")
                     
+        except FileNotFoundError:
+            return None
         except Exception as e:
             warnings.append(f"Could not parse {ncpdp_file.name}: {e}")
         
+        if log_lines:
+            print("\n".join(log_lines))
+        
         return validated, warnings
     
     def _normalize_response(self, ai_response: Dict) -> Dict:
@@ -198,13 +313,9 @@ class NCPDPConfigGenerator(ConfigGeneratorBase):
         all_standards = ai_response.get('ncpdp_standards', [])
         if all_standards:
             print("   Auto-splitting NCPDP standards by code prefix...")
-            for std in all_standards:
-                code = std['code'].upper()
-                # SCRIPT standards typically start with S or Q
-                if code.startswith('S') or code.startswith('Q'):
-                    script.append(std)
-                else:
-                    general.append(std)
+            is_script = [s['code'][:1].upper() in _SCRIPT_PREFIXES for s in all_standards]
+            script = [s for s, flag in zip(all_standards, is_script) if flag]
+            general = [s for s, flag in zip(all_standards, is_script) if not flag]
         
         return {
             'ncpdp_general_standards': general,
@@ -217,82 +328,15 @@ class NCPDPConfigGenerator(ConfigGeneratorBase):
         cdm = config['cdm']
         
         # Format standards lists
-        general_list = "\n".join([
-            f'   - "{code}": "{name}"' for code, name in general_standards.items()
-        ]) or "   (No general standards available)"
-        
-        script_list = "\n".join([
-            f'   - "{code}": "{name}"' for code, name in script_standards.items()
-        ]) or "   (No SCRIPT standards available)"
+        general_list = _format_standards_block(
+            tuple(general_standards.items()), "   (No general standards available)")
+        script_list = _format_standards_block(
+            tuple(script_standards.items()), "   (No SCRIPT standards available)")
         
-        return f"""You are an NCPDP standards expert analyzing and selecting the appropriate NCPDP Standard Format Key to support building out a Canonical Data Model (CDM) for the specific domain.
-
-# Task
-Based on your knowledge of NCPDP Standards as well as industry understanding of Pharmacy Benefit Management, Specialty Drug, and Care Management, select the Standard Formats (A-Z) that contain the NCPDP data elements that will be of HIGHEST VALUE for the creation of Entities and Attributes in the specified CDM.
-
-# CDM Metadata
-- **Domain**: {cdm['domain']}
-- **Type**: {cdm['type']}
-- **Description**: {cdm['description']}
-
-# VALID NCPDP STANDARDS - SELECT ONLY FROM THESE LISTS
-
-## General Standards (ncpdp_general_standards):
-{general_list}
-
-## SCRIPT Standards (ncpdp_script_standards):
-{script_list}
-
-# CRITICAL Selection Rules
-
-1. **SELECT ONLY THOSE STANDARD FORMATS THAT ARE OF HIGHEST VALUE**
-   a. This may be no resources to several resources
-   b. Empty arrays are valid and can be correct for certain domains
-   c. Only include standards that clearly pass ALL criteria below
-
-2. **STANDARD FORMAT SELECTION TEST**
-   a. Ask: "Does this Standard Format's data elements provide high value in defining the specified CDM?"
-   b. SELECT only if the Standard Format's data elements primary purpose is to DEFINE data structures for this CDM domain
-   c. REJECT if the Standard Format's data elements merely USES or REFERENCES fields from this domain in transactions
-
-3. **ENTITY-DEFINING vs FIELD-USING**
-   a. SELECT: Standards that DEFINE entities, attributes, and data structures
-   b. EXTREME CAUTION: Transaction/message standards that happen to INCLUDE fields from this domain
-
-4. **STANDARD NAME vs CONTENT**
-   a. Do not select/reject based on name matching CDM keywords
-   b. Evaluate what data elements the Standard Format actually defines
-
-# Output Format
-
-Respond with ONLY valid JSON:
-
-{{
-  "ncpdp_general_standards": [
-    {{
-      "code": "X",
-      "name": "Standard Name",
-      "reasoning": "Primary purpose: [what it defines]. Relevant to {cdm['domain']} CDM because: [specific reason]."
-    }}
-  ],
-  "ncpdp_script_standards": [
-    {{
-      "code": "SX",
-      "name": "SCRIPT Standard Name", 
-      "reasoning": "Primary purpose: [what it defines]. Relevant to {cdm['domain']} CDM because: [specific reason]."
-    }}
-  ],
-  "domain_assessment": {{
-    "ncpdp_relevance": "high | medium | low | none",
-    "confidence": "high | medium | low",
-    "notes": "Assessment of NCPDP fit for {cdm['domain']} domain."
-  }}
-}}
-
-# Critical Requirements
-- Return ONLY valid JSON, no markdown or code blocks
-- Use ONLY codes from the provided lists above
-- Empty arrays are acceptable
-- Apply PRIMARY PURPOSE TEST to every candidate
-
-Respond with JSON only:"""
+        return _NCPDP_PROMPT_TEMPLATE.format_map({
+            'domain': cdm['domain'],
+            'type': cdm['type'],
+            'description': cdm['description'],
+            'general_list': general_list,
+            'script_list': script_list,
+        })
@@ -19,26 +19,53 @@ Usage:
     python -m src.config.config_generator plan
     python -m src.config.config_generator formulary
 """
+import copy
+import functools
+import os
 import re
 import sys
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 from . import config_utils
-from .config_gen_core import ConfigGeneratorBase, prompt_user_choice
+from .config_gen_core import ConfigGeneratorBase, prompt_input, prompt_user_choice, set_assume_defaults
 from .config_gen_mapping import run_mapping_config
-from .config_gen_fhir import FHIRConfigGenerator
-from .config_gen_ncpdp import NCPDPConfigGenerator
-from .config_gen_glue import GlueConfigGenerator
-from .config_gen_edw import EDWConfigGenerator
-from .config_gen_ancillary import AncillaryConfigGenerator
-from .config_gen_guardrails import GuardrailsConfigGenerator
+from .config_parser import create_default_output_filename
+
+# Console banners
+_SEP = '=' * 60
+_HEADER = f"\n{_SEP}\nCDM Configuration Generator\n{_SEP}"
+
+# One request covering FHIR Pass 1 and NCPDP selection (opt-in via
+# CDM_BATCH_DETERMINATION=1); each task keeps its own prompt and schema.
+_BATCHED_PROMPT_TEMPLATE = """You will complete TWO independent tasks for the same CDM.
+Return ONE JSON object with exactly two keys:
+- "fhir": the JSON object TASK A asks for
+- "ncpdp": the JSON object TASK B asks for
+
+# ===== TASK A: FHIR RESOURCE SELECTION =====
+
+{fhir}
+
+# ===== TASK B: NCPDP STANDARDS SELECTION =====
+
+{ncpdp}
+
+Respond with the combined JSON object only:"""
+
+# input_files sections counted in the run summary
+_SUMMARY_KEYS = ('fhir_igs', 'guardrails', 'glue', 'ddl',
+                 'ncpdp_general_standards', 'ncpdp_script_standards', 'edw')
 
 
 class ConfigGenerator(ConfigGeneratorBase):
     """Coordinate CDM configuration generation."""
     
+    __slots__ = ('_fhir_gen', '_ncpdp_gen', '_glue_gen', '_edw_gen',
+                 '_ancillary_gen', '_guardrails_gen')
+    
     def __init__(self, cdm_name: str, llm_client=None):
         """Initialize config generator.
         
@@ -47,27 +74,65 @@ class ConfigGenerator(ConfigGeneratorBase):
             llm_client: LLM client for AI analysis
         """
         super().__init__(cdm_name, llm_client)
-        
-        # Sub-generators
-        self.fhir_gen = FHIRConfigGenerator(cdm_name, llm_client)
-        self.ncpdp_gen = NCPDPConfigGenerator(cdm_name, llm_client)
-        self.glue_gen = GlueConfigGenerator(cdm_name, llm_client)
-        self.edw_gen  = EDWConfigGenerator(cdm_name, llm_client)
-        self.ancillary_gen = AncillaryConfigGenerator(cdm_name, llm_client)
-        self.guardrails_gen = GuardrailsConfigGenerator(cdm_name, llm_client)
+        self._fhir_gen = self._ncpdp_gen = self._glue_gen = None
+        self._edw_gen = self._ancillary_gen = self._guardrails_gen = None
+    
+    # Sub-generators are built (and their modules imported) on first use,
+    # so analyses the user skips cost nothing.
+    
+    @property
+    def fhir_gen(self):
+        if self._fhir_gen is None:
+            from .config_gen_fhir import FHIRConfigGenerator
+            self._fhir_gen = FHIRConfigGenerator(self.cdm_name, self.llm_client)
+        return self._fhir_gen
+    
+    @property
+    def ncpdp_gen(self):
+        if self._ncpdp_gen is None:
+            from .config_gen_ncpdp import NCPDPConfigGenerator
+            self._ncpdp_gen = NCPDPConfigGenerator(self.cdm_name, self.llm_client)
+        return self._ncpdp_gen
+    
+    @property
+    def glue_gen(self):
+        if self._glue_gen is None:
+            from .config_gen_glue import GlueConfigGenerator
+            self._glue_gen = GlueConfigGenerator(self.cdm_name, self.llm_client)
+        return self._glue_gen
     
-    def run(self, dry_run: bool = False) -> Optional[Path]:
+    @property
+    def edw_gen(self):
+        if self._edw_gen is None:
+            from .config_gen_edw import EDWConfigGenerator
+            self._edw_gen = EDWConfigGenerator(self.cdm_name, self.llm_client)
+        return self._edw_gen
+    
+    @property
+    def ancillary_gen(self):
+        if self._ancillary_gen is None:
+            from .config_gen_ancillary import AncillaryConfigGenerator
+            self._ancillary_gen = AncillaryConfigGenerator(self.cdm_name, self.llm_client)
+        return self._ancillary_gen
+    
+    @property
+    def guardrails_gen(self):
+        if self._guardrails_gen is None:
+            from .config_gen_guardrails import GuardrailsConfigGenerator
+            self._guardrails_gen = GuardrailsConfigGenerator(self.cdm_name, self.llm_client)
+        return self._guardrails_gen
+    
+    def run(self, dry_run: bool = False, skip: frozenset = frozenset()) -> Optional[Path]:
         """Execute config generation workflow.
         
         Args:
             dry_run: If True, save prompts but don't call LLM
+            skip: Analyses to leave out without asking ('FHIR', 'NCPDP')
             
         Returns:
             Path to saved config, or None if skipped/failed
         """
-        print(f"\n{'='*60}")
-        print(f"CDM Configuration Generator")
-        print(f"{'='*60}")
+        print(_HEADER)
         print(f"   CDM: {self.cdm_name}")
         print(f"   Mode: {'DRY RUN' if dry_run else 'LIVE'}")
         
@@ -86,16 +151,19 @@ class ConfigGenerator(ConfigGeneratorBase):
         ddl_files = config_utils.list_ddl_files(self.cdm_name)
         new_ancillaries = self._auto_discover_new_ancillaries(source_config)
 
-        print(f"\n   Auto-discovered files:")
-        print(f"      Guardrails: {len(guardrails_files)}")
-        print(f"      DDL: {len(ddl_files)}")
         existing_anc = (source_config.get("input_files") or {}).get("ancillary") or []
+        lines = [
+            f"\n   Auto-discovered files:",
+            f"      Guardrails: {len(guardrails_files)}",
+            f"      DDL: {len(ddl_files)}",
+        ]
         if new_ancillaries:
-            print(f"      Ancillary: {len(existing_anc)} existing + {len(new_ancillaries)} new file(s)")
-            for a in new_ancillaries:
-                print(f"         + {a['file']}  (source_id={a['source_id']}, type={a['file_type']})")
+            lines.append(f"      Ancillary: {len(existing_anc)} existing + {len(new_ancillaries)} new file(s)")
+            lines.extend(f"         + {a['file']}  (source_id={a['source_id']}, type={a['file_type']})"
+                         for a in new_ancillaries)
         else:
-            print(f"      Ancillary: {len(existing_anc)} existing, 0 new files")
+            lines.append(f"      Ancillary: {len(existing_anc)} existing, 0 new files")
+        print("\n".join(lines))
         
         # Step 2b: Review processing modes (interactive; skippable).
         # Placed BEFORE AI analysis so mode-aware behavior in downstream
@@ -120,17 +188,26 @@ class ConfigGenerator(ConfigGeneratorBase):
         )
 
         if not skip_ai:
-            # FHIR Analysis
-            if prompt_user_choice("\n   Run FHIR analysis?", default="Y"):
-                fhir_result = self.fhir_gen.run_analysis(source_config, dry_run)
-                if not dry_run and fhir_result:
-                    fhir_result, corrections = self.fhir_gen.validate_and_correct_files(fhir_result)
-
-            # NCPDP Analysis
-            if prompt_user_choice("\n   Run NCPDP analysis?", default="Y"):
-                ncpdp_result = self.ncpdp_gen.run_analysis(source_config, dry_run)
-                if not dry_run and ncpdp_result:
-                    ncpdp_result = self.ncpdp_gen.validate_codes(ncpdp_result)
+            # FHIR + NCPDP + EDW Analysis — ask the questions up front, then
+            # run the (independent, LLM-bound, non-interactive) analyses
+            # concurrently. Each only reads the CDM block of source_config.
+            tasks = []
+            run_fhir = "FHIR" not in skip and prompt_user_choice("\n   Run FHIR analysis?", default="Y")
+            run_ncpdp = "NCPDP" not in skip and prompt_user_choice("\n   Run NCPDP analysis?", default="Y")
+            if run_fhir and run_ncpdp and os.getenv("CDM_BATCH_DETERMINATION", "0") == "1":
+                tasks.append(("FHIR+NCPDP", functools.partial(self._run_batched_determination, source_config, dry_run)))
+            else:
+                if run_fhir:
+                    tasks.append(("FHIR", functools.partial(self._run_fhir_analysis, source_config, dry_run)))
+                if run_ncpdp:
+                    tasks.append(("NCPDP", functools.partial(self._run_ncpdp_analysis, source_config, dry_run)))
+            if prompt_user_choice("\n   Run EDW entity selection?", default="Y"):
+                tasks.append(("EDW", functools.partial(self.edw_gen.run_analysis, source_config, dry_run)))
+            results = self._run_analyses(tasks)
+            results.update(results.pop("FHIR+NCPDP", None) or {})
+            fhir_result = results.get("FHIR")
+            ncpdp_result = results.get("NCPDP")
+            edw_result = results.get("EDW")
 
             # Guardrails Tab Triage — AI decides which sheets to include per file.
             # Per-step selector parallels FHIR / NCPDP / Glue / EDW / Ancillary.
@@ -154,10 +231,6 @@ class ConfigGenerator(ConfigGeneratorBase):
             if prompt_user_choice("\n   Run Glue analysis?", default="Y"):
                 glue_result = self.glue_gen.run_analysis(source_config, dry_run)
 
-            # EDW Analysis
-            if prompt_user_choice("\n   Run EDW entity selection?", default="Y"):
-                edw_result = self.edw_gen.run_analysis(source_config, dry_run)
-
             # Ancillary Analysis
             if prompt_user_choice("\n   Configure ancillary definition sources?", default="Y"):
                 ancillary_result = self.ancillary_gen.run_analysis(source_config, dry_run)
@@ -193,6 +266,103 @@ class ConfigGenerator(ConfigGeneratorBase):
         
         return filepath
     
+    def _run_fhir_analysis(self, source_config: Dict, dry_run: bool) -> Optional[Dict]:
+        """FHIR analysis followed by filename validation/correction."""
+        fhir_result = self.fhir_gen.run_analysis(source_config, dry_run)
+        if not dry_run and fhir_result:
+            fhir_result = self._validate_fhir_result(fhir_result, source_config)
+        return fhir_result
+    
+    def _validate_fhir_result(self, fhir_result: Dict, source_config: Optional[Dict] = None) -> Dict:
+        """Resolve FHIR filenames, correcting only the unresolved ones."""
+        # Resolve against the previous config and the file index first so
+        # only unresolved names go to the validator's correction step
+        previous = self._previous_fhir_paths(source_config) if source_config else None
+        _, missing = self._build_fhir_file_entries(fhir_result, warn_duplicates=False,
+                                                   previous=previous)
+        fhir_result, corrections = self.fhir_gen.validate_and_correct_files(
+            fhir_result, missing=missing
+        )
+        return fhir_result
+    
+    def _run_ncpdp_analysis(self, source_config: Dict, dry_run: bool) -> Optional[Dict]:
+        """NCPDP analysis followed by code validation."""
+        ncpdp_result = self.ncpdp_gen.run_analysis(source_config, dry_run)
+        if not dry_run and ncpdp_result:
+            ncpdp_result = self.ncpdp_gen.validate_codes(ncpdp_result)
+        return ncpdp_result
+    
+    def _run_batched_determination(self, source_config: Dict, dry_run: bool) -> Dict[str, Optional[Dict]]:
+        """FHIR Pass 1 and NCPDP selection in a single LLM request.
+        
+        Both tasks share the CDM context, so one request saves a prefill.
+        Falls back to the separate analyses when no NCPDP standards exist.
+        
+        Args:
+            source_config: Source config with CDM metadata
+            dry_run: If True, build the prompt but don't call LLM
+            
+        Returns:
+            Dict with 'FHIR' and 'NCPDP' results
+        """
+        ncpdp_prompt = self.ncpdp_gen.build_prompt(source_config)
+        if ncpdp_prompt is None:
+            return {
+                "FHIR": self._run_fhir_analysis(source_config, dry_run),
+                "NCPDP": self._run_ncpdp_analysis(source_config, dry_run),
+            }
+        
+        print("\n🤖 FHIR + NCPDP Analysis (batched)")
+        # Each task's system instructions travel inline with its section
+        prompt = _BATCHED_PROMPT_TEMPLATE.format(
+            fhir=f"{self.fhir_gen.SYSTEM_PROMPT}\n\n{self.fhir_gen.build_prompt(source_config)}",
+            ncpdp=f"{self.ncpdp_gen.SYSTEM_PROMPT}\n\n{ncpdp_prompt}",
+        )
+        
+        if dry_run:
+            return {
+                "FHIR": {'fhir_igs': [], 'domain_assessment': {}, '_prompt': prompt},
+                "NCPDP": {
+                    'ncpdp_general_standards': [],
+                    'ncpdp_script_standards': [],
+                    'domain_assessment': {},
+                    '_prompt': prompt
+                },
+            }
+        
+        try:
+            result = self.parse_ai_json_response(self.call_llm(prompt))
+        except Exception as e:
+            print(f"   ❌ Error in batched FHIR + NCPDP analysis: {e}")
+            raise
+        
+        fhir_result = self.fhir_gen.parse_result(result.get('fhir') or {})
+        ncpdp_result = self.ncpdp_gen.parse_result(result.get('ncpdp') or {})
+        return {
+            "FHIR": self._validate_fhir_result(fhir_result) if fhir_result else fhir_result,
+            "NCPDP": self.ncpdp_gen.validate_codes(ncpdp_result) if ncpdp_result else ncpdp_result,
+        }
+    
+    def _run_analyses(self, tasks: List[Tuple[str, Callable[[], Optional[Dict]]]]) -> Dict[str, Optional[Dict]]:
+        """Run independent analyses, concurrently when more than one.
+        
+        LLM calls are I/O bound, so threads overlap the waits. Any failure
+        is re-raised, as it was when the analyses ran inline.
+        
+        Args:
+            tasks: List of (label, zero-arg callable) pairs
+            
+        Returns:
+            Dict mapping label -> analysis result
+        """
+        if len(tasks) <= 1:
+            return {label: fn() for label, fn in tasks}
+        
+        print(f"\n   Running {len(tasks)} analyses in parallel: {', '.join(t[0] for t in tasks)}")
+        with ThreadPoolExecutor(max_workers=len(tasks)) as ex:
+            futures = {label: ex.submit(fn) for label, fn in tasks}
+            return {label: fut.result() for label, fut in futures.items()}
+    
     def _load_source_config(self) -> Optional[Dict]:
         """Load source config file (latest timestamped or base).
         
@@ -204,16 +374,18 @@ class ConfigGenerator(ConfigGeneratorBase):
         # Try latest timestamped first
         latest_path = config_utils.find_latest_config(self.cdm_name)
         
+        # The cached parse is shared; run() mutates the source config, so
+        # hand out a private copy.
         if latest_path:
             print(f"\n   Source config: {latest_path.name}")
-            return config_utils.load_json_file(latest_path)
+            return copy.deepcopy(config_utils.load_json_file_cached(latest_path))
         
         # Try base config
         base_path = config_utils.find_base_config(self.cdm_name)
         
         if base_path:
             print(f"\n   Source config: {base_path.name}")
-            config = config_utils.load_json_file(base_path)
+            config = copy.deepcopy(config_utils.load_json_file_cached(base_path))
             
             # Validate base config has required fields
             errors = self.validate_base_config(config)
@@ -308,7 +480,7 @@ class ConfigGenerator(ConfigGeneratorBase):
             # Prompt for processing_mode, default refiner (matches prior hardcoded value)
             mode_default = "r"
             while True:
-                raw = input(
+                raw = prompt_input(
                     f"     '{filename}' ({file_type}) [f/d/r/m, default {mode_default}]: "
                 ).strip().lower() or mode_default
                 if raw in ("f", "foundational"):
@@ -415,7 +587,7 @@ class ConfigGenerator(ConfigGeneratorBase):
 
         for i, row in enumerate(rows):
             label, current, apply_fn = row
-            raw = input(f"     {label:<{label_width}}  [{current}]: ").strip().lower()
+            raw = prompt_input(f"     {label:<{label_width}}  [{current}]: ").strip().lower()
             if not raw:
                 continue
 
@@ -454,6 +626,12 @@ class ConfigGenerator(ConfigGeneratorBase):
         
         Only updates sections that were analyzed. Preserves all other fields.
         
+        The result is a targeted shallow copy: every subtree this method
+        writes to (input_files, metadata/ai_analysis, output, the ancillary
+        list) is copied, while untouched sections are shared with source_config.
+        source_config itself is never mutated, so it can be merged again
+        (run() merges once for the mapping preview and once for the save).
+        
         Args:
             source_config: Original config (source of truth for unchanged fields)
             fhir_result: FHIR analysis results (or None to preserve)
@@ -465,13 +643,8 @@ class ConfigGenerator(ConfigGeneratorBase):
         Returns:
             Updated config dict
         """
-        # Deep copy source config
-        import copy
-        config = copy.deepcopy(source_config)
-        
-        # Ensure input_files exists
-        if 'input_files' not in config:
-            config['input_files'] = {}
+        now_iso = time.strftime("%Y-%m-%dT%H:%M:%S")
+        source_inputs = source_config.get('input_files') or {}
         
         # ---- Guardrails — sync filenames + preserve any per-file triage state ----
         # The list is allowed to be either plain strings (filename) or
@@ -479,7 +652,7 @@ class ConfigGenerator(ConfigGeneratorBase):
         # Auto-discovery refreshes the FILENAME set from the filesystem,
         # but we preserve any prior object-form metadata for files that
         # are still present.
-        existing_guardrails = (config.get('input_files') or {}).get('guardrails') or []
+        existing_guardrails = source_inputs.get('guardrails') or []
         existing_by_filename: Dict[str, Dict] = {}
         for entry in existing_guardrails:
             if isinstance(entry, dict) and entry.get('file'):
@@ -517,59 +690,62 @@ class ConfigGenerator(ConfigGeneratorBase):
                     overlaid.append(entry)
             new_guardrails = overlaid
 
-        config['input_files']['guardrails'] = new_guardrails
-        config['input_files']['ddl'] = ddl_files
-        
-        # Update FHIR if analyzed
-        if fhir_result:
-            config['input_files']['fhir_igs'] = self._build_fhir_file_entries(fhir_result)
-            # Update metadata
-            if 'metadata' not in config:
-                config['metadata'] = {}
-            if 'ai_analysis' not in config['metadata']:
-                config['metadata']['ai_analysis'] = {}
-            config['metadata']['ai_analysis']['fhir_assessment'] = fhir_result.get('domain_assessment', {})
-        
-        # Update NCPDP if analyzed
-        if ncpdp_result:
-            config['input_files']['ncpdp_general_standards'] = ncpdp_result.get('ncpdp_general_standards', [])
-            config['input_files']['ncpdp_script_standards'] = ncpdp_result.get('ncpdp_script_standards', [])
-            # Update metadata
-            if 'metadata' not in config:
-                config['metadata'] = {}
-            if 'ai_analysis' not in config['metadata']:
-                config['metadata']['ai_analysis'] = {}
-            config['metadata']['ai_analysis']['ncpdp_assessment'] = ncpdp_result.get('domain_assessment', {})
-        
-        # Update Glue if analyzed
-        if glue_result and 'glue' in glue_result:
-            config['input_files']['glue'] = glue_result['glue']
-
-        # Update EDW if analyzed
-        if edw_result and 'edw' in edw_result:
-            config['input_files']['edw'] = edw_result['edw']
-            if edw_result.get('domain_assessment'):
-                if 'metadata' not in config:
-                    config['metadata'] = {}
-                if 'ai_analysis' not in config['metadata']:
-                    config['metadata']['ai_analysis'] = {}
-                config['metadata']['ai_analysis']['edw_assessment'] = edw_result['domain_assessment']
-        
-        # Update Ancillary if analyzed
-        if ancillary_result and 'ancillary' in ancillary_result:
-            config['input_files']['ancillary'] = ancillary_result['ancillary']
+        # Build the result in one pass: new dicts for every subtree written
+        # below, references to source_config for everything else.
+        input_files = {**source_inputs, 'guardrails': new_guardrails, 'ddl': ddl_files}
+        config = {**source_config, 'input_files': input_files}
+        meta = dict(source_config.get('metadata') or {})
+        ai = dict(meta.get('ai_analysis') or {})
+        if 'output' in config:
+            config['output'] = dict(config['output'])
+        
+        # Analysis results — skipped outright when every analysis was
+        # declined (only auto-discovered files and the timestamp change)
+        if any((fhir_result, ncpdp_result, glue_result, edw_result, ancillary_result)):
+            # Update FHIR if analyzed
+            if fhir_result:
+                input_files['fhir_igs'], _ = self._build_fhir_file_entries(
+                    fhir_result, previous=self._previous_fhir_paths(source_config))
+                assess = fhir_result.get('domain_assessment')
+                if assess is not None:
+                    ai['fhir_assessment'] = assess
+            
+            # Update NCPDP if analyzed (keys the result lacks are left as-is)
+            if ncpdp_result:
+                for key in ('ncpdp_general_standards', 'ncpdp_script_standards'):
+                    standards = ncpdp_result.get(key)
+                    if standards is not None:
+                        input_files[key] = standards
+                assess = ncpdp_result.get('domain_assessment')
+                if assess is not None:
+                    ai['ncpdp_assessment'] = assess
+            
+            # Update Glue if analyzed
+            if glue_result and 'glue' in glue_result:
+                input_files['glue'] = glue_result['glue']
+
+            # Update EDW if analyzed
+            if edw_result and 'edw' in edw_result:
+                input_files['edw'] = edw_result['edw']
+                assess = edw_result.get('domain_assessment')
+                if assess:
+                    ai['edw_assessment'] = assess
+            
+            # Update Ancillary if analyzed
+            if ancillary_result and 'ancillary' in ancillary_result:
+                input_files['ancillary'] = ancillary_result['ancillary']
 
         # Append filesystem-only newly-discovered ancillaries (no AI).
         # Skip anything already present so we don't clobber AI-enriched
         # entries from a previous run.
         if new_ancillaries:
-            current = config['input_files'].get('ancillary') or []
+            current = list(input_files.get('ancillary') or [])
             seen_files = {(e.get('file') or '').lower() for e in current}
             for entry in new_ancillaries:
                 if (entry.get('file') or '').lower() not in seen_files:
                     current.append(entry)
                     seen_files.add((entry.get('file') or '').lower())
-            config['input_files']['ancillary'] = current
+            input_files['ancillary'] = current
 
         # Mapping block — replace wholesale when the user reconfigured it
         if mapping_result is not None:
@@ -583,52 +759,95 @@ class ConfigGenerator(ConfigGeneratorBase):
             print(f"   ⚠️  output.directory was missing — setting to: {config['output']['directory']} (will be saved to config)")
         if not config['output'].get('filename'):
             domain = config.get('cdm', {}).get('domain', self.safe_name)
-            safe_domain = domain.replace(' ', '_').replace('/', '_')
-            config['output']['filename'] = f"{safe_domain}_CDM.xlsx"
+            config['output']['filename'] = create_default_output_filename(domain)
             print(f"   ⚠️  output.filename was missing — setting to: {config['output']['filename']} (will be saved to config)")
         
-        # Update metadata timestamp
-        if 'metadata' not in config:
-            config['metadata'] = {}
-        config['metadata']['generated_at'] = datetime.now().isoformat()
-        config['metadata']['generator_version'] = "3.0"
+        # Update metadata (AI assessments + timestamp)
+        if ai or 'ai_analysis' in meta:
+            meta['ai_analysis'] = ai
+        meta['generated_at'] = now_iso
+        meta['generator_version'] = "3.0"
+        config['metadata'] = meta
         
         return config
     
     
 
-    def _build_fhir_file_entries(self, fhir_result: Dict) -> List[Dict]:
-        """Build FHIR file entries with full paths."""
+    def _previous_fhir_paths(self, source_config: Dict) -> Dict[str, str]:
+        """Map filename -> file for previous-config FHIR entries that still exist.
+        
+        Args:
+            source_config: Config the run started from
+            
+        Returns:
+            Dict of filename -> project-relative (or absolute) file path
+        """
+        previous = {}
+        for entry in (source_config.get('input_files') or {}).get('fhir_igs') or []:
+            if not isinstance(entry, dict):
+                continue
+            filename, file = entry.get('filename'), entry.get('file')
+            if filename and file and not file.startswith('NOT_FOUND/'):
+                previous[filename] = file
+        if not previous:
+            return {}
+        present = config_utils.existing_paths(self.project_root / f for f in previous.values())
+        return {name: f for name, f in previous.items() if self.project_root / f in present}
+    
+    def _build_fhir_file_entries(self, fhir_result: Dict, warn_duplicates: bool = True,
+                                 previous: Optional[Dict[str, str]] = None
+                                 ) -> Tuple[List[Dict], List[str]]:
+        """Build FHIR file entries with full paths.
+        
+        Args:
+            fhir_result: FHIR analysis result with fhir_igs list
+            warn_duplicates: Print a warning for names matched more than once
+            previous: Already-resolved filename -> file paths (see
+                _previous_fhir_paths); when every name is covered the
+                FHIR/IG tree is not walked at all
+            
+        Returns:
+            Tuple of (entries, filenames not found in the FHIR/IG tree)
+        """
         entries = []
-        fhir_dir = config_utils.get_standards_fhir_dir()
+        missing = []
+        warnings = []
+        previous = previous or {}
+        fhir_index = None
+        # Resolve each distinct filename once; resources sharing a file
+        # (e.g. a common ValueSet) reuse the result
+        rel_paths: Dict[str, Optional[str]] = {}
         
         for resource in fhir_result.get('fhir_igs', []):
             filename = resource['filename']
-            filepath = config_utils.find_file_recursive(fhir_dir, filename)
+            if filename in previous:
+                rel_paths[filename] = previous[filename]
+            elif filename not in rel_paths:
+                if fhir_index is None:
+                    fhir_index, duplicates = self.fhir_gen.get_file_index()
+                filepath = fhir_index.get(filename)
+                if warn_duplicates and filename in duplicates:
+                    warnings.append(f"   ⚠️  Multiple matches for {filename}, using first")
+                if filepath:
+                    rel_paths[filename] = config_utils.normalize_path(filepath, self.project_root)
+                else:
+                    rel_paths[filename] = None
+                    missing.append(filename)
             
-            if filepath:
-                rel_path = config_utils.normalize_path(filepath, self.project_root)
-                entries.append({
-                    "file": rel_path,
-                    "filename": filename,
-                    "resource_name": resource['resource_name'],
-                    "file_type": resource['file_type'],
-                    "ig_source": resource['ig_source'],
-                    "priority": resource.get('priority', 1),
-                    "reasoning": resource['reasoning']
-                })
-            else:
-                entries.append({
-                    "file": f"NOT_FOUND/{filename}",
-                    "filename": filename,
-                    "resource_name": resource['resource_name'],
-                    "file_type": resource['file_type'],
-                    "ig_source": resource['ig_source'],
-                    "priority": resource.get('priority', 1),
-                    "reasoning": resource['reasoning']
-                })
-        
-        return entries
+            rel_path = rel_paths[filename]
+            entries.append({
+                "file": rel_path if rel_path else f"NOT_FOUND/{filename}",
+                "filename": filename,
+                "resource_name": resource['resource_name'],
+                "file_type": resource['file_type'],
+                "ig_source": resource['ig_source'],
+                "priority": resource.get('priority', 1),
+                "reasoning": resource['reasoning']
+            })
+        
+        if warnings:
+            print("\n".join(warnings))
+        return entries, missing
 
     def _print_summary(self, config: Dict, filepath: Path):
         """Print generation summary.
@@ -639,33 +858,37 @@ class ConfigGenerator(ConfigGeneratorBase):
         """
         input_files = config.get('input_files', {})
         
-        print(f"\n{'='*60}")
-        print(f"✅ Configuration Saved: {filepath.name}")
-        print(f"{'='*60}")
-        
-        print(f"\n📊 Summary:")
-        print(f"   FHIR/IG files: {len(input_files.get('fhir_igs', []))}")
-        print(f"   Guardrails files: {len(input_files.get('guardrails', []))}")
-        print(f"   Glue files: {len(input_files.get('glue', []))}")
-        print(f"   DDL files: {len(input_files.get('ddl', []))}")
-        print(f"   NCPDP General: {len(input_files.get('ncpdp_general_standards', []))}")
-        print(f"   NCPDP SCRIPT: {len(input_files.get('ncpdp_script_standards', []))}")
-        print(f"   EDW entities: {len(input_files.get('edw', []))}")
-        ancillary = input_files.get('ancillary', [])
+        counts = {k: len(input_files.get(k, ())) for k in _SUMMARY_KEYS}
+        lines = [
+            f"\n{_SEP}\n✅ Configuration Saved: {filepath.name}\n{_SEP}",
+            f"\n📊 Summary:",
+            f"   FHIR/IG files: {counts['fhir_igs']}",
+            f"   Guardrails files: {counts['guardrails']}",
+            f"   Glue files: {counts['glue']}",
+            f"   DDL files: {counts['ddl']}",
+            f"   NCPDP General: {counts['ncpdp_general_standards']}",
+            f"   NCPDP SCRIPT: {counts['ncpdp_script_standards']}",
+            f"   EDW entities: {counts['edw']}",
+        ]
+        ancillary = input_files.get('ancillary', ())
         if ancillary:
-            print(f"   Ancillary sources: {len(ancillary)}")
-            for a in ancillary:
-                print(f"      - {a['file']} (type={a['file_type']}, mode={a['processing_mode']})")
+            lines.append(f"   Ancillary sources: {len(ancillary)}")
+            lines.extend(f"      - {a['file']} (type={a['file_type']}, mode={a['processing_mode']})"
+                         for a in ancillary)
         
-        print(f"\n🚀 Next Steps:")
-        print(f"   1. Review config: {filepath}")
-        print(f"   2. Run: python cdm_orchestrator.py {self.cdm_name}")
+        lines += [
+            f"\n🚀 Next Steps:",
+            f"   1. Review config: {filepath}",
+            f"   2. Run: python cdm_orchestrator.py {self.cdm_name}",
+        ]
+        print("\n".join(lines))
 
 
 def main():
     """Entry point for config generator."""
     if len(sys.argv) < 2:
-        print("Usage: python -m src.config.config_generator <cdm_name>")
+        print("Usage: python -m src.config.config_generator <cdm_name> "
+              "[--dry-run|-d] [--no-cache] [--yes|-y] [--no-fhir] [--no-ncpdp]")
         print("\nExamples:")
         print("  python -m src.config.config_generator plan")
         print("  python -m src.config.config_generator formulary")
@@ -675,18 +898,31 @@ def main():
     cdm_name = sys.argv[1]
     
     # Check for dry-run flag
-    dry_run = '--dry-run' in sys.argv or '-d' in sys.argv
+    flags = set(sys.argv[2:])
+    dry_run = bool(flags & {'--dry-run', '-d'})
+    use_cache = '--no-cache' not in flags
+    skip = frozenset(name for flag, name in (('--no-fhir', 'FHIR'), ('--no-ncpdp', 'NCPDP'))
+                     if flag in flags)
+    
+    # Unattended batch runs: accept every prompt's default
+    if flags & {'--yes', '-y'}:
+        set_assume_defaults(True)
     
     try:
         # Import LLM client
         from src.core.llm_client import LLMClient
+        from src.core.llm_cache import CachedLLMClient, LLMResponseCache
         
         llm = None
         if not dry_run:
             llm = LLMClient(timeout=1800)
+            # Re-runs of unchanged prompts are served from .llm_cache/
+            if use_cache:
+                cache_dir = config_utils.get_project_root() / ".llm_cache"
+                llm = CachedLLMClient(llm, LLMResponseCache(cache_dir))
         
         generator = ConfigGenerator(cdm_name, llm_client=llm)
-        generator.run(dry_run=dry_run)
+        generator.run(dry_run=dry_run, skip=skip)
         
     except Exception as e:
         print(f"\n❌ Error: {e}")
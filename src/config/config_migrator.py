@@ -29,6 +29,8 @@ import sys
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+from . import config_utils
+
 
 # Non-ancillary source-type keys that may carry a processing_mode entry.
 _NON_ANCILLARY_TYPES = ("fhir", "ncpdp", "guardrails", "glue", "edw")
@@ -63,8 +65,7 @@ def migrate_config(config_path: Path) -> Tuple[bool, List[str]]:
     if not config_path.exists():
         return False, [f"Config not found: {config_path}"]
 
-    with open(config_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = config_utils.load_json_file(config_path)
 
     changed = False
     messages: List[str] = []
@@ -2,13 +2,49 @@
 Configuration parser for CDM generation application.
 Loads and validates JSON config files.
 """
-import json
+import copy
+import os
+import sys
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Tuple, Union
 from dataclasses import dataclass, field
 
+from . import config_utils
 
-@dataclass
+# Spaces and slashes in a domain name become underscores in output paths
+_PATH_SAFE = str.maketrans(' /', '__')
+
+# __slots__ dataclasses where supported; 3.11+ so frozen slotted instances
+# still deepcopy/pickle (used by the load_config cache)
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 11) else {}
+
+# Parsed configs by absolute path -> (mtime_ns, size, AppConfig)
+_CONFIG_CACHE: Dict[str, Tuple[int, int, "AppConfig"]] = {}
+
+
+def _to_list(value: Any) -> List[Any]:
+    """Coerce an input_files entry to a list: None -> [], scalar -> [scalar]."""
+    if value is None:
+        return []
+    return value if type(value) is list else [value]
+
+
+def _missing_file_errors(groups: List[Tuple[str, List[str]]]) -> List[str]:
+    """Return a "<label> file not found" error for each path that doesn't exist.
+    
+    Paths from every group are checked together, so each parent directory
+    is listed once however many categories reference it. Errors keep the
+    group order, then the path order within each group.
+    
+    Args:
+        groups: (label, paths) pairs
+    """
+    resolved = [(label, p, Path(p)) for label, paths in groups for p in paths]
+    present = config_utils.existing_paths(path for _, _, path in resolved)
+    return [f"{label} file not found: {p}" for label, p, path in resolved if path not in present]
+
+
+@dataclass(frozen=True, **_SLOTS)
 class CDMConfig:
     """CDM metadata"""
     domain: str
@@ -17,14 +53,14 @@ class CDMConfig:
     version: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class OutputConfig:
     """Output configuration"""
     directory: str
     filename: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class MappingConfig:
     """Mapping-tab configuration for Collibra loads.
 
@@ -41,7 +77,7 @@ class MappingConfig:
         return bool(self.mapping_sources)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AppConfig:
     """Complete application configuration"""
     cdm: CDMConfig
@@ -91,31 +127,14 @@ class AppConfig:
         
         # Optionally validate file paths exist
         if check_files:
-            # Check FHIR files
-            for fhir_ig in self.fhir_igs:
-                file_path = fhir_ig.get('file', '')
-                if file_path and not Path(file_path).exists():
-                    errors.append(f"FHIR file not found: {file_path}")
-            
-            # Check guardrails files
-            for gr_file in self.guardrails:
-                if not Path(gr_file).exists():
-                    errors.append(f"Guardrails file not found: {gr_file}")
-            
-            # Check glue files
-            for glue_file in self.glue:
-                if not Path(glue_file).exists():
-                    errors.append(f"Glue file not found: {glue_file}")
-            
-            # Check DDL files
-            for ddl_file in self.ddl:
-                if not Path(ddl_file).exists():
-                    errors.append(f"DDL file not found: {ddl_file}")
-            
-            # Check naming standard files
-            for ns_file in self.naming_standard:
-                if not Path(ns_file).exists():
-                    errors.append(f"Naming standard file not found: {ns_file}")
+            fhir_files = [f for f in (ig.get('file', '') for ig in self.fhir_igs) if f]
+            errors.extend(_missing_file_errors([
+                ("FHIR", fhir_files),
+                ("Guardrails", self.guardrails),
+                ("Glue", self.glue),
+                ("DDL", self.ddl),
+                ("Naming standard", self.naming_standard),
+            ]))
         
         return errors
     
@@ -258,6 +277,11 @@ def load_config(config_path: str) -> AppConfig:
     """
     Load and validate JSON configuration file.
     
+    Parsed configs are cached per file and reused while its mtime and size
+    are unchanged. Callers always get their own copy, and validation
+    re-runs on every call so input files deleted since the first load are
+    still reported.
+    
     Args:
         config_path: Path to JSON config file
         
@@ -271,12 +295,21 @@ def load_config(config_path: str) -> AppConfig:
     """
     config_file = Path(config_path)
     
-    if not config_file.exists():
-        raise FileNotFoundError(f"Config file not found: {config_path}")
+    try:
+        st = os.stat(config_file)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {config_path}") from None
     
-    # Load JSON
-    with open(config_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    cache_key = os.path.abspath(config_file)
+    cached = _CONFIG_CACHE.get(cache_key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        config = copy.deepcopy(cached[2])
+        config.config_path = str(config_path)
+        _raise_if_invalid(config)
+        return config
+    
+    # Load JSON (orjson when installed)
+    data = config_utils.load_json_file(config_file)
     
     # Parse into config objects
     try:
@@ -293,7 +326,7 @@ def load_config(config_path: str) -> AppConfig:
         # Auto-derive output directory from domain if not specified
         output_dir = output_data.get('directory', '')
         if not output_dir:
-            safe_domain = cdm_data['domain'].lower().replace(' ', '_').replace('/', '_')
+            safe_domain = cdm_data['domain'].lower().translate(_PATH_SAFE)
             output_dir = f"output/cdm_{safe_domain}"
         
         output_filename = output_data.get('filename', '')
@@ -321,15 +354,15 @@ def load_config(config_path: str) -> AppConfig:
             output=output_config,
             config_path=str(config_path),
             mapping=mapping_config,
-            fhir_igs=input_files.get('fhir_igs', []),
-            guardrails=input_files.get('guardrails', []),
-            glue=input_files.get('glue', []),
-            ddl=input_files.get('ddl', []),
-            ncpdp_general_standards=input_files.get('ncpdp_general_standards', []),
-            ncpdp_script_standards=input_files.get('ncpdp_script_standards', []),
-            naming_standard=input_files.get('naming_standard', []),
-            edw=input_files.get('edw', []),
-            ancillary=input_files.get('ancillary', []),
+            fhir_igs=_to_list(input_files.get('fhir_igs')),
+            guardrails=_to_list(input_files.get('guardrails')),
+            glue=_to_list(input_files.get('glue')),
+            ddl=_to_list(input_files.get('ddl')),
+            ncpdp_general_standards=_to_list(input_files.get('ncpdp_general_standards')),
+            ncpdp_script_standards=_to_list(input_files.get('ncpdp_script_standards')),
+            naming_standard=_to_list(input_files.get('naming_standard')),
+            edw=_to_list(input_files.get('edw')),
+            ancillary=_to_list(input_files.get('ancillary')),
             processing_modes={
                 k.lower(): str(v).lower()
                 for k, v in (data.get('processing_modes') or {}).items()
@@ -342,16 +375,21 @@ def load_config(config_path: str) -> AppConfig:
     except KeyError as e:
         raise ValueError(f"Missing required config field: {e}")
     
-    # Validate
+    _raise_if_invalid(config)
+    
+    _CONFIG_CACHE[cache_key] = (st.st_mtime_ns, st.st_size, copy.deepcopy(config))
+    return config
+
+
+def _raise_if_invalid(config: AppConfig) -> None:
+    """Raise ValueError listing every validation error, if any."""
     errors = config.validate()
     if errors:
         raise ValueError(f"Config validation failed:\n" + "\n".join(f"  - {e}" for e in errors))
-    
-    return config
 
 
 def create_default_output_filename(domain: str) -> str:
     """Create default output filename from domain name"""
     # Convert "Plan and Benefit" -> "Plan_and_Benefit_CDM.xlsx"
-    safe_name = domain.replace(' ', '_').replace('/', '_')
+    safe_name = domain.translate(_PATH_SAFE)
     return f"{safe_name}_CDM.xlsx"
\ No newline at end of file
@@ -7,37 +7,55 @@ Provides common functions for:
 - File searching
 - Auto-discovery of guardrail and DDL files
 """
+import functools
 import json
+import os
 from pathlib import Path
-from typing import Any, Optional, Dict, List
+from typing import Any, Optional, Dict, Iterable, List
 
+# Optional C-accelerated JSON; stdlib json is used when unavailable
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
+
+@functools.lru_cache(maxsize=256)
 def get_project_root() -> Path:
     """Get project root directory (assumes src/config location)."""
     # This file lives in src/config, so go up 2 levels
     return Path(__file__).parent.parent.parent
 
 
+@functools.lru_cache(maxsize=256)
 def get_input_dir() -> Path:
     """Get input directory path."""
     return get_project_root() / "input"
 
 
+@functools.lru_cache(maxsize=256)
 def get_business_dir() -> Path:
     """Get business input directory path."""
     return get_input_dir() / "business"
 
 
+@functools.lru_cache(maxsize=256)
 def get_standards_fhir_dir() -> Path:
     """Get FHIR/IG standards directory."""
     return get_input_dir() / "strd_fhir_ig"
 
 
+@functools.lru_cache(maxsize=256)
 def get_standards_ncpdp_dir() -> Path:
     """Get NCPDP standards directory."""
     return get_input_dir() / "strd_ncpdp"
 
 
+# Spaces become underscores and '&' becomes 'and' in safe CDM names
+_SAFE_NAME = str.maketrans({' ': '_', '&': 'and'})
+
+
+@functools.lru_cache(maxsize=256)
 def safe_cdm_name(cdm_name: str) -> str:
     """Convert CDM name to safe directory/file format.
     
@@ -45,9 +63,10 @@ def safe_cdm_name(cdm_name: str) -> str:
         'Plan and Benefit' -> 'plan_and_benefit'
         'plan' -> 'plan'
     """
-    return cdm_name.lower().replace(' ', '_').replace('&', 'and')
+    return cdm_name.lower().translate(_SAFE_NAME)
 
 
+@functools.lru_cache(maxsize=256)
 def get_cdm_dir(cdm_name: str) -> Path:
     """Get CDM-specific directory.
     
@@ -61,6 +80,7 @@ def get_cdm_dir(cdm_name: str) -> Path:
     return get_business_dir() / f"cdm_{safe_name}"
 
 
+@functools.lru_cache(maxsize=256)
 def get_config_dir(cdm_name: str) -> Path:
     """Get config directory for a CDM.
     
@@ -114,6 +134,22 @@ def _is_real_file(name: str) -> bool:
     return bool(name) and not name.startswith(("~", "."))
 
 
+def _list_real_files(directory: Path, suffix: str) -> List[str]:
+    """Sorted names of real files in directory ending with suffix.
+
+    Single os.scandir pass; DirEntry caches type info so no per-file stat.
+    Returns an empty list if the directory doesn't exist.
+    """
+    try:
+        with os.scandir(directory) as it:
+            return sorted(
+                e.name for e in it
+                if e.name.endswith(suffix) and _is_real_file(e.name) and e.is_file()
+            )
+    except FileNotFoundError:
+        return []
+
+
 def list_guardrail_files(cdm_name: str) -> List[str]:
     """Auto-discover all guardrail filenames for a CDM.
 
@@ -126,10 +162,7 @@ def list_guardrail_files(cdm_name: str) -> List[str]:
     Returns:
         List of filenames (not full paths)
     """
-    guardrail_dir = get_cdm_dir(cdm_name) / "guardrail"
-    if not guardrail_dir.exists():
-        return []
-    return [f.name for f in sorted(guardrail_dir.glob("*.xlsx")) if _is_real_file(f.name)]
+    return _list_real_files(get_cdm_dir(cdm_name) / "guardrail", ".xlsx")
 
 
 def list_ddl_files(cdm_name: str) -> List[str]:
@@ -144,10 +177,7 @@ def list_ddl_files(cdm_name: str) -> List[str]:
     Returns:
         List of filenames (not full paths)
     """
-    ddl_dir = get_cdm_dir(cdm_name) / "ddl"
-    if not ddl_dir.exists():
-        return []
-    return [f.name for f in sorted(ddl_dir.glob("*.sql")) if _is_real_file(f.name)]
+    return _list_real_files(get_cdm_dir(cdm_name) / "ddl", ".sql")
 
 
 def get_ancillary_dir(cdm_name: str) -> Path:
@@ -221,7 +251,7 @@ def list_edw_entities(cdm_name: str) -> List[str]:
         return []
 
     try:
-        data = load_json_file(index_path)
+        data = load_json_file_cached(index_path)
     except Exception:
         return []
 
@@ -255,22 +285,23 @@ def find_latest_config(cdm_name: str) -> Optional[Path]:
         Path to config file, or None if not found
     """
     config_dir = get_config_dir(cdm_name)
+    if not os.path.isdir(config_dir):
+        return None
+    
     safe_name = safe_cdm_name(cdm_name)
     base_name = f"config_{safe_name}"
     
-    if not config_dir.exists():
-        return None
-    
-    # Find all timestamped configs (newest first)
+    # Newest timestamped config: names embed YYYYMMDD_HHMMSS, so the
+    # greatest path is the latest (single pass, no full sort)
     pattern = f"{base_name}_*.json"
-    timestamped = sorted(config_dir.glob(pattern), reverse=True)
+    latest = max(config_dir.glob(pattern), default=None)
     
-    if timestamped:
-        return timestamped[0]
+    if latest is not None:
+        return latest
     
     # Fall back to base config
     base_config = config_dir / f"{base_name}.json"
-    if base_config.exists():
+    if os.path.isfile(base_config):
         return base_config
     
     return None
@@ -286,15 +317,35 @@ def find_base_config(cdm_name: str) -> Optional[Path]:
         Path to base config file, or None if not found
     """
     config_dir = get_config_dir(cdm_name)
+    if not os.path.isdir(config_dir):
+        return None
+    
     safe_name = safe_cdm_name(cdm_name)
     base_config = config_dir / f"config_{safe_name}.json"
-    
-    if base_config.exists():
+    if os.path.isfile(base_config):
         return base_config
     
     return None
 
 
+def loads_json(data: Any) -> Any:
+    """Parse JSON text or bytes, with orjson when installed.
+    
+    Args:
+        data: JSON document as str or bytes
+        
+    Returns:
+        Parsed JSON data
+        
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON
+            (orjson.JSONDecodeError subclasses it)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def load_json_file(filepath: Path) -> Dict:
     """Load and parse a JSON file.
     
@@ -307,14 +358,18 @@ def load_json_file(filepath: Path) -> Dict:
     Raises:
         FileNotFoundError: If file doesn't exist
         json.JSONDecodeError: If file is not valid JSON
+            (orjson.JSONDecodeError subclasses it)
     """
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    with open(filepath, 'rb') as f:
+        return loads_json(f.read())
 
 
 def save_json_file(filepath: Path, data: Any, indent: int = 2) -> None:
     """Save data to JSON file.
     
+    Always uses stdlib json so saved configs keep json.dump's exact
+    formatting (float repr, NaN/Infinity, big ints, platform newlines).
+    
     Args:
         filepath: Path to save file
         data: Data to serialize (Dict or List)
@@ -325,9 +380,149 @@ def save_json_file(filepath: Path, data: Any, indent: int = 2) -> None:
         json.dump(data, f, indent=indent, ensure_ascii=False)
 
 
+@functools.lru_cache(maxsize=32)
+def _load_json_cached(path_str: str, mtime_ns: int) -> Any:
+    """Parse a JSON file once per (path, mtime) pair."""
+    return load_json_file(Path(path_str))
+
+
+def load_json_file_cached(filepath: Path) -> Any:
+    """Load and parse a JSON file, reusing the previous parse if unchanged.
+    
+    The file's mtime is part of the cache key, so edits are picked up.
+    The returned object is shared between callers and must be treated as
+    read-only; copy it before mutating.
+    
+    Args:
+        filepath: Path to JSON file
+        
+    Returns:
+        Parsed JSON data (shared, read-only)
+        
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        json.JSONDecodeError: If file is not valid JSON
+    """
+    return _load_json_cached(str(filepath), os.stat(filepath).st_mtime_ns)
+
+
+def dumps_json_bytes(data: Any) -> bytes:
+    """Serialize data to UTF-8 JSON bytes with 2-space indent.
+    
+    Uses orjson when installed, otherwise stdlib json. The layout matches
+    json.dumps(indent=2, ensure_ascii=False) but the bytes may differ:
+    orjson writes floats like 1e-7 (not 1e-07) and NaN/Infinity as null.
+    Data orjson cannot encode (e.g. ints over 64 bits) falls back to
+    stdlib json.
+    
+    Args:
+        data: Data to serialize (string keys only)
+        
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:  # orjson.JSONEncodeError subclasses TypeError
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def write_bytes_file(filepath: Path, payload: bytes) -> None:
+    """Write bytes to a file through a raw file descriptor.
+    
+    Skips the text/buffered IO layers; creates parent directories and
+    truncates any existing file.
+    
+    Args:
+        filepath: Path to save file
+        payload: Bytes to write
+    """
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def save_json_fast(filepath: Path, data: Any) -> None:
+    """Save data to JSON file via dumps_json_bytes + write_bytes_file.
+    
+    Args:
+        filepath: Path to save file
+        data: Data to serialize (string keys only)
+    """
+    write_bytes_file(filepath, dumps_json_bytes(data))
+
+
+def build_file_index(base_dir: Path, duplicates: Optional[set] = None) -> Dict[str, Path]:
+    """Index every file under a directory tree by filename.
+    
+    Walks the tree once with os.walk so repeated lookups are dict hits
+    instead of one search per filename. The walk is top-down in the same
+    order as find_file_recursive, so on duplicate filenames the first one
+    encountered wins, as with find_file_recursive. Symlinked directories
+    are not descended into.
+    
+    Args:
+        base_dir: Directory to index
+        duplicates: Optional set that receives filenames seen more than once,
+            so callers can warn only about the names they actually look up
+        
+    Returns:
+        Dict mapping filename -> path (empty if base_dir doesn't exist)
+    """
+    index: Dict[str, Path] = {}
+    for root, _dirs, files in os.walk(base_dir):
+        for name in files:
+            if name not in index:
+                index[name] = Path(root) / name
+            elif duplicates is not None:
+                duplicates.add(name)
+    return index
+
+
+def existing_paths(paths: Iterable[Path]) -> set:
+    """Return the subset of paths that exist, reading each parent directory once.
+    
+    One os.scandir per distinct parent replaces a stat per file. Names not
+    found in a listing fall back to Path.exists(), so case-insensitive
+    filesystems give the same answer as before.
+    
+    Args:
+        paths: Paths to check
+        
+    Returns:
+        Set of the given paths that exist
+    """
+    by_parent: Dict[Path, List[Path]] = {}
+    for path in paths:
+        by_parent.setdefault(path.parent, []).append(path)
+    
+    found = set()
+    for parent, members in by_parent.items():
+        try:
+            with os.scandir(parent) as it:
+                names = {entry.name for entry in it}
+        except OSError:
+            continue
+        for path in members:
+            if path.name in names or path.exists():
+                found.add(path)
+    return found
+
+
 def find_file_recursive(base_dir: Path, filename: str) -> Optional[Path]:
     """Recursively search for exact filename in directory tree.
     
+    Walks top-down with os.walk (same visiting order as Path.rglob) and
+    stops as soon as a second match confirms the name is ambiguous,
+    instead of collecting every match in the tree first.
+    
     Args:
         base_dir: Directory to search
         filename: Exact filename to find
@@ -335,24 +530,27 @@ def find_file_recursive(base_dir: Path, filename: str) -> Optional[Path]:
     Returns:
         Path to file if found (first match), None otherwise
     """
-    if not base_dir.exists():
+    if not os.path.isdir(base_dir):
         return None
     
-    matches = list(base_dir.rglob(filename))
-    
-    if len(matches) == 1:
-        return matches[0]
-    elif len(matches) > 1:
-        # Multiple matches - return first but log warning
-        print(f"   ⚠️  Multiple matches for {filename}, using first")
-        return matches[0]
+    first = None
+    for root, _dirs, files in os.walk(base_dir):
+        if filename in files:
+            if first is not None:
+                # Multiple matches - return first but log warning
+                print(f"   ⚠️  Multiple matches for {filename}, using first")
+                return first
+            first = Path(root) / filename
     
-    return None
+    return first
 
 
 def normalize_path(filepath: Path, project_root: Optional[Path] = None) -> str:
     """Convert absolute path to relative path within project.
     
+    Paths under the root are handled with a string-prefix check; only
+    other paths go through Path.relative_to.
+    
     Args:
         filepath: Path to normalize
         project_root: Project root (defaults to detected root)
@@ -363,6 +561,12 @@ def normalize_path(filepath: Path, project_root: Optional[Path] = None) -> str:
     if project_root is None:
         project_root = get_project_root()
     
+    if isinstance(filepath, Path):
+        s = str(filepath)
+        prefix = os.path.join(str(project_root), "")
+        if s.startswith(prefix):
+            return s[len(prefix):]
+    
     filepath = Path(filepath)
     
     if filepath.is_absolute():
@@ -385,7 +589,7 @@ def list_files_in_dir(directory: Path, pattern: str = "*.json") -> List[Path]:
     Returns:
         List of matching file paths
     """
-    if not directory.exists():
+    if not os.path.isdir(directory):
         return []
     
     return sorted(directory.glob(pattern))
\ No newline at end of file
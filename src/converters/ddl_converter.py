@@ -9,12 +9,20 @@ Supports two SQL dialects:
 Auto-detects dialect from quoting style in the DDL text.
 """
 import json
+import mmap
 import re
+import string
 from pathlib import Path
-from collections import defaultdict
+from typing import Optional
 
+# Optional C-accelerated JSON; stdlib json is used when unavailable
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def convert_ddl_to_json(file_path: str) -> str:
+
+def convert_ddl_to_json(file_path: str, validate: bool = False) -> str:
     """
     Convert DDL to JSON string.
     - JSON files: Pass through as-is
@@ -22,13 +30,16 @@ def convert_ddl_to_json(file_path: str) -> str:
 
     Args:
         file_path: Path to DDL file (.json or .sql)
+        validate: For JSON files, parse the content once to fail fast on
+            invalid JSON (callers that parse the result can skip this)
 
     Returns:
         JSON string representation of DDL schema
 
     Raises:
         FileNotFoundError: If file doesn't exist
-        ValueError: If file format is unsupported
+        ValueError: If file format is unsupported, or validate is set and
+            a JSON file is invalid (json.JSONDecodeError)
     """
     file = Path(file_path)
 
@@ -37,11 +48,14 @@ def convert_ddl_to_json(file_path: str) -> str:
 
     if file.suffix == '.json':
         # JSON - pass through directly
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            # Validate JSON
-            json.loads(content)
-            return content
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        if validate:
+            if orjson is not None:
+                orjson.loads(raw)
+            else:
+                json.loads(raw)
+        return raw.decode('utf-8')
 
     elif file.suffix in ('.sql', '.ddl', '.txt'):
         # SQL - convert to JSON (supports .sql, .ddl, .txt extensions)
@@ -52,28 +66,81 @@ def convert_ddl_to_json(file_path: str) -> str:
 
 
 def _load_ddl_text(file_path: str) -> str:
-    """Load DDL file with encoding fallback."""
-    for enc in ("utf-8", "utf-16", "latin-1"):
+    """Load DDL file with encoding fallback.
+
+    The file is memory-mapped and decoded straight from the mapping, so no
+    heap copy of the raw bytes is held next to the decoded text. A
+    byte-order mark selects the codec directly, otherwise utf-8, utf-16
+    and latin-1 are tried in turn (latin-1 always decodes, so it is the
+    last resort either way). Line endings are normalised to '\\n' as
+    text-mode reads did.
+    """
+    with open(file_path, "rb") as f:
         try:
-            with open(file_path, "r", encoding=enc) as f:
-                return f.read()
-        except (UnicodeDecodeError, UnicodeError):
-            continue
+            raw = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            raw = f.read()
+    try:
+        head = raw[:3]
+        if head.startswith(b"\xef\xbb\xbf"):
+            encodings = ("utf-8-sig", "latin-1")
+        elif head.startswith((b"\xff\xfe", b"\xfe\xff")):
+            encodings = ("utf-16", "latin-1")
+        else:
+            encodings = ("utf-8", "utf-16", "latin-1")
+        for enc in encodings:
+            try:
+                text = str(raw, enc)
+            except UnicodeError:
+                continue
+            if "\r" in text:
+                text = text.replace("\r\n", "\n").replace("\r", "\n")
+            return text
+    finally:
+        if isinstance(raw, mmap.mmap):
+            raw.close()
     raise ValueError(f"Unable to read DDL file with any supported encoding: {file_path}")
 
 
-def _detect_dialect(ddl_text: str) -> str:
+# Keyword-scanning patterns below run without re.I over an upper-cased copy
+# of the DDL (see _upper_aligned), so the engine compares plain characters
+# instead of case-folding each one.
+_BRACKET_TABLE_RE = re.compile(r'CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?\[')
+_QUOTED_TABLE_RE = re.compile(r'CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?"')
+# Bare identifier: CREATE TABLE schema.table  — no [, no "
+_BARE_TABLE_RE = re.compile(r'CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?\w+\s*\.\s*\w+\s*\(')
+
+# Line comments and block comments, stripped in a single pass
+_COMMENT_RE = re.compile(r'--[^\n]*|/\*.*?\*/', re.S)
+
+_ASCII_UPPER = str.maketrans(string.ascii_lowercase, string.ascii_uppercase)
+
+
+def _upper_aligned(ddl_text: str) -> str:
+    """Upper-case DDL text without changing its length.
+
+    Offsets into the result are valid offsets into ddl_text. str.upper()
+    is used when it preserves length; otherwise (e.g. 'ß' -> 'SS') only
+    ASCII letters are upper-cased, which is all the SQL keywords need.
+    """
+    upper = ddl_text.upper()
+    if len(upper) != len(ddl_text):
+        upper = ddl_text.translate(_ASCII_UPPER)
+    return upper
+
+
+def _detect_dialect(ddl_upper: str) -> str:
     """Auto-detect SQL dialect from CREATE TABLE quoting style.
 
+    Args:
+        ddl_upper: Comment-free DDL text, upper-cased (see _upper_aligned)
+
     Returns 'oracle', 'sqlserver', or 'postgres'.
     """
-    bracket_count = len(re.findall(r'CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?\[', ddl_text, re.I))
-    quote_count   = len(re.findall(r'CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?"', ddl_text, re.I))
-    # Bare identifier: CREATE TABLE schema.table  — no [, no "
-    bare_count    = len(re.findall(
-        r'CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?\w+\s*\.\s*\w+\s*\(',
-        ddl_text, re.I,
-    ))
+    bracket_count = len(_BRACKET_TABLE_RE.findall(ddl_upper))
+    quote_count   = len(_QUOTED_TABLE_RE.findall(ddl_upper))
+    bare_count    = len(_BARE_TABLE_RE.findall(ddl_upper))
 
     counts = {"sqlserver": bracket_count, "oracle": quote_count, "postgres": bare_count}
     winner = max(counts, key=counts.get)
@@ -84,27 +151,36 @@ def _detect_dialect(ddl_text: str) -> str:
 
 def _clean_ddl(ddl_text: str) -> str:
     """Strip comments from DDL text."""
-    ddl_text = re.sub(r'--.*', '', ddl_text)
-    ddl_text = re.sub(r'/\*.*?\*/', '', ddl_text, flags=re.S)
-    return ddl_text
+    return _COMMENT_RE.sub('', ddl_text)
 
 
 def _make_empty_ddl_json(file_path: str) -> dict:
     """Create base JSON structure for DDL output."""
     return {
         "source_file": Path(file_path).name,
-        "schemas": defaultdict(lambda: {
-            "tables": defaultdict(lambda: {
-                "columns": [],
-                "primary_key": [],
-                "foreign_keys": {},
-                "description": ""
-            })
-        }),
+        "schemas": {},
         "udts": {}
     }
 
 
+def _get_table(ddl_json: dict, schema: str, table: str) -> dict:
+    """Return the entry for schema.table, creating it (and its schema) on first use."""
+    schemas = ddl_json["schemas"]
+    schema_entry = schemas.get(schema)
+    if schema_entry is None:
+        schema_entry = schemas[schema] = {"tables": {}}
+    tables = schema_entry["tables"]
+    entry = tables.get(table)
+    if entry is None:
+        entry = tables[table] = {
+            "columns": [],
+            "primary_key": [],
+            "foreign_keys": {},
+            "description": ""
+        }
+    return entry
+
+
 # ============================================================================
 # IDENTIFIER HELPERS — normalise both [bracket] and "double-quote" styles
 # ============================================================================
@@ -137,90 +213,216 @@ def _id(match_groups: tuple) -> str:
     return ""
 
 
+# Quoted-or-bare identifier used by the Oracle and PostgreSQL parsers
+_QID = r'(?:"(\w+)"|(\w+))'  # Captures into 2 groups
+
+
+def _qid(groups: tuple) -> str:
+    """Extract identifier from quoted-or-bare pair."""
+    return groups[0] if groups[0] else groups[1] if len(groups) > 1 and groups[1] else ""
+
+
 # ============================================================================
 # SQL SERVER PARSER
 # ============================================================================
 
-def _parse_sqlserver(ddl_text: str, ddl_json: dict) -> None:
-    """Parse SQL Server DDL (bracket-quoted identifiers)."""
+_SS_CREATE_TABLE_RE = re.compile(
+    r"CREATE TABLE \[(\w+)\]\.\[(\w+)\]\(([^)]*)\)\s*(?:ON \[\w+\])?",
+    re.S | re.I)
 
-    create_table_pattern = re.compile(
-        r"CREATE TABLE \[(\w+)\]\.\[(\w+)\]\((.*?)\)\s*(?:ON \[\w+\])?",
-        re.S | re.I)
+_SS_COLUMN_RE = re.compile(
+    r"\[(\w+)\]\s+\[?(\w+(?:\(\d+(?:,\s*\d+)?\))?)\]?([^,]*)(?:,|$)", re.S)
 
-    column_line_pattern = re.compile(
-        r"\[(\w+)\]\s+\[?(\w+(?:\(\d+(?:,\s*\d+)?\))?)\]?(.*?)(?:,|$)", re.S)
+_SS_UDT_RE = re.compile(r"CREATE TYPE \[(\w+)\] FROM (\w+\(\d+\)) NULL;", re.S)
 
-    udt_pattern = re.compile(r"CREATE TYPE \[(\w+)\] FROM (\w+\(\d+\)) NULL;", re.S)
+_SS_PK_RE = re.compile(
+    r"ALTER TABLE\s+\[(\w+)\]\.\[(\w+)\]\s+(?:WITH CHECK\s+)?ADD\s+CONSTRAINT\s+\[(\w+)\]\s+PRIMARY KEY\s+(?:CLUSTERED|NONCLUSTERED)?\s*\(([^)]*)\)",
+    re.S | re.I)
 
-    pk_pattern = re.compile(
-        r"ALTER TABLE\s+\[(\w+)\]\.\[(\w+)\]\s+(?:WITH CHECK\s+)?ADD\s+CONSTRAINT\s+\[(\w+)\]\s+PRIMARY KEY\s+(?:CLUSTERED|NONCLUSTERED)?\s*\((.*?)\)",
-        re.S | re.I)
+_SS_FK_BLOCK_RE = re.compile(
+    r"ALTER TABLE\s+\[(?P<schema>\w+)\]\.\[(?P<table>\w+)\]\s+ADD\s+(?P<constraints>.[^;]*);",
+    re.S | re.I)
 
-    fk_block_pattern = re.compile(
-        r"ALTER TABLE\s+\[(?P<schema>\w+)\]\.\[(?P<table>\w+)\]\s+ADD\s+(?P<constraints>.+?);",
-        re.S | re.I)
+_SS_FK_INNER_RE = re.compile(
+    r"CONSTRAINT\s+\[(?P<constraint>\w+)\]\s+FOREIGN KEY\s*\(\s*\[(?P<col>\w+)\]\s*\)\s+REFERENCES\s+\[(?P<ref_schema>\w+)\]\.\[(?P<ref_table>\w+)\]\s*\(\s*\[(?P<ref_col>\w+)\]\s*\)",
+    re.S | re.I)
 
-    fk_inner_pattern = re.compile(
-        r"CONSTRAINT\s+\[(?P<constraint>\w+)\]\s+FOREIGN KEY\s*\(\s*\[(?P<col>\w+)\]\s*\)\s+REFERENCES\s+\[(?P<ref_schema>\w+)\]\.\[(?P<ref_table>\w+)\]\s*\(\s*\[(?P<ref_col>\w+)\]\s*\)",
-        re.S | re.I)
+_SS_EXTPROP_RE = re.compile(
+    r"EXECUTE\s+\[?sys\]?\.\[?sp_addextendedproperty\]?\s+N?'MS_Description',\s+N?'(.*?)',\s+N?'SCHEMA',\s+\[?(\w+)\]?,\s+N?'TABLE',\s+\[?(\w+)\]?(?:,\s+N?'COLUMN',\s+\[?(\w+)\]?)?",
+    re.S | re.I)
 
-    extprop_pattern = re.compile(
-        r"EXECUTE\s+\[?sys\]?\.\[?sp_addextendedproperty\]?\s+N?'MS_Description',\s+N?'(.*?)',\s+N?'SCHEMA',\s+\[?(\w+)\]?,\s+N?'TABLE',\s+\[?(\w+)\]?(?:,\s+N?'COLUMN',\s+\[?(\w+)\]?)?",
-        re.S | re.I)
 
-    # CREATE TABLEs
-    for schema, table, block in create_table_pattern.findall(ddl_text):
-        for line in block.splitlines():
-            col_match = column_line_pattern.match(line.strip())
-            if col_match:
-                col_name, col_type, extras = col_match.groups()
-                nullable = 'NOT NULL' not in extras.upper()
-                ddl_json["schemas"][schema]["tables"][table]["columns"].append({
-                    "name": col_name,
-                    "type": col_type.strip(),
-                    "nullable": nullable
-                })
-
-    # UDTs
-    for name, base_type in udt_pattern.findall(ddl_text):
-        ddl_json["udts"][name] = {"type": base_type, "nullable": True}
-
-    # PRIMARY KEYS
-    for schema, table, constraint, col_block in pk_pattern.findall(ddl_text):
-        cols = [c.strip("[] \n") for c in col_block.split(',')]
-        ddl_json["schemas"][schema]["tables"][table]["primary_key"] = cols
-
-    # FOREIGN KEYS
-    for match in fk_block_pattern.finditer(ddl_text):
-        schema = match.group("schema")
-        table = match.group("table")
-        constraint_text = match.group("constraints")
-        for fk in fk_inner_pattern.finditer(constraint_text):
-            ddl_json["schemas"][schema]["tables"][table]["foreign_keys"][fk.group("constraint")] = {
-                "column": fk.group("col"),
-                "references": f"{fk.group('ref_schema')}.{fk.group('ref_table')}.{fk.group('ref_col')}"
-            }
+# Leading keywords of every statement the SQL Server parser understands,
+# matched against the upper-cased text. One scan finds them all; the full
+# statement pattern is then matched against the original text only at those
+# positions (a lower-case CREATE TYPE is rejected there by _SS_UDT_RE).
+_SS_STATEMENT_RE = re.compile(
+    r"(?P<create>CREATE TABLE \[)"
+    r"|(?P<udt>CREATE TYPE \[)"
+    r"|(?P<alter>ALTER TABLE\s+\[)"
+    r"|(?P<extprop>EXECUTE\s+\[?SYS\]?\.\[?SP_ADDEXTENDEDPROPERTY)")
+
+
+def _parse_sqlserver(ddl_text: str, ddl_json: dict, ddl_upper: Optional[str] = None) -> None:
+    """Parse SQL Server DDL (bracket-quoted identifiers).
 
-    # EXTENDED PROPERTIES (Descriptions)
-    for match in extprop_pattern.finditer(ddl_text):
+    Statements are found in a single pass. Each statement pattern keeps
+    its own end offset and skips anchors it has already consumed, so the
+    matches are the same as scanning the text once per pattern.
+    Descriptions are applied after the pass, once every column exists.
+    ddl_upper is the _upper_aligned() copy of ddl_text, computed here if
+    not supplied.
+    """
+    if ddl_upper is None:
+        ddl_upper = _upper_aligned(ddl_text)
+    consumed = {"create": 0, "udt": 0, "pk": 0, "fk": 0, "extprop": 0}
+    extprops = []
+
+    for anchor in _SS_STATEMENT_RE.finditer(ddl_upper):
+        kind = anchor.lastgroup
+        pos = anchor.start()
+
+        if kind == "create":
+            # CREATE TABLE
+            if pos < consumed["create"]:
+                continue
+            match = _SS_CREATE_TABLE_RE.match(ddl_text, pos)
+            if not match:
+                continue
+            consumed["create"] = match.end()
+            schema, table, block = match.groups()
+            for line in block.splitlines():
+                col_match = _SS_COLUMN_RE.match(line.strip())
+                if col_match:
+                    col_name, col_type, extras = col_match.groups()
+                    nullable = 'NOT NULL' not in extras.upper()
+                    _get_table(ddl_json, schema, table)["columns"].append({
+                        "name": col_name,
+                        "type": col_type.strip(),
+                        "nullable": nullable
+                    })
+
+        elif kind == "udt":
+            # UDT
+            if pos < consumed["udt"]:
+                continue
+            match = _SS_UDT_RE.match(ddl_text, pos)
+            if match:
+                consumed["udt"] = match.end()
+                name, base_type = match.groups()
+                ddl_json["udts"][name] = {"type": base_type, "nullable": True}
+
+        elif kind == "alter":
+            # PRIMARY KEY
+            if pos >= consumed["pk"]:
+                match = _SS_PK_RE.match(ddl_text, pos)
+                if match:
+                    consumed["pk"] = match.end()
+                    schema, table, constraint, col_block = match.groups()
+                    cols = [c.strip("[] \n") for c in col_block.split(',')]
+                    _get_table(ddl_json, schema, table)["primary_key"] = cols
+
+            # FOREIGN KEYS (an ALTER may add several constraints)
+            if pos >= consumed["fk"]:
+                match = _SS_FK_BLOCK_RE.match(ddl_text, pos)
+                if match:
+                    consumed["fk"] = match.end()
+                    foreign_keys = _get_table(ddl_json, match.group("schema"), match.group("table"))["foreign_keys"]
+                    for fk in _SS_FK_INNER_RE.finditer(match.group("constraints")):
+                        foreign_keys[fk.group("constraint")] = {
+                            "column": fk.group("col"),
+                            "references": f"{fk.group('ref_schema')}.{fk.group('ref_table')}.{fk.group('ref_col')}"
+                        }
+
+        elif pos >= consumed["extprop"]:
+            # EXTENDED PROPERTIES (Descriptions) - applied after the pass
+            match = _SS_EXTPROP_RE.match(ddl_text, pos)
+            if match:
+                consumed["extprop"] = match.end()
+                extprops.append(match)
+
+    for match in extprops:
         description = match.group(1).strip()
         schema = match.group(2)
         table = match.group(3)
         column = match.group(4) if match.group(4) else None
         if column:
-            for col_obj in ddl_json["schemas"][schema]["tables"][table]["columns"]:
+            for col_obj in _get_table(ddl_json, schema, table)["columns"]:
                 if col_obj["name"] == column:
                     col_obj["description"] = description
                     break
         else:
-            ddl_json["schemas"][schema]["tables"][table]["description"] = description
+            _get_table(ddl_json, schema, table)["description"] = description
 
 
 # ============================================================================
 # ORACLE PARSER
 # ============================================================================
 
+# ─── CREATE TABLE ────────────────────────────────────────────
+# Matches: CREATE TABLE "PC2"."ADDENDUM" ( ... )
+# The closing ) is followed by SEGMENT CREATION, PCTFREE, TABLESPACE, or ;
+# We use a non-greedy match that terminates at ) followed by a storage keyword or ;
+_ORACLE_CREATE_TABLE_RE = re.compile(
+    r'CREATE\s+TABLE\s+' + _QID + r'\s*\.\s*' + _QID +
+    r'\s*\(\s*(.*?)\)\s*(?:SEGMENT\s|PCTFREE\s|TABLESPACE\s|ORGANIZATION\s|;)',
+    re.S | re.I
+)
+
+# Column line pattern — handles Oracle types like:
+#   "ADDENDUM_SK" NUMBER NOT NULL ENABLE,
+#   "SPECIFICATION" VARCHAR2(500),
+#   "DAY_SUPPLY_MIN" NUMBER(15,5),
+#   "REC_CREATE_DT" DATE DEFAULT SYSDATE NOT NULL,
+_ORACLE_COLUMN_RE = re.compile(
+    r'"?(\w+)"?\s+'                          # column name (quoted or bare)
+    r'(\w+(?:\([^)]*\))?)'                   # data type with optional precision
+    r'(.*)$',                                 # remainder (constraints, defaults)
+    re.I
+)
+
+# DEFAULT value within a column's trailing text
+_ORACLE_DEFAULT_RE = re.compile(
+    r'DEFAULT\s+(.+?)(?:\s+NOT\s+NULL|\s+NULL|\s+ENABLE|\s*$)', re.I)
+
+# ─── ALTER TABLE ... PRIMARY KEY ─────────────────────────────
+_ORACLE_PK_RE = re.compile(
+    r'ALTER\s+TABLE\s+' + _QID + r'\s*\.\s*' + _QID +
+    r'\s+ADD\s+CONSTRAINT\s+' + _QID +
+    r'\s+PRIMARY\s+KEY\s*\(\s*([^)]*?)\s*\)',
+    re.S | re.I
+)
+
+# ─── Inline CONSTRAINT ... PRIMARY KEY within CREATE TABLE ───
+_ORACLE_INLINE_PK_RE = re.compile(
+    r'CONSTRAINT\s+' + _QID + r'\s+PRIMARY\s+KEY\s*\(\s*([^)]*?)\s*\)',
+    re.S | re.I
+)
+
+# ─── ALTER TABLE ... FOREIGN KEY ... REFERENCES ──────────────
+_ORACLE_FK_RE = re.compile(
+    r'ALTER\s+TABLE\s+' + _QID + r'\s*\.\s*' + _QID +
+    r'\s+ADD\s+CONSTRAINT\s+' + _QID +
+    r'\s+FOREIGN\s+KEY\s*\(\s*' + _QID + r'\s*\)'
+    r'\s+REFERENCES\s+' + _QID + r'\s*\.\s*' + _QID +
+    r'\s*\(\s*' + _QID + r'\s*\)',
+    re.S | re.I
+)
+
+# ─── COMMENT ON TABLE / COLUMN ───────────────────────────────
+_ORACLE_COMMENT_TABLE_RE = re.compile(
+    r"COMMENT\s+ON\s+TABLE\s+" + _QID + r'\s*\.\s*' + _QID +
+    r"\s+IS\s+'((?:[^']|'')*?)'\s*;",
+    re.S | re.I
+)
+_ORACLE_COMMENT_COLUMN_RE = re.compile(
+    r"COMMENT\s+ON\s+COLUMN\s+" + _QID + r'\s*\.\s*' + _QID +
+    r'\s*\.\s*' + _QID +
+    r"\s+IS\s+'((?:[^']|'')*?)'\s*;",
+    re.S | re.I
+)
+
+
 def _parse_oracle(ddl_text: str, ddl_json: dict) -> None:
     """Parse Oracle DDL (double-quoted or bare identifiers).
 
@@ -235,74 +437,8 @@ def _parse_oracle(ddl_text: str, ddl_json: dict) -> None:
       - ALTER TABLE ... ADD CONSTRAINT ... FOREIGN KEY ... REFERENCES
       - COMMENT ON TABLE / COMMENT ON COLUMN
     """
-    # --- Identifier pattern: "quoted" or bare ---
-    _QID = r'(?:"(\w+)"|(\w+))'  # Captures into 2 groups
-
-    def _qid(groups: tuple) -> str:
-        """Extract identifier from quoted-or-bare pair."""
-        return groups[0] if groups[0] else groups[1] if len(groups) > 1 and groups[1] else ""
-
-    # ─── CREATE TABLE ────────────────────────────────────────────
-    # Matches: CREATE TABLE "PC2"."ADDENDUM" ( ... )
-    # The closing ) is followed by SEGMENT CREATION, PCTFREE, TABLESPACE, or ;
-    # We use a non-greedy match that terminates at ) followed by a storage keyword or ;
-    create_table_pattern = re.compile(
-        r'CREATE\s+TABLE\s+' + _QID + r'\s*\.\s*' + _QID +
-        r'\s*\(\s*(.*?)\)\s*(?:SEGMENT\s|PCTFREE\s|TABLESPACE\s|ORGANIZATION\s|;)',
-        re.S | re.I
-    )
-
-    # Column line pattern — handles Oracle types like:
-    #   "ADDENDUM_SK" NUMBER NOT NULL ENABLE,
-    #   "SPECIFICATION" VARCHAR2(500),
-    #   "DAY_SUPPLY_MIN" NUMBER(15,5),
-    #   "REC_CREATE_DT" DATE DEFAULT SYSDATE NOT NULL,
-    oracle_col_pattern = re.compile(
-        r'"?(\w+)"?\s+'                          # column name (quoted or bare)
-        r'(\w+(?:\([^)]*\))?)'                   # data type with optional precision
-        r'(.*?)$',                                # remainder (constraints, defaults)
-        re.I
-    )
-
-    # ─── ALTER TABLE ... PRIMARY KEY ─────────────────────────────
-    oracle_pk_pattern = re.compile(
-        r'ALTER\s+TABLE\s+' + _QID + r'\s*\.\s*' + _QID +
-        r'\s+ADD\s+CONSTRAINT\s+' + _QID +
-        r'\s+PRIMARY\s+KEY\s*\(\s*(.*?)\s*\)',
-        re.S | re.I
-    )
-
-    # ─── Inline CONSTRAINT ... PRIMARY KEY within CREATE TABLE ───
-    inline_pk_pattern = re.compile(
-        r'CONSTRAINT\s+' + _QID + r'\s+PRIMARY\s+KEY\s*\(\s*(.*?)\s*\)',
-        re.S | re.I
-    )
-
-    # ─── ALTER TABLE ... FOREIGN KEY ... REFERENCES ──────────────
-    oracle_fk_pattern = re.compile(
-        r'ALTER\s+TABLE\s+' + _QID + r'\s*\.\s*' + _QID +
-        r'\s+ADD\s+CONSTRAINT\s+' + _QID +
-        r'\s+FOREIGN\s+KEY\s*\(\s*' + _QID + r'\s*\)'
-        r'\s+REFERENCES\s+' + _QID + r'\s*\.\s*' + _QID +
-        r'\s*\(\s*' + _QID + r'\s*\)',
-        re.S | re.I
-    )
-
-    # ─── COMMENT ON TABLE / COLUMN ───────────────────────────────
-    comment_table_pattern = re.compile(
-        r"COMMENT\s+ON\s+TABLE\s+" + _QID + r'\s*\.\s*' + _QID +
-        r"\s+IS\s+'((?:[^']|'')*?)'\s*;",
-        re.S | re.I
-    )
-    comment_column_pattern = re.compile(
-        r"COMMENT\s+ON\s+COLUMN\s+" + _QID + r'\s*\.\s*' + _QID +
-        r'\s*\.\s*' + _QID +
-        r"\s+IS\s+'((?:[^']|'')*?)'\s*;",
-        re.S | re.I
-    )
-
     # === CREATE TABLEs ===
-    for match in create_table_pattern.finditer(ddl_text):
+    for match in _ORACLE_CREATE_TABLE_RE.finditer(ddl_text):
         schema = _qid((match.group(1), match.group(2)))
         table = _qid((match.group(3), match.group(4)))
         block = match.group(5)
@@ -318,7 +454,7 @@ def _parse_oracle(ddl_text: str, ddl_json: dict) -> None:
                 # But still extract inline PK from this block
                 continue
 
-            col_match = oracle_col_pattern.match(stripped)
+            col_match = _ORACLE_COLUMN_RE.match(stripped)
             if col_match:
                 col_name = col_match.group(1)
                 col_type = col_match.group(2).strip()
@@ -335,8 +471,7 @@ def _parse_oracle(ddl_text: str, ddl_json: dict) -> None:
 
                 # Extract DEFAULT value
                 default_value = None
-                default_match = re.search(r'DEFAULT\s+(.+?)(?:\s+NOT\s+NULL|\s+NULL|\s+ENABLE|\s*$)',
-                                          extras, re.I)
+                default_match = _ORACLE_DEFAULT_RE.search(extras)
                 if default_match:
                     default_value = default_match.group(1).strip().rstrip(',')
 
@@ -348,16 +483,16 @@ def _parse_oracle(ddl_text: str, ddl_json: dict) -> None:
                 if default_value:
                     col_entry["default"] = default_value
 
-                ddl_json["schemas"][schema]["tables"][table]["columns"].append(col_entry)
+                _get_table(ddl_json, schema, table)["columns"].append(col_entry)
 
         # Check for inline PK in the CREATE TABLE block
-        for ipk_match in inline_pk_pattern.finditer(block):
+        for ipk_match in _ORACLE_INLINE_PK_RE.finditer(block):
             pk_cols_str = ipk_match.group(3) if ipk_match.group(3) else ipk_match.group(4)
             pk_cols = [_unquote(c.strip()) for c in pk_cols_str.split(',')]
-            ddl_json["schemas"][schema]["tables"][table]["primary_key"] = pk_cols
+            _get_table(ddl_json, schema, table)["primary_key"] = pk_cols
 
     # === ALTER TABLE ... PRIMARY KEY ===
-    for match in oracle_pk_pattern.finditer(ddl_text):
+    for match in _ORACLE_PK_RE.finditer(ddl_text):
         schema = _qid((match.group(1), match.group(2)))
         table = _qid((match.group(3), match.group(4)))
         # constraint name is groups 5,6
@@ -366,10 +501,10 @@ def _parse_oracle(ddl_text: str, ddl_json: dict) -> None:
         # Let's re-extract from the raw match
         pk_cols_raw = match.groups()[-1]  # Last group is the column list
         pk_cols = [_unquote(c.strip()) for c in pk_cols_raw.split(',')]
-        ddl_json["schemas"][schema]["tables"][table]["primary_key"] = pk_cols
+        _get_table(ddl_json, schema, table)["primary_key"] = pk_cols
 
     # === ALTER TABLE ... FOREIGN KEY ===
-    for match in oracle_fk_pattern.finditer(ddl_text):
+    for match in _ORACLE_FK_RE.finditer(ddl_text):
         groups = match.groups()
         # Groups: schema(2), table(2), constraint(2), fk_col(2), ref_schema(2), ref_table(2), ref_col(2) = 14 groups
         schema = _qid((groups[0], groups[1]))
@@ -380,25 +515,25 @@ def _parse_oracle(ddl_text: str, ddl_json: dict) -> None:
         ref_table = _qid((groups[10], groups[11]))
         ref_col = _qid((groups[12], groups[13]))
 
-        ddl_json["schemas"][schema]["tables"][table]["foreign_keys"][constraint] = {
+        _get_table(ddl_json, schema, table)["foreign_keys"][constraint] = {
             "column": fk_col,
             "references": f"{ref_schema}.{ref_table}.{ref_col}"
         }
 
     # === COMMENT ON TABLE ===
-    for match in comment_table_pattern.finditer(ddl_text):
+    for match in _ORACLE_COMMENT_TABLE_RE.finditer(ddl_text):
         schema = _qid((match.group(1), match.group(2)))
         table = _qid((match.group(3), match.group(4)))
         description = match.group(5).replace("''", "'").strip()
-        ddl_json["schemas"][schema]["tables"][table]["description"] = description
+        _get_table(ddl_json, schema, table)["description"] = description
 
     # === COMMENT ON COLUMN ===
-    for match in comment_column_pattern.finditer(ddl_text):
+    for match in _ORACLE_COMMENT_COLUMN_RE.finditer(ddl_text):
         schema = _qid((match.group(1), match.group(2)))
         table = _qid((match.group(3), match.group(4)))
         column = _qid((match.group(5), match.group(6)))
         description = match.group(7).replace("''", "'").strip()
-        for col_obj in ddl_json["schemas"][schema]["tables"][table]["columns"]:
+        for col_obj in _get_table(ddl_json, schema, table)["columns"]:
             if col_obj["name"].upper() == column.upper():
                 col_obj["description"] = description
                 break
@@ -408,6 +543,83 @@ def _parse_oracle(ddl_text: str, ddl_json: dict) -> None:
 # POSTGRESQL PARSER
 # ============================================================================
 
+# --- CREATE TABLE schema.table ( ... );  -------------------------
+_PG_CREATE_TABLE_RE = re.compile(
+    r'CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?' + _QID + r'\s*\.\s*' + _QID +
+    r'\s*\(\s*(.*?)\)\s*;',
+    re.S | re.I,
+)
+
+# --- Column line: name TYPE[(...)] [extras]  ---------------------
+_PG_COLUMN_RE = re.compile(
+    r'"?(\w+)"?\s+'                              # column name
+    r'(\w+(?:\s*\([^)]*\))?)'                    # data type with optional args
+    r'(.*)$',                                    # remainder
+    re.I,
+)
+
+# DEFAULT value within a column's trailing text
+_PG_DEFAULT_RE = re.compile(r'DEFAULT\s+(.+?)(?:\s+NOT\s+NULL|\s+NULL\b|\s*$)', re.I)
+
+# --- Table-level PRIMARY KEY (with or without CONSTRAINT name) ---
+_PG_TABLE_PK_RE = re.compile(
+    r'(?:CONSTRAINT\s+' + _QID + r'\s+)?PRIMARY\s+KEY\s*\(\s*([^)]+)\s*\)',
+    re.S | re.I,
+)
+
+# --- Table-level FOREIGN KEY (with or without CONSTRAINT name) ---
+_PG_TABLE_FK_RE = re.compile(
+    r'(?:CONSTRAINT\s+' + _QID + r'\s+)?FOREIGN\s+KEY\s*\(\s*([^)]+)\s*\)\s+'
+    r'REFERENCES\s+' + _QID + r'(?:\s*\.\s*' + _QID + r')?'
+    r'\s*\(\s*([^)]+)\s*\)',
+    re.S | re.I,
+)
+
+# --- ALTER TABLE ... ADD CONSTRAINT ... PRIMARY KEY (...) -------
+_PG_ALTER_PK_RE = re.compile(
+    r'ALTER\s+TABLE\s+' + _QID + r'\s*\.\s*' + _QID +
+    r'\s+ADD\s+CONSTRAINT\s+' + _QID +
+    r'\s+PRIMARY\s+KEY\s*\(\s*([^)]+)\s*\)',
+    re.S | re.I,
+)
+
+# --- ALTER TABLE ... ADD CONSTRAINT ... FOREIGN KEY ... REFERENCES ---
+_PG_ALTER_FK_RE = re.compile(
+    r'ALTER\s+TABLE\s+' + _QID + r'\s*\.\s*' + _QID +
+    r'\s+ADD\s+CONSTRAINT\s+' + _QID +
+    r'\s+FOREIGN\s+KEY\s*\(\s*' + _QID + r'\s*\)'
+    r'\s+REFERENCES\s+' + _QID + r'\s*\.\s*' + _QID +
+    r'\s*\(\s*' + _QID + r'\s*\)',
+    re.S | re.I,
+)
+
+# --- COMMENT ON TABLE / COLUMN ----------------------------------
+_PG_COMMENT_TABLE_RE = re.compile(
+    r"COMMENT\s+ON\s+TABLE\s+" + _QID + r'\s*\.\s*' + _QID +
+    r"\s+IS\s+'((?:[^']|'')*?)'\s*;",
+    re.S | re.I,
+)
+_PG_COMMENT_COLUMN_RE = re.compile(
+    r"COMMENT\s+ON\s+COLUMN\s+" + _QID + r'\s*\.\s*' + _QID +
+    r'\s*\.\s*' + _QID +
+    r"\s+IS\s+'((?:[^']|'')*?)'\s*;",
+    re.S | re.I,
+)
+
+_PG_NON_COL_KEYWORDS = {
+    "CONSTRAINT", "PRIMARY", "FOREIGN", "UNIQUE", "CHECK",
+    "INDEX", "EXCLUDE", "LIKE",
+}
+
+# --- Inline column-level REFERENCES ------------------------------
+# Matches REFERENCES other(col) OR REFERENCES schema.other(col)
+_PG_INLINE_REF_RE = re.compile(
+    r'REFERENCES\s+' + _QID + r'(?:\s*\.\s*' + _QID + r')?'
+    r'\s*\(\s*' + _QID + r'\s*\)',
+    re.I,
+)
+
+
 def _parse_postgres(ddl_text: str, ddl_json: dict) -> None:
     """Parse PostgreSQL DDL — bare-identifier syntax (no brackets / quotes).
 
@@ -431,89 +643,10 @@ def _parse_postgres(ddl_text: str, ddl_json: dict) -> None:
       - COMMENT ON TABLE schema.table IS '...';
       - COMMENT ON COLUMN schema.table.col IS '...';
     """
-    # Identifier helper — matches "quoted" or bare
-    _QID = r'(?:"(\w+)"|(\w+))'
-
-    def _qid(g):
-        return g[0] if g[0] else g[1] if len(g) > 1 and g[1] else ""
-
-    # --- CREATE TABLE schema.table ( ... );  -------------------------
-    create_table_pattern = re.compile(
-        r'CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?' + _QID + r'\s*\.\s*' + _QID +
-        r'\s*\(\s*(.*?)\)\s*;',
-        re.S | re.I,
-    )
-
-    # --- Column line: name TYPE[(...)] [extras]  ---------------------
-    col_pattern = re.compile(
-        r'"?(\w+)"?\s+'                              # column name
-        r'(\w+(?:\s*\([^)]*\))?)'                    # data type with optional args
-        r'(.*?)$',                                   # remainder
-        re.I,
-    )
-
-    # --- Table-level PRIMARY KEY (with or without CONSTRAINT name) ---
-    table_pk_pattern = re.compile(
-        r'(?:CONSTRAINT\s+' + _QID + r'\s+)?PRIMARY\s+KEY\s*\(\s*([^)]+)\s*\)',
-        re.S | re.I,
-    )
-
-    # --- Table-level FOREIGN KEY (with or without CONSTRAINT name) ---
-    table_fk_pattern = re.compile(
-        r'(?:CONSTRAINT\s+' + _QID + r'\s+)?FOREIGN\s+KEY\s*\(\s*([^)]+)\s*\)\s+'
-        r'REFERENCES\s+' + _QID + r'(?:\s*\.\s*' + _QID + r')?'
-        r'\s*\(\s*([^)]+)\s*\)',
-        re.S | re.I,
-    )
-
-    # --- ALTER TABLE ... ADD CONSTRAINT ... PRIMARY KEY (...) -------
-    alter_pk_pattern = re.compile(
-        r'ALTER\s+TABLE\s+' + _QID + r'\s*\.\s*' + _QID +
-        r'\s+ADD\s+CONSTRAINT\s+' + _QID +
-        r'\s+PRIMARY\s+KEY\s*\(\s*([^)]+)\s*\)',
-        re.S | re.I,
-    )
-
-    # --- ALTER TABLE ... ADD CONSTRAINT ... FOREIGN KEY ... REFERENCES ---
-    alter_fk_pattern = re.compile(
-        r'ALTER\s+TABLE\s+' + _QID + r'\s*\.\s*' + _QID +
-        r'\s+ADD\s+CONSTRAINT\s+' + _QID +
-        r'\s+FOREIGN\s+KEY\s*\(\s*' + _QID + r'\s*\)'
-        r'\s+REFERENCES\s+' + _QID + r'\s*\.\s*' + _QID +
-        r'\s*\(\s*' + _QID + r'\s*\)',
-        re.S | re.I,
-    )
-
-    # --- COMMENT ON TABLE / COLUMN ----------------------------------
-    comment_table_pattern = re.compile(
-        r"COMMENT\s+ON\s+TABLE\s+" + _QID + r'\s*\.\s*' + _QID +
-        r"\s+IS\s+'((?:[^']|'')*?)'\s*;",
-        re.S | re.I,
-    )
-    comment_column_pattern = re.compile(
-        r"COMMENT\s+ON\s+COLUMN\s+" + _QID + r'\s*\.\s*' + _QID +
-        r'\s*\.\s*' + _QID +
-        r"\s+IS\s+'((?:[^']|'')*?)'\s*;",
-        re.S | re.I,
-    )
-
-    _NON_COL_KEYWORDS = {
-        "CONSTRAINT", "PRIMARY", "FOREIGN", "UNIQUE", "CHECK",
-        "INDEX", "EXCLUDE", "LIKE",
-    }
-
-    # --- Inline column-level REFERENCES ------------------------------
-    # Matches REFERENCES other(col) OR REFERENCES schema.other(col)
-    inline_ref_pattern = re.compile(
-        r'REFERENCES\s+' + _QID + r'(?:\s*\.\s*' + _QID + r')?'
-        r'\s*\(\s*' + _QID + r'\s*\)',
-        re.I,
-    )
-
     # ============================================================
     # CREATE TABLE blocks
     # ============================================================
-    for m in create_table_pattern.finditer(ddl_text):
+    for m in _PG_CREATE_TABLE_RE.finditer(ddl_text):
         schema = _qid((m.group(1), m.group(2)))
         table  = _qid((m.group(3), m.group(4)))
         block  = m.group(5)
@@ -524,38 +657,35 @@ def _parse_postgres(ddl_text: str, ddl_json: dict) -> None:
             if not line:
                 continue
             upper = line.upper()
-            if any(upper.startswith(k) for k in _NON_COL_KEYWORDS):
+            if any(upper.startswith(k) for k in _PG_NON_COL_KEYWORDS):
                 continue
 
-            cm = col_pattern.match(line)
+            cm = _PG_COLUMN_RE.match(line)
             if not cm:
                 continue
             col_name, col_type, extras = cm.group(1), cm.group(2).strip(), (cm.group(3) or "")
-            if col_name.upper() in _NON_COL_KEYWORDS:
+            if col_name.upper() in _PG_NON_COL_KEYWORDS:
                 continue
 
             extras_upper = extras.upper()
             nullable = "NOT NULL" not in extras_upper
 
             default_value = None
-            dm = re.search(
-                r'DEFAULT\s+(.+?)(?:\s+NOT\s+NULL|\s+NULL\b|\s*$)',
-                extras, re.I,
-            )
+            dm = _PG_DEFAULT_RE.search(extras)
             if dm:
                 default_value = dm.group(1).strip().rstrip(',')
 
             col_entry = {"name": col_name, "type": col_type, "nullable": nullable}
             if default_value:
                 col_entry["default"] = default_value
-            ddl_json["schemas"][schema]["tables"][table]["columns"].append(col_entry)
+            _get_table(ddl_json, schema, table)["columns"].append(col_entry)
 
             # Inline column-level PRIMARY KEY
-            if "PRIMARY KEY" in extras_upper and not ddl_json["schemas"][schema]["tables"][table].get("primary_key"):
-                ddl_json["schemas"][schema]["tables"][table]["primary_key"] = [col_name]
+            if "PRIMARY KEY" in extras_upper and not _get_table(ddl_json, schema, table).get("primary_key"):
+                _get_table(ddl_json, schema, table)["primary_key"] = [col_name]
 
             # Inline column-level REFERENCES
-            rm = inline_ref_pattern.search(extras)
+            rm = _PG_INLINE_REF_RE.search(extras)
             if rm:
                 g = rm.groups()
                 p1 = _qid((g[0], g[1]))
@@ -566,20 +696,20 @@ def _parse_postgres(ddl_text: str, ddl_json: dict) -> None:
                 else:
                     ref_str = f"{p1}.{refcol}"
                 cname = f"fk_{col_name}"
-                ddl_json["schemas"][schema]["tables"][table]["foreign_keys"][cname] = {
+                _get_table(ddl_json, schema, table)["foreign_keys"][cname] = {
                     "column": col_name,
                     "references": ref_str,
                 }
 
         # Table-level PRIMARY KEY inside the block
-        for pkm in table_pk_pattern.finditer(block):
+        for pkm in _PG_TABLE_PK_RE.finditer(block):
             cols_raw = pkm.group(3) if pkm.group(3) else ""
             cols = [_unquote(c.strip()) for c in cols_raw.split(',') if c.strip()]
             if cols:
-                ddl_json["schemas"][schema]["tables"][table]["primary_key"] = cols
+                _get_table(ddl_json, schema, table)["primary_key"] = cols
 
         # Table-level FOREIGN KEY inside the block
-        for fkm in table_fk_pattern.finditer(block):
+        for fkm in _PG_TABLE_FK_RE.finditer(block):
             g = fkm.groups()
             constraint = _qid((g[0], g[1])) or f"fk_{table}_{(g[2] or '').strip()}"
             fk_col = (g[2] or "").strip()
@@ -590,7 +720,7 @@ def _parse_postgres(ddl_text: str, ddl_json: dict) -> None:
                 ref_str = f"{p1}.{p2}.{ref_col}"
             else:
                 ref_str = f"{p1}.{ref_col}"
-            ddl_json["schemas"][schema]["tables"][table]["foreign_keys"][constraint] = {
+            _get_table(ddl_json, schema, table)["foreign_keys"][constraint] = {
                 "column": fk_col,
                 "references": ref_str,
             }
@@ -598,19 +728,19 @@ def _parse_postgres(ddl_text: str, ddl_json: dict) -> None:
     # ============================================================
     # ALTER TABLE … PRIMARY KEY
     # ============================================================
-    for m in alter_pk_pattern.finditer(ddl_text):
+    for m in _PG_ALTER_PK_RE.finditer(ddl_text):
         g = m.groups()
         schema = _qid((g[0], g[1]))
         table  = _qid((g[2], g[3]))
         cols_raw = g[-1]
         cols = [_unquote(c.strip()) for c in cols_raw.split(',') if c.strip()]
         if cols:
-            ddl_json["schemas"][schema]["tables"][table]["primary_key"] = cols
+            _get_table(ddl_json, schema, table)["primary_key"] = cols
 
     # ============================================================
     # ALTER TABLE … FOREIGN KEY
     # ============================================================
-    for m in alter_fk_pattern.finditer(ddl_text):
+    for m in _PG_ALTER_FK_RE.finditer(ddl_text):
         g = m.groups()
         schema     = _qid((g[0],  g[1]))
         table      = _qid((g[2],  g[3]))
@@ -619,7 +749,7 @@ def _parse_postgres(ddl_text: str, ddl_json: dict) -> None:
         ref_schema = _qid((g[8],  g[9]))
         ref_table  = _qid((g[10], g[11]))
         ref_col    = _qid((g[12], g[13]))
-        ddl_json["schemas"][schema]["tables"][table]["foreign_keys"][constraint] = {
+        _get_table(ddl_json, schema, table)["foreign_keys"][constraint] = {
             "column": fk_col,
             "references": f"{ref_schema}.{ref_table}.{ref_col}",
         }
@@ -627,18 +757,18 @@ def _parse_postgres(ddl_text: str, ddl_json: dict) -> None:
     # ============================================================
     # COMMENT ON TABLE / COLUMN
     # ============================================================
-    for m in comment_table_pattern.finditer(ddl_text):
+    for m in _PG_COMMENT_TABLE_RE.finditer(ddl_text):
         schema = _qid((m.group(1), m.group(2)))
         table  = _qid((m.group(3), m.group(4)))
         desc = m.group(5).replace("''", "'").strip()
-        ddl_json["schemas"][schema]["tables"][table]["description"] = desc
+        _get_table(ddl_json, schema, table)["description"] = desc
 
-    for m in comment_column_pattern.finditer(ddl_text):
+    for m in _PG_COMMENT_COLUMN_RE.finditer(ddl_text):
         schema = _qid((m.group(1), m.group(2)))
         table  = _qid((m.group(3), m.group(4)))
         column = _qid((m.group(5), m.group(6)))
         desc = m.group(7).replace("''", "'").strip()
-        for col_obj in ddl_json["schemas"][schema]["tables"][table]["columns"]:
+        for col_obj in _get_table(ddl_json, schema, table)["columns"]:
             if col_obj["name"].lower() == column.lower():
                 col_obj["description"] = desc
                 break
@@ -658,50 +788,40 @@ def _convert_sql_ddl(file_path: str) -> str:
 
     ddl_json = _make_empty_ddl_json(file_path)
 
-    dialect = _detect_dialect(ddl_text)
+    ddl_upper = _upper_aligned(ddl_text)
+    dialect = _detect_dialect(ddl_upper)
 
     if dialect == "oracle":
         _parse_oracle(ddl_text, ddl_json)
     elif dialect == "postgres":
         _parse_postgres(ddl_text, ddl_json)
     else:
-        _parse_sqlserver(ddl_text, ddl_json)
-
-    # Convert defaultdicts to regular dicts
-    ddl_json = _convert_defaultdict(ddl_json)
-
-    # Remove empty tables (views/other objects that matched the regex but have no columns)
-    for schema_data in ddl_json.get("schemas", {}).values():
-        tables = schema_data.get("tables", {})
-        empty = [name for name, tdata in tables.items() if not tdata.get("columns")]
-        for name in empty:
-            del tables[name]
+        _parse_sqlserver(ddl_text, ddl_json, ddl_upper)
+
+    # Remove empty tables (views/other objects that matched the regex but have
+    # no columns) and count what was parsed, in one pass over the tree
+    total_tables = total_cols = 0
+    for schema_data in ddl_json["schemas"].values():
+        kept = {}
+        for name, tdata in schema_data["tables"].items():
+            n_cols = len(tdata["columns"])
+            if n_cols:
+                kept[name] = tdata
+                total_cols += n_cols
+        schema_data["tables"] = kept
+        total_tables += len(kept)
 
     # Report what was parsed
-    total_tables = sum(
-        len(schema_data.get("tables", {}))
-        for schema_data in ddl_json.get("schemas", {}).values()
-    )
-    total_cols = sum(
-        len(table_data.get("columns", []))
-        for schema_data in ddl_json.get("schemas", {}).values()
-        for table_data in schema_data.get("tables", {}).values()
-    )
     print(f"   DDL converter: {dialect} dialect, {total_tables} tables, {total_cols} columns")
 
+    if orjson is not None:
+        return orjson.dumps(ddl_json, option=orjson.OPT_INDENT_2).decode('utf-8')
     return json.dumps(ddl_json, indent=2)
 
 
-def _convert_defaultdict(obj):
-    """Recursively convert defaultdict to dict"""
-    if isinstance(obj, defaultdict):
-        return {k: _convert_defaultdict(v) for k, v in obj.items()}
-    return obj
-
-
 def extract_tables_from_ddl(ddl_json_str: str):
     """Extract table names from DDL JSON string."""
-    data = json.loads(ddl_json_str)
+    data = orjson.loads(ddl_json_str) if orjson is not None else json.loads(ddl_json_str)
     
     result = {}
     if "schemas" in data:
@@ -5,32 +5,43 @@ FHIR files are already JSON - pass through directly.
 import json
 from pathlib import Path
 
+# Optional C-accelerated JSON; stdlib json is used when unavailable
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def convert_fhir_to_json(file_path: str) -> str:
+
+def convert_fhir_to_json(file_path: str, validate: bool = False) -> str:
     """
     FHIR files are already JSON - just read and return.
     
     Args:
         file_path: Path to FHIR profile JSON file
+        validate: Parse the content once to fail fast on invalid JSON.
+            Off by default since consumers parse the result themselves.
         
     Returns:
         JSON string (file contents as-is)
         
     Raises:
         FileNotFoundError: If file doesn't exist
-        json.JSONDecodeError: If file is not valid JSON
+        json.JSONDecodeError: If validate is set and file is not valid JSON
     """
     file = Path(file_path)
     
     if not file.exists():
         raise FileNotFoundError(f"FHIR file not found: {file_path}")
     
-    # Read and validate it's proper JSON
-    with open(file, 'r', encoding='utf-8') as f:
-        content = f.read()
-        # Validate JSON
-        json.loads(content)
-        return content
+    with open(file, 'rb') as f:
+        raw = f.read()
+    if validate:
+        # Parsers take the raw bytes directly
+        if orjson is not None:
+            orjson.loads(raw)
+        else:
+            json.loads(raw)
+    return raw.decode('utf-8')
 
 
 def extract_fhir_elements(fhir_json_str: str) -> list:
@@ -7,8 +7,91 @@ For actual SQL DDL files, a separate ddl_converter.py will be created in the fut
 """
 import json
 from pathlib import Path
-from collections import defaultdict
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, Tuple
+
+# Optional C-accelerated JSON; stdlib json is used when unavailable
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional typed decoder; keeps only the fields used below instead of the
+# whole catalog tree. Stdlib json is used when unavailable.
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+if msgspec is not None:
+    class _GlueColumn(msgspec.Struct):
+        """Glue column: Name and Type only (other keys ignored)."""
+        Name: Any = None
+        Type: Any = None
+
+    class _GlueStorage(msgspec.Struct):
+        """Glue StorageDescriptor: Columns only."""
+        Columns: List[_GlueColumn] = []
+
+    class _GlueTable(msgspec.Struct):
+        """Glue table definition: Name, DatabaseName and columns only."""
+        Name: Any = None
+        DatabaseName: Any = 'unknown'
+        StorageDescriptor: _GlueStorage = msgspec.field(default_factory=_GlueStorage)
+
+    _GLUE_DECODER = msgspec.json.Decoder(List[_GlueTable])
+
+# Parsed table: (job name, database name, [(column name, column type), ...])
+_GlueEntry = Tuple[Any, Any, List[Tuple[Any, Any]]]
+
+
+def _load_glue_tables(file_path: str) -> List[_GlueEntry]:
+    """
+    Parse a Glue catalog file down to the fields the converter uses.
+    
+    Args:
+        file_path: Path to AWS Glue catalog JSON file
+        
+    Returns:
+        One (Name, DatabaseName, columns) entry per table
+        
+    Raises:
+        ValueError: If file is not valid JSON or not an array of tables
+    """
+    not_array = "Glue catalog JSON must be a non-empty array of table definitions"
+    
+    with open(file_path, 'rb') as f:
+        raw = f.read()
+    
+    if msgspec is not None:
+        try:
+            tables = _GLUE_DECODER.decode(raw)
+        except msgspec.ValidationError as e:
+            raise ValueError(f"{not_array}: {e}")
+        except msgspec.DecodeError as e:
+            raise ValueError(f"Invalid JSON in Glue catalog file: {e}")
+        return [
+            (t.Name, t.DatabaseName, [(c.Name, c.Type) for c in t.StorageDescriptor.Columns])
+            for t in tables
+        ]
+    
+    try:
+        glue_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON in Glue catalog file: {e}")
+    
+    if not isinstance(glue_data, list):
+        raise ValueError(not_array)
+    
+    entries: List[_GlueEntry] = []
+    append = entries.append
+    for table in glue_data:
+        name = table.get('Name')
+        columns = [
+            (col.get('Name'), col.get('Type'))
+            for col in table.get('StorageDescriptor', {}).get('Columns', [])
+        ] if name else []
+        append((name, table.get('DatabaseName', 'unknown'), columns))
+    return entries
 
 
 def convert_glue_to_json(file_path: str) -> str:
@@ -51,53 +134,53 @@ def convert_glue_to_json(file_path: str) -> str:
         raise FileNotFoundError(f"Glue catalog file not found: {file_path}")
     
     # Load and validate JSON
-    with open(file_path, 'r', encoding='utf-8') as f:
-        try:
-            glue_data = json.load(f)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON in Glue catalog file: {e}")
+    glue_tables = _load_glue_tables(file_path)
     
-    if not isinstance(glue_data, list) or len(glue_data) == 0:
+    if len(glue_tables) == 0:
         raise ValueError("Glue catalog JSON must be a non-empty array of table definitions")
     
     # Extract database name (should be same for all tables)
-    database_name = None
-    if glue_data and len(glue_data) > 0:
-        database_name = glue_data[0].get('DatabaseName', 'unknown')
+    database_name = glue_tables[0][1]
     
     # Consolidate columns across all Glue jobs
-    # Key: (column_name, column_type) -> list of glue job names
-    column_sources: Dict[Tuple[str, str], List[str]] = defaultdict(list)
+    # column_name -> column_type -> list of glue job names; nesting by name
+    # avoids building and hashing a (name, type) tuple per column
+    column_sources: Dict[str, Dict[str, List[str]]] = {}
+    get_types = column_sources.get  # bound once for the per-column loop
     
-    for table in glue_data:
-        glue_job_name = table.get('Name')
+    for glue_job_name, _, columns in glue_tables:
         if not glue_job_name:
             continue
-            
-        columns = table.get('StorageDescriptor', {}).get('Columns', [])
         
-        for col in columns:
-            col_name = col.get('Name')
-            col_type = col.get('Type')
-            
+        for col_name, col_type in columns:
             if col_name and col_type:
-                key = (col_name, col_type)
-                column_sources[key].append(glue_job_name)
-    
-    # Build output format - sort by column name for consistency
-    consolidated_columns = []
-    for (col_name, col_type), sources in sorted(column_sources.items()):
-        consolidated_columns.append({
+                types = get_types(col_name)
+                if types is None:
+                    types = column_sources[col_name] = {}
+                sources = types.get(col_type)
+                if sources is None:
+                    types[col_type] = [glue_job_name]
+                else:
+                    sources.append(glue_job_name)
+    
+    # Build output format - sort by column name, then type, for consistency
+    consolidated_columns = [
+        {
             "Name": col_name,
             "Type": col_type,
-            "GJSources": sources
-        })
+            "GJSources": types[col_type]
+        }
+        for col_name, types in sorted(column_sources.items())
+        for col_type in sorted(types)
+    ]
     
     output = {
         "DatabaseName": database_name,
         "Columns": consolidated_columns
     }
     
+    if orjson is not None:
+        return orjson.dumps(output, option=orjson.OPT_INDENT_2).decode('utf-8')
     return json.dumps(output, indent=2)
 
 
@@ -122,7 +205,7 @@ def extract_tables_from_glue(glue_json_str: str) -> Dict[str, List[str]]:
           ]
         }
     """
-    data = json.loads(glue_json_str)
+    data = orjson.loads(glue_json_str) if orjson is not None else json.loads(glue_json_str)
     
     database_name = data.get("DatabaseName", "unknown")
     all_sources = set()
@@ -2,6 +2,7 @@
 Core modules for CDM generation.
 """
 from .llm_client import LLMClient, TokenUsage
+from .llm_cache import LLMResponseCache, CachedLLMClient
 from .model_selector import (
     MODEL_OPTIONS,
     select_model,
@@ -15,6 +16,8 @@ from .json_sanitizer import strip_code_fences, extract_first_json_object, parse_
 __all__ = [
     'LLMClient',
     'TokenUsage',
+    'LLMResponseCache',
+    'CachedLLMClient',
     'MODEL_OPTIONS',
     'select_model',
     'get_model_config',
@@ -0,0 +1,226 @@
+# src/core/llm_cache.py
+"""
+On-disk response cache for LLM chat calls.
+
+Responses are keyed by a SHA-256 of (model, messages, response_format) and
+stored one JSON file per entry, so re-running an unchanged prompt returns
+immediately instead of waiting on the model. Only responses that parse as
+JSON are stored, so a truncated or malformed reply is retried next run.
+"""
+from __future__ import annotations
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from .json_sanitizer import strip_code_fences
+
+# Optional C-accelerated JSON; stdlib json is used when unavailable
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Entries older than this are treated as misses
+DEFAULT_TTL_SECONDS = 30 * 24 * 3600
+
+
+def _is_json_response(content: str) -> bool:
+    """True if content (optionally in a code fence) is one complete JSON value."""
+    try:
+        json.loads(strip_code_fences(content).strip())
+    except ValueError:
+        return False
+    return True
+
+
+class LLMResponseCache:
+    """Directory of cached LLM responses with a time-to-live."""
+
+    def __init__(self, cache_dir: Path, ttl_seconds: int = DEFAULT_TTL_SECONDS):
+        """
+        Initialize response cache.
+
+        Args:
+            cache_dir: Directory holding cache entries (created on first write)
+            ttl_seconds: Maximum entry age in seconds
+        """
+        self.cache_dir = Path(cache_dir)
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def make_key(
+        model: str,
+        messages: List[Dict[str, str]],
+        response_format: Dict[str, Any] | None = None
+    ) -> str:
+        """
+        Build the cache key for a chat request.
+
+        Args:
+            model: Model name
+            messages: Chat messages
+            response_format: Response format specification, if any
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        request = {"model": model, "messages": messages, "response_format": response_format}
+        # Both encoders produce identical compact, key-sorted UTF-8 here
+        if orjson is not None:
+            payload = orjson.dumps(request, option=orjson.OPT_SORT_KEYS)
+        else:
+            payload = json.dumps(
+                request, sort_keys=True, ensure_ascii=False, separators=(",", ":")
+            ).encode("utf-8")
+        return hashlib.sha256(payload).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Response text, or None on miss/expiry/unreadable entry
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                raw = f.read()
+            entry = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - entry.get("created", 0) > self.ttl_seconds:
+            return None
+        return entry.get("content")
+
+    def set(self, key: str, content: str, model: str = "") -> None:
+        """
+        Store a response.
+
+        Write failures are logged and ignored; the cache is best-effort.
+
+        Args:
+            key: Cache key from make_key()
+            content: Response text
+            model: Model name (recorded for inspection only)
+        """
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"created": time.time(), "model": model, "content": content}, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write LLM cache entry: {e}")
+
+
+class CachedLLMClient:
+    """
+    LLMClient wrapper that serves repeated chat requests from an LLMResponseCache.
+
+    Exposes the same chat()/call() interface; every other attribute is
+    delegated to the wrapped client.
+    """
+
+    def __init__(self, client, cache: LLMResponseCache):
+        """
+        Initialize cached client.
+
+        Args:
+            client: LLMClient (or compatible) to wrap
+            cache: Response cache
+        """
+        self.client = client
+        self.cache = cache
+
+    def __getattr__(self, name: str):
+        return getattr(self.client, name)
+
+    def _store(self, key: str, content: str, model: str) -> None:
+        """Cache content only if it is a complete JSON response."""
+        if content and _is_json_response(content):
+            self.cache.set(key, content, model)
+        elif content:
+            logger.info(f"Not caching non-JSON LLM response ({key[:12]})")
+
+    def call(self, prompt: str) -> str:
+        """Simple call method for single prompt (see LLMClient.call)."""
+        messages = [{"role": "user", "content": prompt}]
+        response, _ = self.chat(messages)
+        return response
+
+    def chat_stream(
+        self,
+        messages: List[Dict[str, str]],
+        response_format: Dict[str, Any] | None = None,
+        on_chunk: Callable[[str], None] | None = None
+    ) -> tuple:
+        """
+        Streaming chat completion, served from cache when possible.
+
+        A cache hit is returned whole without invoking on_chunk.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            response_format: Response format specification
+            on_chunk: Optional callback receiving each text delta
+
+        Returns:
+            Tuple of (response_text, token_usage); token_usage is None on a hit
+        """
+        model = getattr(self.client, "model", "")
+        key = self.cache.make_key(model, messages, response_format)
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            print(f"  💾 Using cached LLM response ({key[:12]})")
+            return cached, None
+
+        if hasattr(self.client, "chat_stream"):
+            content, usage = self.client.chat_stream(
+                messages, response_format=response_format, on_chunk=on_chunk
+            )
+        else:
+            content, usage = self.client.chat(messages, response_format=response_format)
+        self._store(key, content, model)
+        return content, usage
+
+    def chat(
+        self,
+        messages: List[Dict[str, str]],
+        response_format: Dict[str, Any] | None = None
+    ) -> tuple:
+        """
+        Chat completion, served from cache when an identical request was seen.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            response_format: Response format specification
+
+        Returns:
+            Tuple of (response_text, token_usage); token_usage is None on a hit
+        """
+        model = getattr(self.client, "model", "")
+        key = self.cache.make_key(model, messages, response_format)
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            print(f"  💾 Using cached LLM response ({key[:12]})")
+            return cached, None
+
+        content, usage = self.client.chat(messages, response_format=response_format)
+        self._store(key, content, model)
+        return content, usage
@@ -5,9 +5,10 @@ Supports OpenAI API and compatible endpoints (Azure, local models).
 """
 from __future__ import annotations
 import os
+import threading
 import time
 import logging
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional
 from dataclasses import dataclass
 from openai import (
     OpenAI,
@@ -101,9 +102,10 @@ class LLMClient:
         self.max_tokens = max_tokens or int(os.getenv("MAX_TOKENS", "4096"))
         self.max_retries = max_retries
         
-        # Track statistics
+        # Track statistics (the client may be shared by worker threads)
         self.total_calls = 0
         self.total_tokens_used = 0
+        self._stats_lock = threading.Lock()
         
         logger.info(
             f"LLM Client initialized: model={self.model}, "
@@ -180,7 +182,9 @@ class LLMClient:
             BadRequestError: For invalid requests (after fallback attempts)
             APIError: For API errors (after retries exhausted)
         """
-        self.total_calls += 1
+        with self._stats_lock:
+            self.total_calls += 1
+            call_number = self.total_calls
         start_time = time.time()
         
         # Build request kwargs
@@ -197,7 +201,7 @@ class LLMClient:
         if response_format:
             kwargs["response_format"] = response_format
         
-        logger.debug(f"LLM call #{self.total_calls}: {len(messages)} messages, {kwargs.get('max_tokens')} max_tokens")
+        logger.debug(f"LLM call #{call_number}: {len(messages)} messages, {kwargs.get('max_tokens')} max_tokens")
         
         # Print start message with timestamp
         start_timestamp = time.strftime("%H:%M:%S")
@@ -257,7 +261,8 @@ class LLMClient:
                 total_tokens=total_tokens
             )
             
-            self.total_tokens_used += total_tokens
+            with self._stats_lock:
+                self.total_tokens_used += total_tokens
             
             logger.debug(
                 f"LLM response: {len(content)} chars, "
@@ -278,6 +283,92 @@ class LLMClient:
         
         return content, token_usage
     
+    @retry(
+        retry=retry_if_exception_type((APIConnectionError, APITimeoutError, InternalServerError)),
+        stop=stop_after_attempt(2),
+        wait=wait_exponential(multiplier=1, min=4, max=10),
+        before_sleep=before_sleep_log(logger, logging.WARNING),
+        reraise=True
+    )
+    def chat_stream(
+        self,
+        messages: List[Dict[str, str]],
+        response_format: Dict[str, Any] | None = None,
+        on_chunk: Callable[[str], None] | None = None
+    ) -> tuple[str, TokenUsage | None]:
+        """
+        Streaming variant of chat().
+        
+        Text deltas are passed to on_chunk as they arrive (e.g. to show
+        progress on long generations); the assembled response is returned
+        exactly as chat() would return it. Endpoints that reject the
+        streaming request fall back to a regular chat() call.
+        
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            response_format: Response format specification (e.g., {"type": "json_object"})
+            on_chunk: Optional callback receiving each text delta
+        
+        Returns:
+            Tuple of (response_text, token_usage)
+        """
+        kwargs: Dict[str, Any] = {
+            "model": self.model,
+            "messages": messages,
+            "stream": True,
+        }
+        if _is_openai_cloud(self.base_url):
+            kwargs["response_format"] = {"type": "json_object"}
+            kwargs["stream_options"] = {"include_usage": True}
+        if response_format:
+            kwargs["response_format"] = response_format
+        
+        try:
+            stream = self.client.chat.completions.create(**kwargs)
+        except BadRequestError as e:
+            logger.warning(f"Streaming request rejected: {e}. Falling back to chat()...")
+            return self.chat(messages, response_format=response_format)
+        
+        with self._stats_lock:
+            self.total_calls += 1
+        start_time = time.time()
+        start_timestamp = time.strftime("%H:%M:%S")
+        print(f"  🤖 [{start_timestamp}] Streaming LLM: {self.model}...")
+        
+        parts: List[str] = []
+        finish_reason = None
+        token_usage = None
+        for chunk in stream:
+            usage_obj = getattr(chunk, "usage", None)
+            if usage_obj:
+                token_usage = TokenUsage(
+                    prompt_tokens=getattr(usage_obj, "prompt_tokens", 0),
+                    completion_tokens=getattr(usage_obj, "completion_tokens", 0),
+                    total_tokens=getattr(usage_obj, "total_tokens", 0)
+                )
+            if not chunk.choices:
+                continue
+            choice = chunk.choices[0]
+            finish_reason = getattr(choice, "finish_reason", None) or finish_reason
+            delta = getattr(choice.delta, "content", None)
+            if delta:
+                parts.append(delta)
+                if on_chunk:
+                    on_chunk(delta)
+        
+        content = "".join(parts)
+        duration = time.time() - start_time
+        end_timestamp = time.strftime("%H:%M:%S")
+        print(f"  ✅ [{end_timestamp}] Completed in {duration:.1f}s")
+        if token_usage:
+            with self._stats_lock:
+                self.total_tokens_used += token_usage.total_tokens
+            print(f"  📊 Tokens: {token_usage.total_tokens:,} ({token_usage.prompt_tokens:,} prompt + {token_usage.completion_tokens:,} completion)")
+        
+        self._log_usage(finish_reason, token_usage)
+        
+        return content, token_usage
+    
     def _log_usage(self, finish_reason: str | None, token_usage: TokenUsage | None):
         """Log usage information to usage log file."""
         try: